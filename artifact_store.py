@@ -0,0 +1,166 @@
+import hashlib
+import importlib
+import marshal
+import os
+import tempfile
+import zlib
+
+from line_record import LINE_FIELDS, Line
+
+# --- Incremental Artifact Store ---
+# Per document, the output of every pipeline stage (raw lines, section spans,
+# contact / edu / rank / skill fields, resume sections) is kept on disk
+# together with a fingerprint of the code and data tables that produced it.
+# Fingerprints are chained: a stage's fingerprint covers its upstream stages,
+# so editing SKILL_DB only invalidates "skill", while editing section_parser
+# invalidates everything built on sections. Documents are stored under their
+# line_cache.cache_key (file hash + extraction settings).
+
+# Bump to invalidate every stored artifact (e.g. when payload shapes change)
+ARTIFACT_VERSION = 2
+
+# Stage -> upstream stages, code it runs ("module" or "module:function"),
+# data tables it reads ("module:NAME", fingerprinted by repr) and the hooks
+# that drop the stage's compiled copy of those tables ("rebuild"). Listed in
+# dependency order.
+STAGES = {
+    "lines": {"deps": (), "code": ("pdf_processor", "link_index", "line_record"), "tables": (), "rebuild": ()},
+    "sections": {"deps": ("lines",), "code": ("section_parser", "section_keyword"),
+                 "tables": ("section_keyword:SECTION_KEYWORDS",),
+                 "rebuild": ("section_parser:reset_keyword_index",)},
+    "contact": {"deps": ("lines",), "code": ("extract_contact",), "tables": (), "rebuild": ()},
+    "edu": {"deps": ("sections",), "code": ("extract_edu", "edu_data", "regex_prefix", "parser:extract_section_fields"),
+            "tables": ("edu_data:DEGREE_PATTERNS", "edu_data:BRANCH_PATTERNS", "edu_data:INSTITUTIONS",
+                       "edu_data:MINOR_PATTERN"),
+            "rebuild": ("extract_edu:reset_edu_classifier",)},
+    "rank": {"deps": ("sections",), "code": ("rank_extract", "rank_data", "parser:extract_section_fields"),
+             "tables": ("rank_data:EXAM_PATTERNS", "rank_data:RANK_INDICATORS"),
+             "rebuild": ("rank_extract:reset_rank_engine",)},
+    "skill": {"deps": ("sections",), "code": ("skill_extract", "skill_data", "regex_prefix", "parser:extract_section_fields"),
+              "tables": ("skill_data:SKILL_DB",),
+              "rebuild": ("skill_extract:reset_skill_matcher",)},
+    "resume": {"deps": ("sections",), "code": ("subsection_parser", "parser:build_resume"), "tables": (), "rebuild": ()}
+}
+
+_MAGIC = b"RAS"
+_FILE_SUFFIX = ".art"
+
+# --- Fingerprints ---
+
+def _resolve(spec):
+    module_name, _, attr = spec.partition(":")
+    module = importlib.import_module(module_name)
+    return getattr(module, attr) if attr else module
+
+def stage_fingerprints(stages=STAGES):
+    """
+    Returns {stage: fingerprint} for the code and tables currently loaded.
+    Compute once per run: it reads the source of every listed module.
+    The extractors' compiled tables are dropped as well, so stages rerun with
+    these fingerprints compile the tables that were fingerprinted. Tables
+    edited in place afterwards are only picked up by the next call.
+    """
+    import inspect
+    fingerprints = {}
+    for name, spec in stages.items():
+        digest = hashlib.sha256(f"v{ARTIFACT_VERSION}|{name}".encode("utf-8"))
+        for dep in spec["deps"]:
+            digest.update(fingerprints[dep].encode("ascii"))
+        for code in spec["code"]:
+            digest.update(code.encode("utf-8"))
+            digest.update(inspect.getsource(_resolve(code)).encode("utf-8"))
+        for table in spec["tables"]:
+            digest.update(table.encode("utf-8"))
+            digest.update(repr(_resolve(table)).encode("utf-8"))
+        for hook in spec["rebuild"]:
+            _resolve(hook)()
+        fingerprints[name] = digest.hexdigest()[:16]
+    return fingerprints
+
+_current_fingerprints = None
+
+def current_fingerprints(refresh=False):
+    """
+    stage_fingerprints() computed once per process. Long-lived processes that
+    edit tables in place pass refresh=True once after the edit.
+    """
+    global _current_fingerprints
+    if _current_fingerprints is None or refresh:
+        _current_fingerprints = stage_fingerprints()
+    return _current_fingerprints
+
+# --- Documents ---
+# A document is {"source": path or None, "backend": line extraction backend,
+#                "stages": {stage: [fingerprint, payload]}}.
+# Payloads are plain marshal-able values: lines as field tuples, spans as tuples.
+
+def new_document(source, backend="layout"):
+    return {"source": source if isinstance(source, str) else None, "backend": backend, "stages": {}}
+
+def get_stage(doc, stage, fingerprints):
+    """Returns the stored payload of stage if its fingerprint is current, else None."""
+    entry = doc["stages"].get(stage)
+    if entry is None or entry[0] != fingerprints[stage]:
+        return None
+    return entry[1]
+
+def put_stage(doc, stage, fingerprints, payload):
+    doc["stages"][stage] = [fingerprints[stage], payload]
+
+def stale_stages(doc, fingerprints):
+    """Stages whose stored output is missing or was produced by other code/tables."""
+    return [stage for stage in fingerprints if get_stage(doc, stage, fingerprints) is None]
+
+def lines_to_payload(lines):
+    return [tuple(l[field] for field in LINE_FIELDS) for l in lines]
+
+def lines_from_payload(rows):
+    return [Line(text, font_size, bold_ratio, font_name, y, x, list(links), column)
+            for text, font_size, bold_ratio, font_name, y, x, links, column in rows]
+
+# --- Storage ---
+
+def _document_path(store_dir, key):
+    # Shard by the first two hex chars to keep directories small
+    return os.path.join(store_dir, key[:2], key + _FILE_SUFFIX)
+
+def load_document(store_dir, key):
+    """Returns the stored document for key, or None if missing, unreadable or from another version."""
+    try:
+        with open(_document_path(store_dir, key), "rb") as f:
+            blob = f.read()
+    except OSError:
+        return None
+
+    header_len = len(_MAGIC) + 2
+    if blob[:len(_MAGIC)] != _MAGIC or blob[len(_MAGIC):header_len] != bytes([ARTIFACT_VERSION, marshal.version]):
+        return None
+    try:
+        return marshal.loads(zlib.decompress(blob[header_len:]))
+    except (ValueError, EOFError, TypeError, zlib.error):
+        return None
+
+def save_document(store_dir, key, doc):
+    """Writes doc atomically under key."""
+    path = _document_path(store_dir, key)
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    blob = _MAGIC + bytes([ARTIFACT_VERSION, marshal.version]) + zlib.compress(marshal.dumps(doc), 6)
+
+    fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(path), suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(blob)
+        os.replace(tmp_path, path)
+    except OSError:
+        try: os.remove(tmp_path)
+        except OSError: pass
+        raise
+
+def iter_document_keys(store_dir):
+    """Yields the key of every stored document."""
+    for shard in sorted(os.scandir(store_dir), key=lambda e: e.name):
+        if not shard.is_dir():
+            continue
+        for entry in sorted(os.scandir(shard.path), key=lambda e: e.name):
+            if entry.name.endswith(_FILE_SUFFIX):
+                yield entry.name[:-len(_FILE_SUFFIX)]
@@ -0,0 +1,269 @@
+import argparse
+import asyncio
+import json
+import logging
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+
+from batch_parser import DEFAULT_TIMEOUT, error_record, init_worker, parse_document
+from parser import EXTRACTORS, parse_name_list
+from pdf_processor import BACKENDS
+
+DEFAULT_CONCURRENCY_PER_WORKER = 2  # jobs admitted per worker: one running, one ready to start
+DEFAULT_POLL_INTERVAL = 1.0  # seconds between directory scans
+
+logger = logging.getLogger(__name__)
+
+# --- Asyncio Ingest Driver ---
+# Pulls jobs from an async source, runs parse_document (PDF extraction and
+# all extractors) in a warm process pool and hands every record to an async
+# sink as soon as it finishes. A semaphore bounds the jobs in flight, so a
+# fast source (e.g. a message queue) is only read as fast as the workers
+# drain it. Jobs are dicts: {"id": ..., "source": path or PDF bytes,
+# "deadline": optional seconds overriding the driver default}. Deadlines are
+# enforced by the worker's alarm, so a job holds its slot until its parse
+# has really stopped. A job that fails outside the parser (a crashed worker,
+# an unpicklable source) still gets an "error" record, and a broken pool
+# the driver created is replaced.
+#
+# Sources are async iterables of jobs; sinks have `async write(record)` and
+# `async close()`. Message queues and object storage plug in the same way as
+# the local stand-ins below.
+
+# --- Sources ---
+
+class QueueSource:
+    """
+    In-memory job queue. Producers call put(); close() ends the stream once
+    the jobs already queued have been handed out.
+    """
+    _CLOSED = object()
+
+    def __init__(self, maxsize=0):
+        self.queue = asyncio.Queue(maxsize)
+
+    async def put(self, job):
+        await self.queue.put(job)
+
+    async def close(self):
+        await self.queue.put(self._CLOSED)
+
+    async def __aiter__(self):
+        while True:
+            job = await self.queue.get()
+            if job is self._CLOSED:
+                return
+            yield job
+
+class DirectoryWatcher:
+    """
+    Yields a job for every PDF that appears in a directory. A file is only
+    picked up once its size and mtime are unchanged across two scans, so
+    half-copied uploads are not parsed. once=True takes the PDFs present at
+    start and stops; otherwise it watches until stop() is called.
+    """
+
+    def __init__(self, directory, poll_interval=DEFAULT_POLL_INTERVAL, once=False):
+        self.directory = directory
+        self.poll_interval = poll_interval
+        self.once = once
+        self.stopped = asyncio.Event()
+
+    def stop(self):
+        self.stopped.set()
+
+    def _scan(self):
+        found = {}
+        with os.scandir(self.directory) as entries:
+            for entry in entries:
+                if entry.name.lower().endswith(".pdf") and entry.is_file():
+                    stat = entry.stat()
+                    found[entry.path] = (stat.st_size, stat.st_mtime_ns)
+        return found
+
+    async def __aiter__(self):
+        if self.once:
+            for path in sorted(await asyncio.to_thread(self._scan)):
+                yield {"id": path, "source": path}
+            return
+
+        pending = {}  # path -> (size, mtime) at the previous scan
+        done = set()
+        while not self.stopped.is_set():
+            found = await asyncio.to_thread(self._scan)
+            for path in sorted(found):
+                if path in done:
+                    continue
+                if pending.get(path) == found[path]:
+                    done.add(path)
+                    del pending[path]
+                    yield {"id": path, "source": path}
+                else:
+                    pending[path] = found[path]
+            # Forget files that were removed so a new file with the same name is picked up
+            done &= found.keys()
+            try:
+                await asyncio.wait_for(self.stopped.wait(), self.poll_interval)
+            except asyncio.TimeoutError:
+                pass
+
+# --- Sinks ---
+
+class JsonlSink:
+    """Appends one JSON line per record; writes run in a thread so the event loop never blocks on disk."""
+
+    def __init__(self, path, mode="w"):
+        self.file = open(path, mode)
+        self.lock = asyncio.Lock()
+
+    def _write(self, line):
+        self.file.write(line)
+        self.file.flush()
+
+    async def write(self, record):
+        line = json.dumps(record) + "\n"
+        async with self.lock:
+            await asyncio.to_thread(self._write, line)
+
+    async def close(self):
+        self.file.close()
+
+class QueueSink:
+    """In-memory sink: records are put on an asyncio.Queue for a consumer to read."""
+
+    def __init__(self, maxsize=0):
+        self.queue = asyncio.Queue(maxsize)
+
+    async def write(self, record):
+        await self.queue.put(record)
+
+    async def close(self):
+        pass
+
+# --- Driver ---
+
+async def _run_job(loop, pool, job, deadline, sink, summary):
+    executor = pool["executor"]
+    start = time.perf_counter()
+    try:
+        record = await loop.run_in_executor(executor, parse_document, job["source"], job.get("deadline", deadline))
+    except Exception as e:
+        record = error_record(job.get("source"), e, time.perf_counter() - start)
+        if isinstance(e, BrokenProcessPool) and pool["own"] and pool["executor"] is executor:
+            # A worker died (e.g. killed for memory); later jobs get a fresh pool
+            logger.warning("Worker pool broke; starting a new one")
+            executor.shutdown(wait=False, cancel_futures=True)
+            pool["executor"] = pool["factory"]()
+    record["job_id"] = job.get("id")
+    summary[record["status"]] += 1
+    try:
+        await sink.write(record)
+    except Exception:
+        logger.exception("Sink failed to write the record of job %r", record["job_id"])
+        summary["sink_errors"] += 1
+
+async def run_pipeline(source, sink, workers=None, concurrency=None, deadline=DEFAULT_TIMEOUT, executor=None,
+                       cache_dir=None, backend="layout", sections=None, extractors=None, artifact_dir=None):
+    """
+    Parses every job from source and writes its record to sink; returns a
+    summary with counts per status once the source is exhausted.
+    concurrency: jobs in flight (running or waiting for a worker), default
+    DEFAULT_CONCURRENCY_PER_WORKER per worker. deadline: seconds per job
+    (0 disables), enforced by the worker's own alarm.
+    executor: an existing process pool whose workers ran batch_parser.init_worker;
+    by default one is created (replaced if it breaks, and shut down) here.
+    Records the sink failed to write are counted in summary["sink_errors"].
+    """
+    workers = workers or os.cpu_count() or 1
+    concurrency = concurrency or workers * DEFAULT_CONCURRENCY_PER_WORKER
+    options = {"timeout": deadline, "cache_dir": cache_dir, "backend": backend, "sections": sections,
+               "extractors": extractors, "artifact_dir": artifact_dir}
+
+    def factory():
+        return ProcessPoolExecutor(max_workers=workers, initializer=init_worker, initargs=(options,))
+
+    pool = {"executor": executor or factory(), "own": executor is None, "factory": factory}
+
+    loop = asyncio.get_running_loop()
+    slots = asyncio.Semaphore(concurrency)
+    summary = {"total": 0, "ok": 0, "empty": 0, "error": 0, "timeout": 0, "sink_errors": 0}
+    tasks = set()
+    start = time.perf_counter()
+
+    def finished(task):
+        tasks.discard(task)
+        slots.release()
+
+    jobs = aiter(source)
+    try:
+        while True:
+            # Backpressure: take the next job only once a slot is free
+            await slots.acquire()
+            try:
+                job = await anext(jobs)
+            except StopAsyncIteration:
+                slots.release()
+                break
+            summary["total"] += 1
+            tasks.add(task := asyncio.create_task(_run_job(loop, pool, job, deadline, sink, summary)))
+            task.add_done_callback(finished)
+        if tasks:
+            await asyncio.gather(*tasks)
+    finally:
+        for task in tasks:
+            task.cancel()
+        if pool["own"]:
+            pool["executor"].shutdown(wait=False, cancel_futures=True)
+        await sink.close()
+
+    summary["seconds"] = round(time.perf_counter() - start, 3)
+    return summary
+
+def main():
+    arg_parser = argparse.ArgumentParser(description="Watch a directory and parse new resume PDFs into a JSONL file.")
+    arg_parser.add_argument("directory", help="Directory to watch for PDFs")
+    arg_parser.add_argument("-o", "--output", default="parsed_resumes.jsonl", help="JSONL output path")
+    arg_parser.add_argument("--once", action="store_true", help="Parse the PDFs already present and exit")
+    arg_parser.add_argument("-j", "--workers", type=int, default=None, help="Worker processes (default: CPU count)")
+    arg_parser.add_argument("--concurrency", type=int, default=None,
+                            help=f"Jobs in flight (default: {DEFAULT_CONCURRENCY_PER_WORKER}x workers)")
+    arg_parser.add_argument("--deadline", type=float, default=DEFAULT_TIMEOUT, help="Per-job deadline in seconds (0 disables)")
+    arg_parser.add_argument("--poll-interval", type=float, default=DEFAULT_POLL_INTERVAL, help="Seconds between scans")
+    arg_parser.add_argument("--cache-dir", default=None, help="Reuse extracted lines from this on-disk cache")
+    arg_parser.add_argument("--artifact-dir", default=None,
+                            help="Store per-stage outputs here and rerun only stages whose code or tables changed")
+    arg_parser.add_argument("--backend", choices=BACKENDS, default="layout", help="Line extraction backend")
+    arg_parser.add_argument("--extractors", default=None,
+                            help=f"Comma-separated extractors to run (default: all of {','.join(EXTRACTORS)})")
+    arg_parser.add_argument("--sections", default=None,
+                            help="Comma-separated section types to keep in 'resume' (default: all, '' for none)")
+    args = arg_parser.parse_args()
+
+    if not os.path.isdir(args.directory):
+        print(f"Error: Directory '{args.directory}' not found.")
+        return
+
+    extractors = parse_name_list(args.extractors)
+    if extractors is not None and not set(extractors).issubset(EXTRACTORS):
+        print(f"Error: --extractors must be a subset of {','.join(EXTRACTORS)}")
+        return
+
+    async def run():
+        watcher = DirectoryWatcher(args.directory, poll_interval=args.poll_interval, once=args.once)
+        return await run_pipeline(watcher, JsonlSink(args.output), workers=args.workers,
+                                  concurrency=args.concurrency, deadline=args.deadline, cache_dir=args.cache_dir,
+                                  backend=args.backend, sections=parse_name_list(args.sections),
+                                  extractors=extractors, artifact_dir=args.artifact_dir)
+
+    print(f"Watching {args.directory}..." if not args.once else f"Processing {args.directory}...")
+    try:
+        summary = asyncio.run(run())
+    except KeyboardInterrupt:
+        return
+    print(f"Done. Results saved to {args.output}")
+    print(json.dumps(summary, indent=2))
+
+if __name__ == "__main__":
+    main()
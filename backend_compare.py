@@ -0,0 +1,99 @@
+import argparse
+import json
+import time
+from collections import Counter
+
+from batch_parser import collect_pdf_paths
+from pdf_processor import extract_lines_from_pdf
+
+def time_backend(pdf_path, backend, repeats):
+    """Returns (best wall time in seconds, lines) over `repeats` runs."""
+    best = None
+    lines = []
+    for _ in range(repeats):
+        start = time.perf_counter()
+        lines = extract_lines_from_pdf(pdf_path, backend=backend)
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return best, lines
+
+def line_agreement(reference, candidate):
+    """
+    Line-level agreement between two extractions of the same document.
+    text: share of lines whose text appears in both (multiset match, order ignored).
+    exact: share of lines that are identical dicts at the same position.
+    """
+    total = max(len(reference), len(candidate))
+    if total == 0:
+        return {"text": 1.0, "exact": 1.0}
+
+    ref_texts = Counter(l["text"] for l in reference)
+    cand_texts = Counter(l["text"] for l in candidate)
+    text_matches = sum((ref_texts & cand_texts).values())
+    exact_matches = sum(1 for a, b in zip(reference, candidate) if a == b)
+
+    return {
+        "text": round(text_matches / total, 4),
+        "exact": round(exact_matches / total, 4)
+    }
+
+def compare_corpus(pdf_paths, repeats=3):
+    """
+    Runs both backends over every document and returns per-document results
+    plus a corpus summary (total speedup and mean agreement).
+    """
+    documents = []
+    for pdf_path in pdf_paths:
+        layout_time, layout_lines = time_backend(pdf_path, "layout", repeats)
+        fast_time, fast_lines = time_backend(pdf_path, "fast", repeats)
+        documents.append({
+            "source": pdf_path,
+            "layout_seconds": round(layout_time, 5),
+            "fast_seconds": round(fast_time, 5),
+            "speedup": round(layout_time / fast_time, 2) if fast_time else None,
+            "layout_lines": len(layout_lines),
+            "fast_lines": len(fast_lines),
+            "agreement": line_agreement(layout_lines, fast_lines)
+        })
+
+    summary = {"documents": len(documents)}
+    if documents:
+        layout_total = sum(d["layout_seconds"] for d in documents)
+        fast_total = sum(d["fast_seconds"] for d in documents)
+        summary.update({
+            "layout_seconds": round(layout_total, 4),
+            "fast_seconds": round(fast_total, 4),
+            "speedup": round(layout_total / fast_total, 2) if fast_total else None,
+            "mean_text_agreement": round(sum(d["agreement"]["text"] for d in documents) / len(documents), 4),
+            "mean_exact_agreement": round(sum(d["agreement"]["exact"] for d in documents) / len(documents), 4)
+        })
+
+    return {"summary": summary, "documents": documents}
+
+def main():
+    arg_parser = argparse.ArgumentParser(description="Compare the layout and fast extraction backends.")
+    arg_parser.add_argument("targets", nargs="+", help="Directories, PDF files, glob patterns or manifest files")
+    arg_parser.add_argument("-r", "--repeats", type=int, default=3, help="Runs per backend (best time is kept)")
+    arg_parser.add_argument("-o", "--output", default=None, help="Also write the full report to this JSON file")
+    args = arg_parser.parse_args()
+
+    pdf_paths = collect_pdf_paths(args.targets)
+    if not pdf_paths:
+        print("Error: No PDF files found.")
+        return
+
+    report = compare_corpus(pdf_paths, repeats=args.repeats)
+
+    for doc in report["documents"]:
+        print(f"{doc['source']}: {doc['speedup']}x faster, "
+              f"text agreement {doc['agreement']['text']:.1%}, exact {doc['agreement']['exact']:.1%}")
+    print("\n--- Summary ---")
+    print(json.dumps(report["summary"], indent=2))
+
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(report, f, indent=4)
+        print(f"Report saved to {args.output}")
+
+if __name__ == "__main__":
+    main()
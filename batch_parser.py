@@ -0,0 +1,329 @@
+import argparse
+import glob
+import json
+import mmap
+import os
+import signal
+import time
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from concurrent.futures.process import BrokenProcessPool
+
+from instrumentation import CAPTURE_MODES
+from parser import EXTRACTORS, check_header_band, parse_name_list, parse_resume, parse_resume_traced
+from pdf_processor import BACKENDS, font_cache_stats
+
+DEFAULT_TIMEOUT = 60  # seconds allowed per document
+PENDING_PER_WORKER = 2  # documents submitted per worker: one running, one ready to start
+
+class DocumentTimeout(BaseException):
+    """
+    Raised inside a worker when a document exceeds its time budget.
+    Derives from BaseException so the broad `except Exception` handlers in the
+    pipeline (e.g. extract_lines_from_pdf) cannot swallow it.
+    """
+
+# --- Input Collection ---
+
+def read_manifest(manifest_path):
+    """
+    Reads a manifest file: one PDF path per line, blank lines and '#' comments ignored.
+    Relative paths are resolved against the manifest's own directory.
+    """
+    base_dir = os.path.dirname(os.path.abspath(manifest_path))
+    paths = []
+    with open(manifest_path, "r") as f:
+        for raw in f:
+            entry = raw.strip()
+            if not entry or entry.startswith("#"):
+                continue
+            paths.append(entry if os.path.isabs(entry) else os.path.join(base_dir, entry))
+    return paths
+
+def collect_pdf_paths(targets):
+    """
+    Expands a list of targets into PDF paths.
+    Each target may be a directory (all *.pdf inside), a manifest file, a PDF, or a glob.
+    """
+    pdf_paths = []
+    for target in targets:
+        if os.path.isdir(target):
+            pdf_paths.extend(sorted(glob.glob(os.path.join(target, "*.pdf"))))
+        elif os.path.isfile(target) and not target.lower().endswith(".pdf"):
+            pdf_paths.extend(read_manifest(target))
+        elif os.path.isfile(target):
+            pdf_paths.append(target)
+        else:
+            pdf_paths.extend(sorted(glob.glob(target, recursive=True)))
+
+    # Drop duplicates while keeping the first occurrence order
+    seen = set()
+    unique = []
+    for path in pdf_paths:
+        if path not in seen:
+            seen.add(path)
+            unique.append(path)
+    return unique
+
+# --- Worker Side ---
+
+# Options every document in a worker is parsed with (see init_worker)
+WORKER_OPTIONS = {
+    "timeout": None,      # seconds per document (None or 0 disables)
+    "use_mmap": False,    # map input files instead of reading them
+    "trace": None,        # None, or parse_resume_traced keyword options
+    # Passed through to parser.parse_resume
+    "cache_dir": None,
+    "backend": "layout",
+    "sections": None,
+    "extractors": None,
+    "header_band": None,
+    "artifact_dir": None
+}
+_PARSE_OPTIONS = ("cache_dir", "backend", "sections", "extractors", "header_band", "artifact_dir")
+
+_worker_options = dict(WORKER_OPTIONS)
+
+def _raise_timeout(signum, frame):
+    raise DocumentTimeout()
+
+def warm_up_pipeline():
+    """
+    Imports pdfminer and every extractor and compiles their pattern tables,
+    which the pipeline otherwise defers to first use (see parser), so a
+    worker's first document is as fast as the ones after it.
+    """
+    from pdf_processor import load_pdfminer
+    from extract_edu import edu_classifier
+    from rank_extract import rank_engine
+    from skill_extract import skill_matcher
+    import subsection_parser  # imported by the subsections stage
+    load_pdfminer()
+    edu_classifier()
+    rank_engine()
+    skill_matcher()
+
+def init_worker(options=None):
+    """
+    Runs once per worker process. Workers are reused across documents, so
+    everything warm_up_pipeline loads here stays warm for every task.
+    options: dict with any of the WORKER_OPTIONS keys; the rest keep their defaults.
+    """
+    global _worker_options
+    options = options or {}
+    unknown = set(options) - set(WORKER_OPTIONS)
+    if unknown:
+        raise ValueError(f"Unknown worker options: {', '.join(sorted(unknown))}")
+    _worker_options = {**WORKER_OPTIONS, **options}
+    # Let the parent handle Ctrl+C; workers are torn down with the pool
+    signal.signal(signal.SIGINT, signal.SIG_IGN)
+    if hasattr(signal, "setitimer"):
+        signal.signal(signal.SIGALRM, _raise_timeout)
+    warm_up_pipeline()
+
+def _run_parser(source):
+    options = {name: _worker_options[name] for name in _PARSE_OPTIONS}
+    if _worker_options["trace"] is None:
+        return parse_resume(source, **options), None
+    return parse_resume_traced(source, **_worker_options["trace"], **options)
+
+def _parse_source(source):
+    """Returns (final_output, trace record or None)."""
+    if _worker_options["use_mmap"] and isinstance(source, str):
+        # Map the file instead of reading it through a buffered file object
+        with open(source, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+            result, trace = _run_parser(mapped)
+        if trace is not None:
+            trace["source"] = source
+        return result, trace
+    return _run_parser(source)
+
+def parse_document(source, timeout=None):
+    """
+    Parses one PDF inside a worker and returns a JSON-serializable record.
+    source is a path or the PDF bytes (e.g. an HTTP upload).
+    timeout: seconds for this document (0 disables), default the worker's.
+    Errors and timeouts are captured in the record so one bad document
+    never takes down the batch.
+    """
+    record = {
+        "source": source if isinstance(source, str) else None,
+        "status": "ok",
+        "error": None,
+        "seconds": None,
+        "result": None,
+        "worker": None
+    }
+    if _worker_options["trace"] is not None:
+        record["trace"] = None
+    if timeout is None:
+        timeout = _worker_options["timeout"]
+    use_alarm = bool(timeout) and hasattr(signal, "setitimer")
+    start = time.perf_counter()
+
+    try:
+        if use_alarm:
+            signal.setitimer(signal.ITIMER_REAL, timeout)
+        result, trace = _parse_source(source)
+        if trace is not None:
+            record["trace"] = trace
+        if result is None:
+            record["status"] = "empty"
+            record["error"] = "No text extracted from PDF."
+        else:
+            record["result"] = result
+    except DocumentTimeout:
+        record["status"] = "timeout"
+        record["error"] = f"Exceeded {timeout}s timeout"
+    except Exception as e:
+        record["status"] = "error"
+        record["error"] = f"{type(e).__name__}: {e}"
+    finally:
+        if use_alarm:
+            signal.setitimer(signal.ITIMER_REAL, 0)
+
+    record["seconds"] = round(time.perf_counter() - start, 4)
+    # Cumulative per-worker cache counters; the driver keeps the latest per pid
+    record["worker"] = {"pid": os.getpid(), "font_cache": font_cache_stats()}
+    return record
+
+def error_record(source, error, seconds):
+    """A parse_document-shaped "error" record for a document that failed outside the parser (e.g. a dead worker)."""
+    return {
+        "source": source if isinstance(source, str) else None,
+        "status": "error",
+        "error": f"{type(error).__name__}: {error}",
+        "seconds": round(seconds, 4),
+        "result": None,
+        "worker": None
+    }
+
+# --- Driver ---
+
+def run_batch(pdf_paths, output_path, workers=None, timeout=DEFAULT_TIMEOUT, max_tasks_per_child=None,
+              cache_dir=None, backend="layout", use_mmap=False, sections=None, extractors=None,
+              header_band=None, trace=None, artifact_dir=None):
+    """
+    Fans documents out over a process pool and streams one JSON line per
+    document to output_path as soon as it finishes (completion order).
+    Returns a summary dict with counts per status.
+    sections / extractors / header_band are passed to parser.parse_resume for every document.
+    trace (parse_resume_traced options, e.g. {"capture": "cprofile"}) adds a
+    per-document "trace" record with stage timings.
+    artifact_dir keeps every stage output so later runs only redo stages whose
+    code or data tables changed (see artifact_store).
+    If a worker dies (e.g. killed for memory), the documents in flight at that
+    moment get "error" records and the rest run in a new pool.
+    """
+    workers = workers or os.cpu_count() or 1
+    summary = {"total": len(pdf_paths), "ok": 0, "empty": 0, "error": 0, "timeout": 0}
+    worker_font_caches = {}
+    start = time.perf_counter()
+
+    options = {"timeout": timeout, "cache_dir": cache_dir, "backend": backend, "use_mmap": use_mmap,
+               "sections": sections, "extractors": extractors, "header_band": header_band, "trace": trace,
+               "artifact_dir": artifact_dir}
+
+    def new_pool():
+        return ProcessPoolExecutor(max_workers=workers, initializer=init_worker, initargs=(options,),
+                                   max_tasks_per_child=max_tasks_per_child)
+
+    # Only a few documents per worker are submitted at a time, so a broken
+    # pool fails those and not every document still waiting
+    remaining = iter(pdf_paths)
+    in_flight = {}  # future -> (path, submit time, executor)
+    pool = new_pool()
+    try:
+        with open(output_path, "w") as sink:
+            while True:
+                while len(in_flight) < workers * PENDING_PER_WORKER:
+                    path = next(remaining, None)
+                    if path is None:
+                        break
+                    in_flight[pool.submit(parse_document, path)] = (path, time.perf_counter(), pool)
+                if not in_flight:
+                    break
+
+                done, _ = wait(in_flight, return_when=FIRST_COMPLETED)
+                for future in done:
+                    path, submitted, executor = in_flight.pop(future)
+                    try:
+                        record = future.result()
+                    except Exception as e:
+                        record = error_record(path, e, time.perf_counter() - submitted)
+                        if isinstance(e, BrokenProcessPool) and executor is pool:
+                            pool.shutdown(wait=False, cancel_futures=True)
+                            pool = new_pool()
+                    sink.write(json.dumps(record) + "\n")
+                    sink.flush()
+                    summary[record["status"]] += 1
+                    if record["worker"] is not None:
+                        worker_font_caches[record["worker"]["pid"]] = record["worker"]["font_cache"]
+    finally:
+        # An interrupted batch drops its queued documents instead of waiting for them
+        pool.shutdown(wait=not in_flight, cancel_futures=True)
+
+    summary["seconds"] = round(time.perf_counter() - start, 3)
+    summary["font_cache"] = {
+        "hits": sum(s["hits"] for s in worker_font_caches.values()),
+        "misses": sum(s["misses"] for s in worker_font_caches.values())
+    }
+    return summary
+
+def main():
+    arg_parser = argparse.ArgumentParser(description="Parse many resume PDFs in parallel into a JSONL file.")
+    arg_parser.add_argument("targets", nargs="+", help="Directories, PDF files, glob patterns or manifest files")
+    arg_parser.add_argument("-o", "--output", default="parsed_resumes.jsonl", help="JSONL output path")
+    arg_parser.add_argument("-j", "--workers", type=int, default=None, help="Worker processes (default: CPU count)")
+    arg_parser.add_argument("--timeout", type=float, default=DEFAULT_TIMEOUT, help="Per-document timeout in seconds (0 disables)")
+    arg_parser.add_argument("--max-tasks-per-child", type=int, default=None, help="Recycle workers after this many documents")
+    arg_parser.add_argument("--cache-dir", default=None, help="Reuse extracted lines from this on-disk cache")
+    arg_parser.add_argument("--artifact-dir", default=None,
+                            help="Store per-stage outputs here and rerun only stages whose code or tables changed")
+    arg_parser.add_argument("--backend", choices=BACKENDS, default="layout", help="Line extraction backend")
+    arg_parser.add_argument("--mmap", action="store_true", help="Memory-map input files instead of reading them")
+    arg_parser.add_argument("--extractors", default=None,
+                            help=f"Comma-separated extractors to run (default: all of {','.join(EXTRACTORS)})")
+    arg_parser.add_argument("--sections", default=None,
+                            help="Comma-separated section types to keep in 'resume' (default: all, '' for none)")
+    arg_parser.add_argument("--header-band", type=float, default=None,
+                            help="Contact-only runs: lay out just this top share of page 1 (e.g. 0.3)")
+    arg_parser.add_argument("--trace", action="store_true", help="Add per-stage timings and counters to each record")
+    arg_parser.add_argument("--trace-regex", action="store_true", help="Also count regex calls per stage (slower)")
+    arg_parser.add_argument("--capture", choices=CAPTURE_MODES, default=None,
+                            help="Re-run slow documents under cProfile or tracemalloc (implies --trace)")
+    arg_parser.add_argument("--capture-threshold", type=float, default=None,
+                            help="Seconds a document must take to be captured (default: always)")
+    args = arg_parser.parse_args()
+
+    trace = None
+    if args.trace or args.trace_regex or args.capture:
+        trace = {"count_regex": args.trace_regex, "capture": args.capture,
+                 "capture_threshold": args.capture_threshold}
+
+    extractors = parse_name_list(args.extractors)
+    if extractors is not None and not set(extractors).issubset(EXTRACTORS):
+        print(f"Error: --extractors must be a subset of {','.join(EXTRACTORS)}")
+        return
+    try:
+        check_header_band(args.header_band, parse_name_list(args.sections), extractors)
+    except ValueError as e:
+        print(f"Error: --header-band: {e}")
+        return
+
+    pdf_paths = collect_pdf_paths(args.targets)
+    if not pdf_paths:
+        print("Error: No PDF files found.")
+        return
+
+    print(f"Processing {len(pdf_paths)} PDF(s)...")
+    summary = run_batch(pdf_paths, args.output, workers=args.workers,
+                        timeout=args.timeout, max_tasks_per_child=args.max_tasks_per_child,
+                        cache_dir=args.cache_dir, backend=args.backend, use_mmap=args.mmap,
+                        sections=parse_name_list(args.sections), extractors=extractors,
+                        header_band=args.header_band, trace=trace, artifact_dir=args.artifact_dir)
+
+    print(f"Batch complete. Results saved to {args.output}")
+    print(json.dumps(summary, indent=2))
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,360 @@
+import argparse
+import hashlib
+import json
+import re
+import sqlite3
+
+# --- Candidate Search Index ---
+# A local SQLite database over parsed resumes (final_output). Structured
+# fields (college, degree, branch, ranks, skills) live in indexed tables so
+# filtered queries are a few B-tree lookups. The resume section text goes into
+# an FTS5 table for full-text search (a plain table + LIKE scan if this SQLite
+# build lacks FTS5).
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS candidates (
+    id INTEGER PRIMARY KEY,
+    source TEXT UNIQUE,
+    email TEXT,
+    phone TEXT,
+    college TEXT COLLATE NOCASE,
+    degree TEXT COLLATE NOCASE,
+    branch TEXT COLLATE NOCASE,
+    extracted TEXT
+);
+CREATE INDEX IF NOT EXISTS candidates_college ON candidates (college);
+CREATE INDEX IF NOT EXISTS candidates_branch ON candidates (branch);
+CREATE INDEX IF NOT EXISTS candidates_degree ON candidates (degree);
+
+-- Best rank per exam, so joining on ranks never duplicates a candidate
+CREATE TABLE IF NOT EXISTS ranks (
+    candidate_id INTEGER,
+    exam TEXT COLLATE NOCASE,
+    rank INTEGER,
+    PRIMARY KEY (candidate_id, exam)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS ranks_exam_rank ON ranks (exam, rank);
+
+CREATE TABLE IF NOT EXISTS skills (
+    skill TEXT COLLATE NOCASE,
+    candidate_id INTEGER,
+    category TEXT,
+    PRIMARY KEY (skill, candidate_id)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS skills_candidate ON skills (candidate_id);
+
+-- Candidates per skill / college / degree / branch value, kept exact by ingest
+-- so search() can size those filters without scanning their index
+CREATE TABLE IF NOT EXISTS value_counts (
+    field TEXT,
+    value TEXT COLLATE NOCASE,
+    n INTEGER,
+    PRIMARY KEY (field, value)
+) WITHOUT ROWID;
+"""
+
+FTS_SCHEMA = "CREATE VIRTUAL TABLE IF NOT EXISTS resume_text USING fts5(content)"
+PLAIN_TEXT_SCHEMA = "CREATE TABLE IF NOT EXISTS resume_text (content TEXT)"
+
+INGEST_BATCH = 5000  # records per transaction
+DEFAULT_LIMIT = 50
+DRIVER_PROBE = 20000  # ids counted per rank / text filter when picking where a query starts
+COUNTED_FIELDS = ("college", "degree", "branch")
+CACHE_KIB = 65536  # page cache per connection; index probes at 1M candidates miss the 2 MiB default
+
+RANK_FILTER = re.compile(r'^\s*(.+?)\s*(<=?)\s*(\d+)\s*$')
+
+def open_index(path):
+    """Opens (creating if needed) a candidate index and returns the connection."""
+    # Autocommit mode: ingest() manages its own transactions
+    conn = sqlite3.connect(path, isolation_level=None)
+    conn.row_factory = sqlite3.Row
+    conn.execute("PRAGMA journal_mode=WAL")
+    conn.execute("PRAGMA synchronous=NORMAL")
+    conn.execute(f"PRAGMA cache_size=-{CACHE_KIB}")
+    conn.executescript(SCHEMA)
+    if not conn.execute("SELECT 1 FROM sqlite_master WHERE name = 'resume_text'").fetchone():
+        try:
+            conn.execute(FTS_SCHEMA)
+        except sqlite3.OperationalError:
+            conn.execute(PLAIN_TEXT_SCHEMA)
+    return conn
+
+def has_fts(conn):
+    row = conn.execute("SELECT sql FROM sqlite_master WHERE name = 'resume_text'").fetchone()
+    return row is not None and "fts5" in row[0].lower()
+
+# --- Ingest ---
+
+def iter_parsed_results(path):
+    """
+    Yields (source, final_output) from a batch_parser JSONL file (records
+    that are not "ok" are skipped) or a single parser.py JSON output.
+    """
+    with open(path, "r", encoding="utf-8") as f:
+        if path.endswith(".json"):
+            yield path, json.load(f)
+            return
+        for line in f:
+            if not line.strip():
+                continue
+            record = json.loads(line)
+            if "extracted" in record:
+                yield None, record
+            elif record.get("status") == "ok" and record.get("result"):
+                yield record.get("source"), record["result"]
+
+def content_key(final_output):
+    """Stand-in source for records without one: a hash of their parsed content."""
+    digest = hashlib.sha256(json.dumps(final_output, sort_keys=True).encode("utf-8")).hexdigest()
+    return f"sha256:{digest}"
+
+def _rank_value(rank):
+    """
+    Integer rank from a rank_extract value ("1,200" -> 1200). Decimal values
+    are percentiles or scores, not ranks, and are not indexed (None).
+    """
+    value = str(rank).replace(",", "").strip()
+    return int(value) if value.isdecimal() else None
+
+def _resume_text(resume):
+    """Flattens final_output["resume"] (lines and subsection entries) into one text block."""
+    parts = []
+    for key, entries in resume.items():
+        parts.append(key.split('-', 1)[-1])
+        for entry in entries:
+            if isinstance(entry, dict):
+                parts.append(entry.get("title") or "")
+                parts.extend(entry.get("details") or [])
+            else:
+                parts.append(str(entry))
+    return "\n".join(p for p in parts if p)
+
+def _count_values(counts, skills, row, delta):
+    """Adds delta to the value_counts tally of one candidate's skills and COUNTED_FIELDS values."""
+    for skill in skills:
+        counts[("skill", skill)] = counts.get(("skill", skill), 0) + delta
+    for field in COUNTED_FIELDS:
+        if row[field] is not None:
+            counts[(field, row[field])] = counts.get((field, row[field]), 0) + delta
+
+def _flush_counts(conn, counts):
+    conn.executemany("INSERT INTO value_counts (field, value, n) VALUES (?, ?, ?) "
+                     "ON CONFLICT (field, value) DO UPDATE SET n = n + excluded.n",
+                     [(field, value, n) for (field, value), n in counts.items() if n])
+    counts.clear()
+
+def _delete_candidate(conn, candidate_id, counts):
+    row = conn.execute("SELECT college, degree, branch FROM candidates WHERE id = ?", (candidate_id,)).fetchone()
+    skills = [r[0] for r in conn.execute("SELECT skill FROM skills WHERE candidate_id = ?", (candidate_id,))]
+    _count_values(counts, skills, row, -1)
+    conn.execute("DELETE FROM ranks WHERE candidate_id = ?", (candidate_id,))
+    conn.execute("DELETE FROM skills WHERE candidate_id = ?", (candidate_id,))
+    conn.execute("DELETE FROM resume_text WHERE rowid = ?", (candidate_id,))
+    conn.execute("DELETE FROM candidates WHERE id = ?", (candidate_id,))
+
+def ingest(conn, results, batch_size=INGEST_BATCH):
+    """
+    Adds (source, final_output) pairs to the index, batch_size per transaction.
+    A source that is already indexed is replaced. Records without a source
+    are keyed on their content (content_key), so ingesting them again does
+    not duplicate them. Returns the number ingested.
+    """
+    count = 0
+    pending = 0
+    counts = {}
+    conn.execute("BEGIN")
+    try:
+        for source, final_output in results:
+            extracted = final_output.get("extracted") or {}
+            contact = extracted.get("contact") or {}
+            edu = extracted.get("edu") or {}
+
+            if source is None:
+                source = content_key(final_output)
+            existing = conn.execute("SELECT id FROM candidates WHERE source = ?", (source,)).fetchone()
+            if existing:
+                _delete_candidate(conn, existing[0], counts)
+
+            candidate_id = conn.execute(
+                "INSERT INTO candidates (source, email, phone, college, degree, branch, extracted) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?)",
+                (source, contact.get("email"), contact.get("phone"), edu.get("college"),
+                 edu.get("degree"), edu.get("branch"), json.dumps(extracted))
+            ).lastrowid
+
+            best_ranks = {}
+            for r in extracted.get("rank") or []:
+                value = _rank_value(r.get("rank"))
+                if r.get("exam") and value is not None:
+                    key = r["exam"].lower()
+                    if key not in best_ranks or value < best_ranks[key][1]:
+                        best_ranks[key] = (r["exam"], value)
+            conn.executemany("INSERT INTO ranks (candidate_id, exam, rank) VALUES (?, ?, ?)",
+                             [(candidate_id, exam, value) for exam, value in best_ranks.values()])
+            skill_rows = {skill.lower(): (skill, candidate_id, category)
+                          for category, names in (extracted.get("skill") or {}).items() for skill in names}
+            conn.executemany("INSERT INTO skills (skill, candidate_id, category) VALUES (?, ?, ?)",
+                             list(skill_rows.values()))
+            _count_values(counts, [row[0] for row in skill_rows.values()],
+                          {field: edu.get(field) for field in COUNTED_FIELDS}, 1)
+
+            text = _resume_text(final_output.get("resume") or {})
+            if text:
+                conn.execute("INSERT INTO resume_text (rowid, content) VALUES (?, ?)", (candidate_id, text))
+
+            count += 1
+            pending += 1
+            if pending >= batch_size:
+                _flush_counts(conn, counts)
+                conn.execute("COMMIT")
+                conn.execute("BEGIN")
+                pending = 0
+        _flush_counts(conn, counts)
+        conn.execute("COMMIT")
+    except BaseException:
+        conn.execute("ROLLBACK")
+        raise
+    return count
+
+# --- Query ---
+
+def parse_rank_filter(value):
+    """'JEE Advanced<1000' -> ('JEE Advanced', 999); 'JEE Mains<=500' -> ('JEE Mains', 500)."""
+    m = RANK_FILTER.match(value)
+    if not m:
+        raise ValueError(f"Invalid rank filter '{value}', expected e.g. 'JEE Advanced<1000'")
+    exam, op, number = m.groups()
+    max_rank = int(number) if op == "<=" else int(number) - 1
+    return exam, max_rank
+
+def _build_filters(conn, skills, college, degree, branch, ranks, text):
+    """
+    One dict per filter:
+    ids: SQL listing the matching candidate ids straight from an index, in id
+         order unless it is a rank range (id_ordered). INDEXED BY stops the
+         planner from walking ranks in id order to skip the final sort.
+    check: SQL testing one candidate: its row c, or an index probe on d.id.
+    counted: (field, value) whose size value_counts knows, else None.
+    """
+    filters = []
+    for skill in skills:
+        filters.append({"ids": "SELECT candidate_id AS id FROM skills WHERE skill = ?",
+                        "check": "EXISTS (SELECT 1 FROM skills WHERE skill = ? AND candidate_id = d.id)",
+                        "params": (skill,), "id_ordered": True, "counted": ("skill", skill)})
+    for exam, max_rank in ranks:
+        filters.append({"ids": "SELECT candidate_id AS id FROM ranks INDEXED BY ranks_exam_rank "
+                               "WHERE exam = ? AND rank <= ?",
+                        "check": "EXISTS (SELECT 1 FROM ranks WHERE candidate_id = d.id AND exam = ? AND rank <= ?)",
+                        "params": (exam, max_rank), "id_ordered": False, "counted": None})
+    for field, value in (("college", college), ("degree", degree), ("branch", branch)):
+        if value is not None:
+            filters.append({"ids": f"SELECT id FROM candidates WHERE {field} = ?",
+                            "check": f"c.{field} = ?",
+                            "params": (value,), "id_ordered": True, "counted": (field, value)})
+    if text:
+        if has_fts(conn):
+            condition, param = "resume_text MATCH ?", text
+        else:
+            condition, param = "content LIKE ?", f"%{text}%"
+        filters.append({"ids": f"SELECT rowid AS id FROM resume_text WHERE {condition}",
+                        "check": f"EXISTS (SELECT 1 FROM resume_text WHERE rowid = d.id AND {condition})",
+                        "params": (param,), "id_ordered": True, "counted": None})
+    return filters
+
+def _filter_size(conn, f):
+    """Exact size for counted filters, else the number of ids up to DRIVER_PROBE."""
+    if f["counted"] is not None:
+        row = conn.execute("SELECT n FROM value_counts WHERE field = ? AND value = ?", f["counted"]).fetchone()
+        return row[0] if row else 0
+    return conn.execute(f"SELECT count(*) FROM ({f['ids']} LIMIT {DRIVER_PROBE})", f["params"]).fetchone()[0]
+
+def search(conn, skills=(), college=None, degree=None, branch=None, ranks=(), text=None, limit=DEFAULT_LIMIT):
+    """
+    Returns candidates matching every given filter, in ingest order:
+    skills: skill names the candidate must all have (case-insensitive).
+    ranks: (exam, max_rank) pairs; the candidate needs a rank <= max_rank in each exam.
+    text: FTS5 query over the resume text (substring match without FTS5).
+    """
+    columns = "c.id, c.source, c.email, c.phone, c.college, c.degree, c.branch, c.extracted"
+    filters = _build_filters(conn, skills, college, degree, branch, ranks, text)
+
+    if not filters:
+        sql, params = f"SELECT {columns} FROM candidates c ORDER BY c.id LIMIT ?", [limit]
+    else:
+        # SQLite's planner cannot tell how selective a rank range or a text
+        # query is, so walk the smallest filter and probe the others per id.
+        # Among large filters an id-ordered one wins: the walk needs no sort
+        # and stops after `limit` hits.
+        ranked = sorted(filters, key=lambda f: (min(_filter_size(conn, f), DRIVER_PROBE), not f["id_ordered"]))
+        # Remaining checks: columns of the already-joined row first, then
+        # index probes smallest first, so most ids fail early
+        driver = ranked[0]
+        others = sorted(ranked[1:], key=lambda f: f["counted"] is None or f["counted"][0] == "skill")
+
+        # CROSS JOIN keeps the driver as the outer loop
+        sql = f"SELECT {columns} FROM ({driver['ids']}) AS d CROSS JOIN candidates c ON c.id = d.id"
+        params = list(driver["params"])
+        if others:
+            sql += " WHERE " + " AND ".join(f["check"] for f in others)
+            for f in others:
+                params.extend(f["params"])
+        sql += " ORDER BY d.id LIMIT ?"
+        params.append(limit)
+
+    results = []
+    for row in conn.execute(sql, params):
+        candidate = dict(row)
+        candidate["extracted"] = json.loads(candidate["extracted"])
+        results.append(candidate)
+    return results
+
+def main():
+    arg_parser = argparse.ArgumentParser(description="Index parsed resumes in SQLite and query candidates.")
+    commands = arg_parser.add_subparsers(dest="command", required=True)
+
+    ingest_parser = commands.add_parser("ingest", help="Add batch_parser JSONL / parser.py JSON output to the index")
+    ingest_parser.add_argument("index", help="SQLite index path")
+    ingest_parser.add_argument("inputs", nargs="+", help="JSONL or JSON result files")
+
+    query_parser = commands.add_parser("query", help="Print matching candidates as JSON lines")
+    query_parser.add_argument("index", help="SQLite index path")
+    query_parser.add_argument("--skill", action="append", default=[], help="Required skill (repeatable)")
+    query_parser.add_argument("--college", default=None)
+    query_parser.add_argument("--degree", default=None)
+    query_parser.add_argument("--branch", default=None)
+    query_parser.add_argument("--rank", action="append", default=[],
+                              help="Rank filter like 'JEE Advanced<1000' (repeatable)")
+    query_parser.add_argument("--text", default=None, help="Full-text query over the resume sections")
+    query_parser.add_argument("--limit", type=int, default=DEFAULT_LIMIT)
+    args = arg_parser.parse_args()
+
+    conn = open_index(args.index)
+    try:
+        if args.command == "ingest":
+            total = 0
+            for path in args.inputs:
+                count = ingest(conn, iter_parsed_results(path))
+                print(f"{path}: {count} candidate(s) indexed")
+                total += count
+            print(f"Done. {total} candidate(s) indexed into {args.index}")
+            return
+
+        try:
+            rank_filters = [parse_rank_filter(value) for value in args.rank]
+        except ValueError as e:
+            print(f"Error: {e}")
+            return
+        try:
+            candidates = search(conn, skills=args.skill, college=args.college, degree=args.degree,
+                                branch=args.branch, ranks=rank_filters, text=args.text, limit=args.limit)
+        except sqlite3.OperationalError as e:
+            print(f"Error: {e}")
+            return
+        for candidate in candidates:
+            print(json.dumps(candidate))
+    finally:
+        conn.close()
+
+if __name__ == "__main__":
+    main()
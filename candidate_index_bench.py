@@ -0,0 +1,98 @@
+import argparse
+import itertools
+import os
+import random
+import tempfile
+import time
+
+from candidate_index import ingest, open_index, search
+from edu_data import BRANCH_PATTERNS
+from pipeline_bench import percentiles
+from skill_data import SKILL_DB
+
+CAMPUSES = ("Bombay", "Delhi", "Madras", "Kanpur", "Kharagpur", "Roorkee", "Guwahati", "Hyderabad", "Indore",
+            "Varanasi", "Dhanbad", "Mandi", "Patna", "Ropar", "Bhubaneswar", "Gandhinagar", "Jodhpur")
+DEGREES = ("B.Tech", "Dual Degree", "M.Tech", "B.S", "M.Sc", "Ph.D")
+TERMS = ("developed", "scalable", "pipeline", "research", "compiler", "fuzzing", "distributed", "latency",
+         "inference", "dashboard", "optimized", "database", "internship", "kernel", "robotics", "trading",
+         "vision", "language", "models", "benchmark", "analysis", "simulation", "network", "security")
+VOCABULARY_SIZE = 20000
+
+# Query name -> search() keyword arguments
+QUERIES = {
+    "rank+skill+college": {"ranks": [("JEE Advanced", 999)], "skills": ["PyTorch"], "college": "IIT Bombay"},
+    "skill+branch": {"skills": ["Docker", "Python"], "branch": "Computer Science"},
+    "rank_only": {"ranks": [("JEE Mains", 500)]},
+    "text": {"text": "fuzzing compiler"},
+    "text+college": {"text": "robotics", "college": "IIT Madras"}
+}
+
+def synthetic_results(count, seed=0):
+    """Yields (source, final_output) pairs shaped like real parser output, without parsing PDFs."""
+    rng = random.Random(seed)
+    # Zipf-like vocabulary: real terms spread over the frequency ranks, the rest made up
+    vocabulary = ["".join(rng.choice("abcdefghijklmnopqrstuvwxyz") for _ in range(rng.randint(3, 10)))
+                  for _ in range(VOCABULARY_SIZE)]
+    for pos, term in enumerate(TERMS):
+        vocabulary[(pos + 1) * 40] = term
+    cumulative = list(itertools.accumulate(1 / (r + 1) for r in range(VOCABULARY_SIZE)))
+
+    def words(k):
+        return " ".join(rng.choices(vocabulary, cum_weights=cumulative, k=k))
+
+    skill_pool = [(category, name) for category, names in SKILL_DB.items() for name in names]
+    branches = list(BRANCH_PATTERNS)
+    for i in range(count):
+        skills = {}
+        for category, name in rng.sample(skill_pool, rng.randint(4, 14)):
+            skills.setdefault(category, []).append(name)
+        ranks = []
+        if rng.random() < 0.6:
+            ranks.append({"exam": "JEE Advanced", "rank": str(rng.randint(1, 150000)), "context": ""})
+        if rng.random() < 0.7:
+            ranks.append({"exam": "JEE Mains", "rank": str(rng.randint(1, 1000000)), "context": ""})
+        resume = {
+            "projects-Projects": [{"title": words(3), "details": [words(12) for _ in range(3)]}],
+            "experience-Experience": [words(15) for _ in range(2)]
+        }
+        yield f"synthetic/{i:07d}.pdf", {
+            "extracted": {
+                "contact": {"email": f"candidate{i}@example.com", "phone": None},
+                "edu": {"college": f"IIT {rng.choice(CAMPUSES)}", "degree": rng.choice(DEGREES),
+                        "branch": rng.choice(branches)},
+                "rank": ranks,
+                "skill": skills
+            },
+            "resume": resume
+        }
+
+def main():
+    arg_parser = argparse.ArgumentParser(description="Ingest synthetic candidates and time filtered queries.")
+    arg_parser.add_argument("-n", "--candidates", type=int, default=100000)
+    arg_parser.add_argument("-r", "--repeat", type=int, default=20, help="Runs per query")
+    arg_parser.add_argument("--index", default=None, help="Keep the index at this path (default: temporary)")
+    args = arg_parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = args.index or os.path.join(tmp, "candidates.db")
+        conn = open_index(path)
+
+        start = time.perf_counter()
+        count = ingest(conn, synthetic_results(args.candidates))
+        elapsed = time.perf_counter() - start
+        print(f"Ingested {count} candidates in {elapsed:.1f}s ({count / elapsed:.0f}/s), "
+              f"{os.path.getsize(path) / 2**20:.0f} MiB")
+
+        print(f"{'query':<20} {'hits':>5} {'p50 ms':>8} {'p90 ms':>8} {'mean ms':>8}")
+        for name, filters in QUERIES.items():
+            timings = []
+            for _ in range(args.repeat):
+                t = time.perf_counter()
+                hits = search(conn, **filters)
+                timings.append(time.perf_counter() - t)
+            p = percentiles(timings)
+            print(f"{name:<20} {len(hits):>5} {p['p50_ms']:>8.2f} {p['p90_ms']:>8.2f} {p['mean_ms']:>8.2f}")
+        conn.close()
+
+if __name__ == "__main__":
+    main()
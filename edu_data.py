@@ -0,0 +1,50 @@
+# Degree patterns in priority order: Dual Degree > Masters > Bachelors.
+# The first pattern in this list that matches anywhere in the section wins.
+DEGREE_PATTERNS = [
+    (r"Dual\s*Degree", "Dual Degree"),
+    (r"M\.?\s*Tech", "M.Tech"),
+    (r"M\.?\s*E\b", "M.E"),
+    (r"M\.?\s*S\b", "M.S"),
+    (r"M\.?\s*Sc", "M.Sc"),
+    (r"Ph\.?D", "Ph.D"),
+    (r"B\.?\s*Tech", "B.Tech"),
+    (r"B\.?\s*E\b", "B.E"),
+    (r"B\.?\s*S\b", "B.S"),
+    (r"B\.?\s*Sc", "B.Sc"),
+    # Fallbacks
+    (r"Bachelor", "B.Tech"),
+    (r"Master", "M.Tech")
+]
+
+# Branch Name -> List of Regex Patterns
+# First branch (in this order) with any matching pattern wins.
+BRANCH_PATTERNS = {
+    "Computer Science": [r"computer\s*science", r"\bcse\b", r"\bcs\b"],
+    "Electrical": [r"electrical", r"\beee\b", r"\bece\b", r"electronics"],
+    "Mechanical": [r"mechanical", r"\bmech\b"],
+    "Civil": [r"civil"],
+    "Chemical": [r"chemical"],
+    "Aerospace": [r"aerospace"],
+    "Engineering Physics": [r"engineering\s*physics", r"\bep\b"],
+    "Metallurgical": [r"metallurg", r"material\s*science"],
+    "Mathematics": [r"mathematics", r"\bmnc\b", r"computing"],
+    "Bioscience": [r"bio", r"biotech"],
+    "Data Science": [r"data\s*science", r"\bds\b", r"\bai\b"],
+    "Energy": [r"energy"]
+}
+
+# Institutions: each alias is followed by `campus`, whose first group is the
+# campus name substituted into `format`. The leftmost mention in the section
+# wins (ties go to the earlier entry). Restricted to IITs for now; more
+# institution families can be appended without slowing extraction down.
+INSTITUTIONS = [
+    {
+        "aliases": [r"Indian\s*Institute\s*of\s*Technology", r"IIT"],
+        "campus": r"\s*(?:[-–,()]|\s)+([A-Za-z]+)",
+        "format": "IIT {campus}"
+    }
+]
+
+# Removed before branch matching so "Major: Electrical, Minor: Computer Science"
+# resolves to Electrical.
+MINOR_PATTERN = r"Minor\s*(?:in|:)?\s*[\w\s]+"
@@ -0,0 +1,84 @@
+import argparse
+import random
+import re
+import string
+import timeit
+
+from edu_data import BRANCH_PATTERNS, DEGREE_PATTERNS, INSTITUTIONS
+from extract_edu import build_edu_classifier, extract_education_details
+
+SAMPLE_SECTION = [
+    "Indian Institute of Technology Bombay",
+    "B.Tech in Electrical Engineering, Minor in Computer Science",
+    "CGPA 8.9/10 2018-2022",
+    "Relevant coursework: Signals, Control Systems, Machine Learning"
+]
+
+def legacy_education_details(lines, institutions, degrees, branches):
+    """The original strategy on the same tables: one re.search per entry, in priority order."""
+    full_text = "\n".join(lines)
+    edu_data = {"college": None, "degree": None, "branch": None}
+
+    best = None
+    for inst in institutions:
+        m = re.search(f"(?:{'|'.join(inst['aliases'])}){inst['campus']}", full_text, re.IGNORECASE)
+        if m and (best is None or m.start() < best[1].start()):
+            best = (inst["format"], m)
+    if best:
+        edu_data["college"] = best[0].format(campus=re.sub(r'[^a-zA-Z]', '', best[1].group(1).title()))
+
+    for pattern, normalized in degrees:
+        if re.search(pattern, full_text, re.IGNORECASE):
+            edu_data["degree"] = normalized
+            break
+
+    text_no_minors = re.sub(r"Minor\s*(?:in|:)?\s*[\w\s]+", "", full_text, flags=re.IGNORECASE)
+    for branch_name, regex_list in branches.items():
+        if any(re.search(regex, text_no_minors, re.IGNORECASE) for regex in regex_list):
+            edu_data["branch"] = branch_name
+            break
+
+    return edu_data
+
+def inflate_tables(extra, seed=0):
+    """Appends `extra` made-up institutions and branches (after the real ones, so results don't change)."""
+    rng = random.Random(seed)
+    word = lambda: "".join(rng.choice(string.ascii_lowercase) for _ in range(rng.randint(5, 10)))
+    institutions = list(INSTITUTIONS) + [
+        {"aliases": [rf"{word()}\s*University", rf"U{word()}"], "campus": r"\s*(?:[-–,()]|\s)+([A-Za-z]+)",
+         "format": "Univ {campus}"}
+        for _ in range(extra)
+    ]
+    branches = dict(BRANCH_PATTERNS)
+    for _ in range(extra):
+        branches[word().title()] = [word(), rf"\b{word()}\s*engineering"]
+    return institutions, branches
+
+def per_call_us(fn, number):
+    return min(timeit.repeat(fn, number=number, repeat=5)) / number * 1e6
+
+def main():
+    arg_parser = argparse.ArgumentParser(description="Education extraction: per-entry search vs compiled classifier.")
+    arg_parser.add_argument("--sizes", default="0,100,1000", help="Extra institutions/branches to add to the tables")
+    arg_parser.add_argument("-n", "--number", type=int, default=200)
+    args = arg_parser.parse_args()
+
+    lines = [{"text": t} for t in SAMPLE_SECTION]
+    print(f"{'extra':>6} {'legacy us':>10} {'classifier us':>14}")
+    for extra in (int(s) for s in args.sizes.split(",")):
+        institutions, branches = inflate_tables(extra)
+        classifier = build_edu_classifier(institutions, DEGREE_PATTERNS, branches)
+
+        expected = legacy_education_details(SAMPLE_SECTION, institutions, DEGREE_PATTERNS, branches)
+        got = extract_education_details(lines, classifier)
+        if got != expected:
+            print(f"Error: classifier disagrees with the legacy search at +{extra}: {got} != {expected}")
+            return
+
+        legacy = per_call_us(lambda: legacy_education_details(SAMPLE_SECTION, institutions, DEGREE_PATTERNS, branches),
+                             max(1, args.number // (1 + extra // 50)))
+        compiled = per_call_us(lambda: extract_education_details(lines, classifier), args.number)
+        print(f"{extra:>6} {legacy:>10.1f} {compiled:>14.1f}")
+
+if __name__ == "__main__":
+    main()
@@ -1,9 +1,15 @@
 import re
+from itertools import islice
+
+# Number of lines from the top of the document treated as the contact header
+HEADER_SCOPE_LINES = 30
 
 def extract_contacts(all_lines):
     """
     Scans the entire document (or header section) for contact details.
     Uses regex on text AND checks hidden PDF hyperlinks.
+    Accepts a list or any iterable of lines (e.g. pdf_processor.iter_lines_from_pdf),
+    and stops consuming it once the header scope is covered.
     """
     contacts = {
         "email": None,
@@ -20,7 +26,7 @@ def extract_contacts(all_lines):
     phone_pattern = r'(?:\+?\d{1,3}[ -]?)?(?:\d{5}[ -]?\d{5}|\(?\d{3}\)?[ -]?\d{3}[ -]?\d{4}|\d{10,12})'
     
     # Scan header area (first 30 lines)
-    header_scope = all_lines[:30] 
+    header_scope = islice(all_lines, HEADER_SCOPE_LINES)
     
     for line in header_scope:
         text = line['text']
@@ -83,4 +89,8 @@ def extract_contacts(all_lines):
                     contacts['github'] = link.split('?')[0]
                     break
 
+        # Everything we scan for is filled: no need to read further lines
+        if contacts['email'] and contacts['phone'] and contacts['linkedin'] and contacts['github']:
+            break
+
     return contacts
\ No newline at end of file
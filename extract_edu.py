@@ -1,86 +1,183 @@
 import re
+from edu_data import BRANCH_PATTERNS, DEGREE_PATTERNS, INSTITUTIONS, MINOR_PATTERN
+from regex_prefix import has_top_level_alternation, literal_prefix, lowercase_gate_safe, prefix_trie_pattern
 
-def extract_education_details(lines):
+# --- Compiled Classifiers (built on first use) ---
+# Each table (institutions, degrees, branches) is a list of entries in
+# priority order. Entries are bucketed by their literal prefix (first 4
+# characters) and each bucket is compiled into one alternation, which at a
+# given position returns its highest-priority matching entry. A trie regex
+# over all prefixes finds the positions where some entry can start, and the
+# longest prefix there names the buckets to try. The text is scanned once
+# per table: cost grows with the text length and the number of hits, not
+# with the number of table entries.
+
+_BUCKET_PREFIX = 4
+
+def _compile_bucket(members):
+    """One alternation over [(priority, pattern)]; returns (compiled, {group index: priority}, min priority)."""
+    group_priority = {}
+    group = 1
+    for priority, pattern in members:
+        group_priority[group] = priority
+        group += 1 + re.compile(pattern).groups
+    alternation = "|".join(f"({pattern})" for _, pattern in members)
+    return re.compile(alternation, re.IGNORECASE), group_priority, members[0][0]
+
+def build_classifier(entries):
+    """
+    Compiles [(value, pattern)] (highest priority first) into lookup tables.
+    """
+    classifier = {
+        "entries": [],   # (value, compiled) by priority
+        "buckets": {},   # gate hit (longest prefix at a position) -> buckets of it and its shorter prefixes
+        "fallback": [],  # (priority, compiled) for patterns without a usable prefix
+        "gate": None
+    }
+
+    members = {}
+    for priority, (value, pattern) in enumerate(entries):
+        compiled = re.compile(pattern, re.IGNORECASE)
+        classifier["entries"].append((value, compiled))
+        prefix = literal_prefix(pattern)[:_BUCKET_PREFIX]
+        if prefix and prefix.isascii():
+            members.setdefault(prefix, []).append((priority, pattern))
+        else:
+            classifier["fallback"].append((priority, compiled))
+
+    if members:
+        compiled_buckets = {prefix: _compile_bucket(group) for prefix, group in members.items()}
+        classifier["buckets"] = {
+            prefix: [compiled_buckets[prefix[:n]] for n in range(1, len(prefix) + 1) if prefix[:n] in compiled_buckets]
+            for prefix in compiled_buckets
+        }
+        classifier["gate"] = re.compile(prefix_trie_pattern(members))
+
+    return classifier
+
+def match_first(text, classifier, leftmost=False):
+    """
+    Returns (value, match) for the winning entry, or None.
+    Default: the highest-priority entry matching anywhere (first-in-table wins).
+    leftmost=True: the earliest match in the text, ties going to the higher priority.
+    """
+    entries = classifier["entries"]
+    lowered = text.lower()
+
+    if classifier["gate"] is None or not lowercase_gate_safe(text, lowered):
+        # Rare path (no prefixes, or case folding that shifts positions):
+        # plain per-entry search gives the same answer
+        best = None
+        for priority, (value, compiled) in enumerate(entries):
+            m = compiled.search(text)
+            if m and (best is None or m.start() < best[1].start()):
+                best = (priority, m)
+                if not leftmost:
+                    break
+        return (entries[best[0]][0], best[1]) if best else None
+
+    best_priority, best_start = len(entries), None
+    for priority, compiled in classifier["fallback"]:
+        m = compiled.search(text)
+        if m and (best_start is None or (m.start(), priority) < (best_start, best_priority)
+                  if leftmost else priority < best_priority):
+            best_priority, best_start = priority, m.start()
+
+    buckets = classifier["buckets"]
+    gate = classifier["gate"]
+    pos = 0
+    # Priority mode can stop once the top entry matched; leftmost mode once
+    # the scan has passed the best match
+    while leftmost or best_priority > 0:
+        hit = gate.search(lowered, pos)
+        if hit is None:
+            break
+        start = hit.start()
+        if leftmost and best_start is not None and start > best_start:
+            break
+        # In leftmost mode anything matching before the best start wins
+        limit = len(entries) if leftmost and (best_start is None or start < best_start) else best_priority
+        for alternation, group_priority, min_priority in buckets[hit.group()]:
+            if min_priority >= limit:
+                continue
+            m = alternation.match(text, start)
+            if m and group_priority[m.lastindex] < limit:
+                best_priority, best_start = group_priority[m.lastindex], start
+                limit = best_priority
+        pos = start + 1
+
+    if best_start is None:
+        return None
+    value, compiled = entries[best_priority]
+    return value, compiled.match(text, best_start)
+
+def _institution_pattern(alias, campus):
+    # Only group the alias when needed: a leading group hides its literal prefix
+    if has_top_level_alternation(alias):
+        alias = f"(?:{alias})"
+    return alias + campus
+
+def build_edu_classifier(institutions=INSTITUTIONS, degrees=DEGREE_PATTERNS, branches=BRANCH_PATTERNS):
+    institution_entries = [(inst["format"], _institution_pattern(alias, inst["campus"]))
+                           for inst in institutions for alias in inst["aliases"]]
+    branch_entries = [(name, pattern) for name, patterns in branches.items() for pattern in patterns]
+    return {
+        "institutions": build_classifier(institution_entries),
+        "degrees": build_classifier([(label, pattern) for pattern, label in degrees]),
+        "branches": build_classifier(branch_entries),
+        "minor": re.compile(MINOR_PATTERN, re.IGNORECASE)
+    }
+
+_edu_classifier = None
+
+def edu_classifier():
+    """The edu_data tables compiled by build_edu_classifier, once per process."""
+    global _edu_classifier
+    if _edu_classifier is None:
+        _edu_classifier = build_edu_classifier(INSTITUTIONS, DEGREE_PATTERNS, BRANCH_PATTERNS)
+    return _edu_classifier
+
+def reset_edu_classifier():
+    """Drops the compiled edu_data tables; the next extraction compiles them as they are now."""
+    global _edu_classifier
+    _edu_classifier = None
+
+def extract_education_details(lines, classifier=None):
     """
     Extracts College (IIT only), Degree, and Branch from the education section.
+    classifier defaults to edu_classifier().
     """
     if not lines:
         return {}
-        
+    if classifier is None:
+        classifier = edu_classifier()
+
     # Combine lines into one text block for easier pattern matching
     full_text = "\n".join([l['text'] for l in lines])
-    
+
     edu_data = {
         "college": None,
         "degree": None,
         "branch": None
     }
 
-    # --- 1. Extract College (Restricted to IITs) ---
-    # Pattern looks for "IIT <City>" or "Indian Institute of Technology <City>"
-    # We capture the word immediately following the IIT text.
-    iit_pattern = r"(?:Indian\s*Institute\s*of\s*Technology|IIT)\s*(?:[-–,()]|\s)+([A-Za-z]+)"
-    
-    match = re.search(iit_pattern, full_text, re.IGNORECASE)
-    if match:
-        campus = match.group(1).title()
-        # Clean up any trailing punctuation just in case
-        campus = re.sub(r'[^a-zA-Z]', '', campus)
-        edu_data["college"] = f"IIT {campus}"
-
-    # --- 2. Extract Degree ---
-    # We prioritize Dual Degree > Masters > Bachelors
-    degree_patterns = [
-        (r"Dual\s*Degree", "Dual Degree"),
-        (r"M\.?\s*Tech", "M.Tech"),
-        (r"M\.?\s*E\b", "M.E"),
-        (r"M\.?\s*S\b", "M.S"),
-        (r"M\.?\s*Sc", "M.Sc"),
-        (r"Ph\.?D", "Ph.D"),
-        (r"B\.?\s*Tech", "B.Tech"),
-        (r"B\.?\s*E\b", "B.E"),
-        (r"B\.?\s*S\b", "B.S"),
-        (r"B\.?\s*Sc", "B.Sc"),
-        # Fallbacks
-        (r"Bachelor", "B.Tech"), 
-        (r"Master", "M.Tech")
-    ]
-    
-    for pattern, normalized in degree_patterns:
-        if re.search(pattern, full_text, re.IGNORECASE):
-            edu_data["degree"] = normalized
-            break
+    # --- 1. College: earliest institution mention, campus = word after it ---
+    found = match_first(full_text, classifier["institutions"], leftmost=True)
+    if found:
+        fmt, match = found
+        campus = re.sub(r'[^a-zA-Z]', '', match.group(1).title())
+        edu_data["college"] = fmt.format(campus=campus)
 
-    # --- 3. Extract Branch ---
-    # Strategy: Remove "Minor" info first to avoid confusion
+    # --- 2. Degree: Dual Degree > Masters > Bachelors (table order) ---
+    found = match_first(full_text, classifier["degrees"])
+    if found:
+        edu_data["degree"] = found[0]
+
+    # --- 3. Branch: first branch in table order, ignoring Minor info ---
     # e.g. "Major: Electrical, Minor: Computer Science" -> We want Electrical.
-    
-    text_no_minors = re.sub(r"Minor\s*(?:in|:)?\s*[\w\s]+", "", full_text, flags=re.IGNORECASE)
-    
-    # Dictionary of Branch Name -> List of Regex Patterns
-    branches = {
-        "Computer Science": [r"computer\s*science", r"\bcse\b", r"\bcs\b"],
-        "Electrical": [r"electrical", r"\beee\b", r"\bece\b", r"electronics"],
-        "Mechanical": [r"mechanical", r"\bmech\b"],
-        "Civil": [r"civil"],
-        "Chemical": [r"chemical"],
-        "Aerospace": [r"aerospace"],
-        "Engineering Physics": [r"engineering\s*physics", r"\bep\b"],
-        "Metallurgical": [r"metallurg", r"material\s*science"],
-        "Mathematics": [r"mathematics", r"\bmnc\b", r"computing"],
-        "Bioscience": [r"bio", r"biotech"],
-        "Data Science": [r"data\s*science", r"\bds\b", r"\bai\b"],
-        "Energy": [r"energy"]
-    }
-    
-    for branch_name, regex_list in branches.items():
-        found = False
-        for regex in regex_list:
-            if re.search(regex, text_no_minors, re.IGNORECASE):
-                edu_data["branch"] = branch_name
-                found = True
-                break
-        if found:
-            break
+    text_no_minors = classifier["minor"].sub("", full_text)
+    found = match_first(text_no_minors, classifier["branches"])
+    if found:
+        edu_data["branch"] = found[0]
 
-    return edu_data
\ No newline at end of file
+    return edu_data
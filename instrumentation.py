@@ -0,0 +1,199 @@
+import json
+import re
+import sys
+import threading
+import time
+from contextlib import contextmanager, nullcontext
+
+# --- Pipeline Instrumentation ---
+# A PipelineTrace collects wall/CPU time per stage plus document counters
+# (pages, lines, sections, regex calls) for one parse. Callers pass it down
+# the pipeline explicitly; trace=None keeps every stage untimed.
+
+PATTERN_TYPE = type(re.compile(""))
+REGEX_METHODS = frozenset(("search", "match", "fullmatch", "findall", "finditer", "sub", "subn", "split"))
+
+CAPTURE_MODES = ("cprofile", "tracemalloc")
+CAPTURE_TOP = 20  # functions / allocation sites kept in a capture
+
+class PipelineTrace:
+    """
+    Stage timings and counters for one document. Not shared across threads.
+    count_regex counts compiled-pattern calls per stage via sys.setprofile,
+    which slows the traced parse down noticeably, so it is opt-in.
+    """
+
+    def __init__(self, source=None, count_regex=False):
+        self.source = source
+        self.count_regex = count_regex
+        self.stages = {}
+        self.counters = {}
+        self.wall_seconds = 0.0
+        self.cpu_seconds = 0.0
+        self.capture = None
+        self._active = []
+
+    @contextmanager
+    def stage(self, name):
+        """Times one pipeline stage; repeated stages (one per section) accumulate."""
+        entry = self.stages.get(name)
+        if entry is None:
+            entry = {"calls": 0, "wall_seconds": 0.0, "cpu_seconds": 0.0}
+            if self.count_regex:
+                entry["regex_calls"] = 0
+            self.stages[name] = entry
+
+        self._active.append(entry)
+        wall, cpu = time.perf_counter(), time.process_time()
+        try:
+            yield
+        finally:
+            entry["wall_seconds"] += time.perf_counter() - wall
+            entry["cpu_seconds"] += time.process_time() - cpu
+            entry["calls"] += 1
+            self._active.pop()
+
+    def count(self, name, amount=1):
+        self.counters[name] = self.counters.get(name, 0) + amount
+
+    def _on_profile_event(self, frame, event, arg):
+        if event == "c_call" and type(getattr(arg, "__self__", None)) is PATTERN_TYPE \
+                and arg.__name__ in REGEX_METHODS:
+            if self._active:
+                self._active[-1]["regex_calls"] += 1
+            else:
+                self.count("regex_calls_outside_stages")
+
+    @contextmanager
+    def document(self):
+        """Wraps a whole parse: total wall/CPU time and, if enabled, regex counting."""
+        previous = sys.getprofile() if self.count_regex else None
+        if self.count_regex:
+            sys.setprofile(self._on_profile_event)
+        wall, cpu = time.perf_counter(), time.process_time()
+        try:
+            yield self
+        finally:
+            self.wall_seconds += time.perf_counter() - wall
+            self.cpu_seconds += time.process_time() - cpu
+            if self.count_regex:
+                sys.setprofile(previous)
+
+    def to_dict(self):
+        stages = {}
+        for name, entry in self.stages.items():
+            stages[name] = dict(entry, wall_seconds=round(entry["wall_seconds"], 6),
+                                cpu_seconds=round(entry["cpu_seconds"], 6))
+        counters = dict(self.counters)
+        if self.count_regex:
+            counters["regex_calls"] = sum(e["regex_calls"] for e in self.stages.values()) + \
+                counters.pop("regex_calls_outside_stages", 0)
+        return {
+            "source": self.source,
+            "wall_seconds": round(self.wall_seconds, 6),
+            "cpu_seconds": round(self.cpu_seconds, 6),
+            "stages": stages,
+            "counters": counters,
+            "capture": self.capture
+        }
+
+def stage_timer(trace):
+    """Returns trace.stage, or a no-op replacement when tracing is off."""
+    if trace is None:
+        return lambda name: nullcontext()
+    return trace.stage
+
+# --- Threshold-Triggered Capture ---
+
+def capture_run(fn, mode, top=CAPTURE_TOP):
+    """
+    Re-runs fn() under cProfile or tracemalloc and returns a JSON-friendly summary:
+    the top functions by cumulative time, or the peak plus the allocation
+    sites still holding memory when fn returns (caches, retained results).
+    """
+    # Profilers are imported here: plain and traced parses never need them
+    if mode == "cprofile":
+        import cProfile
+        import pstats
+        profiler = cProfile.Profile()
+        profiler.runcall(fn)
+        stats = pstats.Stats(profiler)
+        rows = sorted(stats.stats.items(), key=lambda item: item[1][3], reverse=True)[:top]
+        return {
+            "mode": mode,
+            "total_seconds": round(stats.total_tt, 6),
+            "functions": [{"function": f"{path}:{line}({func})", "calls": nc,
+                           "self_seconds": round(tt, 6), "cumulative_seconds": round(ct, 6)}
+                          for (path, line, func), (_, nc, tt, ct, _) in rows]
+        }
+
+    if mode == "tracemalloc":
+        import tracemalloc
+        already_tracing = tracemalloc.is_tracing()
+        if not already_tracing:
+            tracemalloc.start()
+        tracemalloc.reset_peak()
+        try:
+            fn()
+            snapshot = tracemalloc.take_snapshot()
+            peak = tracemalloc.get_traced_memory()[1]
+        finally:
+            if not already_tracing:
+                tracemalloc.stop()
+        return {
+            "mode": mode,
+            "peak_bytes": peak,
+            "retained": [{"location": str(stat.traceback), "size_bytes": stat.size, "count": stat.count}
+                         for stat in snapshot.statistics("lineno")[:top]]
+        }
+
+    raise ValueError(f"Unknown capture mode '{mode}', expected one of {CAPTURE_MODES}")
+
+def run_traced(fn, source=None, sink=None, count_regex=False, capture=None, capture_threshold=None,
+               capture_fn=None):
+    """
+    Calls fn(trace) with a fresh PipelineTrace and returns (result, record).
+    If capture is set and the document took at least capture_threshold seconds
+    (None = always), capture_fn() (default fn(None)) is run once more under the
+    capture. Pass capture_fn when fn's first run fills a cache the re-run
+    would otherwise hit.
+    The record is also passed to sink(record) when a sink is given.
+    """
+    if capture is not None and capture not in CAPTURE_MODES:
+        raise ValueError(f"Unknown capture mode '{capture}', expected one of {CAPTURE_MODES}")
+
+    trace = PipelineTrace(source=source, count_regex=count_regex)
+    with trace.document():
+        result = fn(trace)
+
+    if capture and (capture_threshold is None or trace.wall_seconds >= capture_threshold):
+        trace.capture = capture_run(capture_fn or (lambda: fn(None)), capture)
+
+    record = trace.to_dict()
+    if sink is not None:
+        sink(record)
+    return result, record
+
+# --- Sinks ---
+# A sink is any callable taking the record dict.
+
+class JsonlSink:
+    """Appends one JSON line per record to path (thread-safe within a process)."""
+
+    def __init__(self, path):
+        self.path = path
+        self._lock = threading.Lock()
+
+    def __call__(self, record):
+        line = json.dumps(record) + "\n"
+        with self._lock:
+            with open(self.path, "a") as f:
+                f.write(line)
+
+def logging_sink(logger_name="resume_parser.trace", level=None):
+    """Returns a sink that logs each record as JSON (at INFO unless level is given)."""
+    import logging
+    logger = logging.getLogger(logger_name)
+    if level is None:
+        level = logging.INFO
+    return lambda record: logger.log(level, json.dumps(record))
@@ -0,0 +1,202 @@
+import hashlib
+import marshal
+import mmap
+import os
+import tempfile
+import zlib
+
+from line_record import LINE_FIELDS, Line
+from pdf_processor import extract_lines_from_pdf
+
+# Bump whenever the line schema or extraction logic changes: old entries are
+# then ignored (different key) and eventually evicted.
+CACHE_VERSION = 3
+
+DEFAULT_MAX_BYTES = 256 * 1024 * 1024  # 256 MB
+
+
+_MAGIC = b"RLC"
+_FILE_SUFFIX = ".lines"
+
+# Eviction needs a directory scan, so only run it after this share of the
+# budget has been written since the last scan.
+_EVICT_CHECK_FRACTION = 16
+_bytes_since_evict = {}
+
+# --- Cache Keys ---
+
+def file_hash(source, chunk_size=1 << 20):
+    """
+    Returns the SHA-256 hex digest of the PDF contents.
+    source may be a path, bytes-like object, mmap or seekable binary file
+    (hashed from the start, then left at its original position).
+    """
+    digest = hashlib.sha256()
+    if isinstance(source, (str, os.PathLike)):
+        with open(source, "rb") as fp:
+            for chunk in iter(lambda: fp.read(chunk_size), b""):
+                digest.update(chunk)
+    elif isinstance(source, (bytes, bytearray, memoryview, mmap.mmap)):
+        # Hash the buffer in place, no copy
+        digest.update(source)
+    else:
+        start = source.tell()
+        source.seek(0)
+        for chunk in iter(lambda: source.read(chunk_size), b""):
+            digest.update(chunk)
+        source.seek(start)
+    return digest.hexdigest()
+
+def laparams_fingerprint(laparams=None):
+    """
+    Stable string describing the layout settings that shaped the lines.
+    pdfminer's defaults are named rather than expanded, so computing the key
+    of a cached document never imports pdfminer.
+    """
+    if laparams is None:
+        return "default"
+    items = sorted((k, repr(v)) for k, v in vars(laparams).items())
+    return ";".join(f"{k}={v}" for k, v in items)
+
+def cache_key(source, laparams=None, backend="layout"):
+    """
+    Content address of a document's extracted lines:
+    file hash + extraction backend + layout settings + cache version.
+    """
+    settings = f"v{CACHE_VERSION}|{backend}|{laparams_fingerprint(laparams)}"
+    settings_hash = hashlib.sha256(settings.encode("utf-8")).hexdigest()[:16]
+    return f"{file_hash(source)}-{settings_hash}"
+
+def _entry_path(cache_dir, key):
+    # Shard by the first two hex chars to keep directories small
+    return os.path.join(cache_dir, key[:2], key + _FILE_SUFFIX)
+
+# --- Serialization ---
+
+def encode_lines(lines):
+    """Packs lines (Line records or dicts) into a compact binary blob (zlib-compressed marshal of tuples)."""
+    rows = [tuple(l[field] for field in LINE_FIELDS) for l in lines]
+    header = _MAGIC + bytes([CACHE_VERSION, marshal.version])
+    return header + zlib.compress(marshal.dumps(rows), 6)
+
+def decode_lines(blob):
+    """Inverse of encode_lines (yields Line records). Returns None if the blob is stale or unreadable."""
+    header_len = len(_MAGIC) + 2
+    if len(blob) < header_len or blob[:len(_MAGIC)] != _MAGIC:
+        return None
+    if blob[len(_MAGIC)] != CACHE_VERSION or blob[len(_MAGIC) + 1] != marshal.version:
+        return None
+    try:
+        rows = marshal.loads(zlib.decompress(blob[header_len:]))
+    except (ValueError, EOFError, TypeError, zlib.error):
+        return None
+
+    lines = []
+    for text, font_size, bold_ratio, font_name, y, x, links, column in rows:
+        lines.append(Line(text, font_size, bold_ratio, font_name, y, x, list(links), column))
+    return lines
+
+# --- Storage ---
+
+def load_lines(cache_dir, key):
+    """Returns cached lines for key, or None on a miss. A hit refreshes the entry's LRU position."""
+    path = _entry_path(cache_dir, key)
+    try:
+        with open(path, "rb") as f:
+            blob = f.read()
+    except OSError:
+        return None
+
+    lines = decode_lines(blob)
+    if lines is None:
+        # Stale version or corrupt entry: drop it
+        try: os.remove(path)
+        except OSError: pass
+        return None
+
+    try: os.utime(path)
+    except OSError: pass
+    return lines
+
+def store_lines(cache_dir, key, lines, max_bytes=DEFAULT_MAX_BYTES):
+    """Writes lines atomically under key, then enforces the size budget."""
+    path = _entry_path(cache_dir, key)
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    blob = encode_lines(lines)
+
+    fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(path), suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(blob)
+        os.replace(tmp_path, path)
+    except OSError:
+        try: os.remove(tmp_path)
+        except OSError: pass
+        return
+
+    written = _bytes_since_evict.get(cache_dir, max_bytes) + len(blob)
+    if written >= max_bytes // _EVICT_CHECK_FRACTION:
+        evict(cache_dir, max_bytes)
+        written = 0
+    _bytes_since_evict[cache_dir] = written
+
+def evict(cache_dir, max_bytes=DEFAULT_MAX_BYTES):
+    """
+    Deletes least-recently-used entries (oldest mtime first) until the cache
+    fits in max_bytes. Returns the number of entries removed.
+    """
+    entries = []
+    total = 0
+    for shard in os.scandir(cache_dir):
+        if not shard.is_dir():
+            continue
+        for entry in os.scandir(shard.path):
+            if not entry.name.endswith(_FILE_SUFFIX):
+                continue
+            try:
+                st = entry.stat()
+            except OSError:
+                continue
+            entries.append((st.st_mtime, st.st_size, entry.path))
+            total += st.st_size
+
+    removed = 0
+    entries.sort()
+    for _, size, path in entries:
+        if total <= max_bytes:
+            break
+        try:
+            os.remove(path)
+        except OSError:
+            continue
+        total -= size
+        removed += 1
+    return removed
+
+# --- Main Entry Point ---
+
+def extract_lines_cached(source, cache_dir, laparams=None, backend="layout", max_bytes=DEFAULT_MAX_BYTES,
+                         stats=None):
+    """
+    Drop-in replacement for extract_lines_from_pdf backed by the on-disk cache.
+    Re-parsing a known document skips pdfminer entirely.
+    stats, if a dict, gets "cache_hits"/"cache_misses" bumped (and "pages" on a miss).
+    """
+    try:
+        key = cache_key(source, laparams, backend)
+    except OSError as e:
+        print(f"Error reading PDF: {e}")
+        return []
+
+    lines = load_lines(cache_dir, key)
+    if stats is not None:
+        outcome = "cache_hits" if lines is not None else "cache_misses"
+        stats[outcome] = stats.get(outcome, 0) + 1
+    if lines is not None:
+        return lines
+
+    lines = extract_lines_from_pdf(source, laparams=laparams, backend=backend, stats=stats)
+    # Failed extractions return [] and are not worth caching
+    if lines:
+        store_lines(cache_dir, key, lines, max_bytes=max_bytes)
+    return lines
@@ -0,0 +1,106 @@
+# --- Compact Line Record ---
+# Every extracted line used to be a dict with 7-9 keys. A slotted object
+# stores the same fields in a fixed-size struct (no per-line hash table),
+# and keeps dict-style access so extractors and scripts written against
+# line dicts work unchanged.
+
+# Fields produced by the physical layer (pdf_processor / line_cache), in order.
+# column: text column of the line on its page (see pdf_processor column
+# detection); 0 for single-column pages and lines spanning the columns.
+LINE_FIELDS = ("text", "font_size", "bold_ratio", "font_name", "y", "x", "links", "column")
+
+# Classification fields callers may tag lines with (section_parser itself
+# no longer writes to lines, see find_section_spans)
+SECTION_FIELDS = ("is_header", "section")
+
+_KNOWN_FIELDS = frozenset(LINE_FIELDS + SECTION_FIELDS)
+
+class Line:
+    """
+    One text line: text, font_size, bold_ratio, font_name, y, x, links, column
+    (+ optional is_header / section tags).
+    Behaves like the old line dict for reads and writes: line["text"],
+    line.get("is_header"), "section" in line, dict(line), line == {...}.
+    Unset section fields behave like missing keys.
+    """
+
+    __slots__ = LINE_FIELDS + SECTION_FIELDS
+
+    def __init__(self, text, font_size, bold_ratio, font_name, y, x, links, column=0):
+        self.text = text
+        self.font_size = font_size
+        self.bold_ratio = bold_ratio
+        self.font_name = font_name
+        self.y = y
+        self.x = x
+        self.links = links
+        self.column = column
+
+    @classmethod
+    def from_dict(cls, data):
+        """
+        Builds a Line from a line dict; keys other than the known fields are
+        dropped. Dicts from before column detection get column 0.
+        """
+        line = cls(*(data[field] for field in LINE_FIELDS[:-1]), data.get("column", 0))
+        for field in SECTION_FIELDS:
+            if field in data:
+                setattr(line, field, data[field])
+        return line
+
+    # --- Dict Compatibility ---
+
+    def __getitem__(self, key):
+        if key not in _KNOWN_FIELDS:
+            raise KeyError(key)
+        try:
+            return getattr(self, key)
+        except AttributeError:
+            raise KeyError(key) from None
+
+    def __setitem__(self, key, value):
+        if key not in _KNOWN_FIELDS:
+            raise KeyError(f"Line has no field '{key}'")
+        setattr(self, key, value)
+
+    def __contains__(self, key):
+        return key in _KNOWN_FIELDS and hasattr(self, key)
+
+    def get(self, key, default=None):
+        try:
+            return self[key]
+        except KeyError:
+            return default
+
+    def keys(self):
+        return [field for field in self.__slots__ if hasattr(self, field)]
+
+    def items(self):
+        return [(field, getattr(self, field)) for field in self.keys()]
+
+    def __iter__(self):
+        return iter(self.keys())
+
+    def __len__(self):
+        return len(self.keys())
+
+    def to_dict(self):
+        return dict(self.items())
+
+    def __eq__(self, other):
+        if isinstance(other, Line):
+            return self.items() == other.items()
+        if isinstance(other, dict):
+            return self.to_dict() == other
+        return NotImplemented
+
+    __hash__ = None  # mutable, like the dicts it replaces
+
+    def __repr__(self):
+        return f"Line({self.to_dict()!r})"
+
+def json_default(obj):
+    """json.dump default= hook: Lines become plain dicts, anything else str()."""
+    if isinstance(obj, Line):
+        return obj.to_dict()
+    return str(obj)
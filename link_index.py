@@ -0,0 +1,81 @@
+import math
+
+# --- Spatial Index for Link Rectangles ---
+# Link annotations are bucketed into horizontal bands of fixed height on the
+# y-axis. A text line only tests the links registered in the bands it spans,
+# instead of every link on the page.
+
+BAND_HEIGHT = 12.0  # points; roughly one line of body text
+MAX_BANDS_PER_LINK = 256  # taller rects (or bogus coordinates) are always checked
+LINEAR_SCAN_MAX_LINKS = 16  # below this, a plain scan beats building the index
+
+def _band_range(y_a, y_b, band_height):
+    low, high = (y_a, y_b) if y_a <= y_b else (y_b, y_a)
+    return math.floor(low / band_height), math.floor(high / band_height)
+
+def build_link_index(page_links, band_height=BAND_HEIGHT):
+    """
+    Indexes a page's links ({'bbox': [x0, y0, x1, y1], 'uri': ...}) by y-band.
+    """
+    index = {
+        "links": page_links,
+        "band_height": band_height,
+        "bands": {},  # band number -> [link positions in page_links]
+        "wide": []    # link positions that must be checked for every line
+    }
+
+    if len(page_links) < LINEAR_SCAN_MAX_LINKS:
+        index["bands"] = None
+        return index
+
+    for pos, link in enumerate(page_links):
+        try:
+            first, last = _band_range(link['bbox'][1], link['bbox'][3], band_height)
+        except (TypeError, ValueError, OverflowError, IndexError):
+            index["wide"].append(pos)
+            continue
+
+        if last - first >= MAX_BANDS_PER_LINK:
+            index["wide"].append(pos)
+            continue
+
+        for band in range(first, last + 1):
+            index["bands"].setdefault(band, []).append(pos)
+
+    return index
+
+def find_line_links(index, bbox):
+    """
+    Returns the URIs of all links overlapping the line bbox (x0, y0, x1, y1),
+    in the same order as the page's link list.
+    """
+    links = index["links"]
+    if not links:
+        return []
+
+    tx0, ty0, tx1, ty1 = bbox
+    candidates = range(len(links))
+    bands = index["bands"]
+    if bands is not None:
+        try:
+            first, last = _band_range(ty0, ty1, index["band_height"])
+        except (TypeError, ValueError, OverflowError):
+            first, last = 0, MAX_BANDS_PER_LINK
+        if last - first < MAX_BANDS_PER_LINK:
+            hits = set(index["wide"])
+            for band in range(first, last + 1):
+                hits.update(bands.get(band, ()))
+            candidates = sorted(hits)
+
+    found_links = []
+    for pos in candidates:
+        link = links[pos]
+        lx0, ly0, lx1, ly1 = link['bbox']
+
+        # Check if rectangles overlap
+        # (Left of one < Right of other) AND (Bottom of one < Top of other)
+        if (tx0 < lx1 and tx1 > lx0 and
+            ty0 < ly1 and ty1 > ly0):
+            found_links.append(link['uri'])
+
+    return found_links
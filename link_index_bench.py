@@ -0,0 +1,74 @@
+import argparse
+import random
+import timeit
+
+from link_index import build_link_index, find_line_links
+
+PAGE_WIDTH, PAGE_HEIGHT = 612.0, 792.0
+
+def make_synthetic_page(num_links=500, num_lines=200, seed=0):
+    """
+    Builds a link-heavy page: lines stacked top-down at a fixed leading and
+    small link rectangles scattered over them (publication-list style).
+    """
+    rng = random.Random(seed)
+    leading = (PAGE_HEIGHT - 72) / num_lines
+
+    lines = []
+    for i in range(num_lines):
+        y0 = PAGE_HEIGHT - 36 - (i + 1) * leading
+        x0 = 36 + rng.random() * 20
+        lines.append((x0, y0, x0 + 200 + rng.random() * 320, y0 + leading * 0.8))
+
+    links = []
+    for i in range(num_links):
+        x0 = 36 + rng.random() * 480
+        y0 = 36 + rng.random() * (PAGE_HEIGHT - 72)
+        links.append({'bbox': [x0, y0, x0 + 20 + rng.random() * 80, y0 + 4 + rng.random() * 8],
+                      'uri': f"https://example.com/paper/{i}"})
+
+    return lines, links
+
+def naive_line_links(page_links, bbox):
+    """The original O(lines x links) scan, kept as the reference."""
+    found_links = []
+    tx0, ty0, tx1, ty1 = bbox
+    for link in page_links:
+        lx0, ly0, lx1, ly1 = link['bbox']
+        if (tx0 < lx1 and tx1 > lx0 and
+            ty0 < ly1 and ty1 > ly0):
+            found_links.append(link['uri'])
+    return found_links
+
+def main():
+    arg_parser = argparse.ArgumentParser(description="Micro-benchmark: link overlap with and without the y-band index.")
+    arg_parser.add_argument("--links", type=int, default=500)
+    arg_parser.add_argument("--lines", type=int, default=200)
+    arg_parser.add_argument("-n", "--number", type=int, default=20, help="Pages processed per timing run")
+    args = arg_parser.parse_args()
+
+    lines, links = make_synthetic_page(args.links, args.lines)
+
+    def run_naive():
+        return [naive_line_links(links, bbox) for bbox in lines]
+
+    def run_indexed():
+        # Index construction is part of the per-page cost
+        index = build_link_index(links)
+        return [find_line_links(index, bbox) for bbox in lines]
+
+    if run_naive() != run_indexed():
+        print("Error: indexed results differ from the naive scan.")
+        return
+
+    naive_time = min(timeit.repeat(run_naive, number=args.number, repeat=5)) / args.number
+    indexed_time = min(timeit.repeat(run_indexed, number=args.number, repeat=5)) / args.number
+
+    print(f"Synthetic page: {args.links} links x {args.lines} lines "
+          f"({sum(len(r) for r in run_naive())} overlaps)")
+    print(f"  naive scan : {naive_time * 1000:.3f} ms/page")
+    print(f"  band index : {indexed_time * 1000:.3f} ms/page")
+    print(f"  speedup    : {naive_time / indexed_time:.1f}x")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,239 @@
+import argparse
+import json
+import os
+import threading
+import time
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from email import policy
+from email.parser import BytesParser
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from batch_parser import DEFAULT_TIMEOUT, init_worker, parse_document
+from pdf_processor import BACKENDS
+
+MAX_UPLOAD_BYTES = 20 * 1024 * 1024  # 20 MB
+LATENCY_WINDOW = 1000  # recent requests kept for latency percentiles
+
+# HTTP status per worker record status
+STATUS_CODES = {"ok": 200, "empty": 422, "error": 500, "timeout": 504}
+
+# --- Shared Server State ---
+
+class ServiceState:
+    """
+    Worker pool, admission control and metrics shared by all request threads.
+    """
+
+    def __init__(self, workers, max_pending, timeout, backend):
+        self.workers = workers
+        self.max_pending = max_pending
+        self.timeout = timeout
+        self.worker_options = {"timeout": timeout, "backend": backend}
+        # Workers import the whole pipeline once and stay warm across requests
+        self.pool = self._new_pool()
+        # Requests admitted = running in a worker + waiting for one
+        self.slots = threading.BoundedSemaphore(max_pending)
+        self.lock = threading.Lock()
+        self.started = time.time()
+        self.in_flight = 0
+        self.counts = {"requests": 0, "rejected": 0, "ok": 0, "empty": 0, "error": 0, "timeout": 0}
+        self.latencies = deque(maxlen=LATENCY_WINDOW)
+
+    def _new_pool(self):
+        return ProcessPoolExecutor(max_workers=self.workers, initializer=init_worker,
+                                   initargs=(self.worker_options,))
+
+    def parse(self, data):
+        """
+        Parses one upload in the pool and returns its record. If a worker died
+        (e.g. killed for memory) the pool is replaced before BrokenProcessPool
+        is re-raised, so only the requests in flight at that moment fail.
+        """
+        pool = self.pool
+        try:
+            return pool.submit(parse_document, data).result()
+        except BrokenProcessPool:
+            with self.lock:
+                if self.pool is pool:
+                    self.pool = self._new_pool()
+            pool.shutdown(wait=False, cancel_futures=True)
+            raise
+
+    def record(self, status, seconds):
+        with self.lock:
+            self.counts[status] += 1
+            self.latencies.append(seconds)
+
+    def metrics(self):
+        with self.lock:
+            latencies = sorted(self.latencies)
+            counts = dict(self.counts)
+            in_flight = self.in_flight
+
+        def percentile(p):
+            if not latencies:
+                return None
+            return round(latencies[min(len(latencies) - 1, int(p / 100 * len(latencies)))], 4)
+
+        return {
+            "uptime_seconds": round(time.time() - self.started, 1),
+            "workers": self.workers,
+            "max_pending": self.max_pending,
+            "in_flight": in_flight,
+            "counts": counts,
+            "latency_seconds": {"p50": percentile(50), "p90": percentile(90), "p99": percentile(99)}
+        }
+
+def _warm_up():
+    """Forces every worker process to start, and so run init_worker's warm-up, before the first request arrives."""
+    return os.getpid()
+
+# --- HTTP Layer ---
+
+def read_upload(handler, length):
+    """
+    Returns the uploaded PDF bytes from either a raw body (application/pdf,
+    application/octet-stream) or the first file part of a multipart/form-data body.
+    """
+    body = handler.rfile.read(length)
+    content_type = handler.headers.get("Content-Type", "")
+
+    if content_type.startswith("multipart/form-data"):
+        message = BytesParser(policy=policy.default).parsebytes(
+            f"Content-Type: {content_type}\r\n\r\n".encode("latin-1") + body)
+        for part in message.iter_parts():
+            if part.get_filename() or part.get_content_type() == "application/pdf":
+                return part.get_payload(decode=True)
+        return None
+
+    return body
+
+class ParseRequestHandler(BaseHTTPRequestHandler):
+    server_version = "ResumeParser/1.0"
+    state = None  # ServiceState, set by make_server
+
+    def _send_json(self, code, payload, headers=None):
+        body = json.dumps(payload).encode("utf-8")
+        self.send_response(code)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        for key, value in (headers or {}).items():
+            self.send_header(key, value)
+        self.end_headers()
+        self.wfile.write(body)
+
+    def do_GET(self):
+        if self.path == "/health":
+            self._send_json(200, {"status": "ok", "workers": self.state.workers})
+        elif self.path == "/metrics":
+            self._send_json(200, self.state.metrics())
+        else:
+            self._send_json(404, {"error": "Not found"})
+
+    def do_POST(self):
+        if self.path != "/parse":
+            self._send_json(404, {"error": "Not found"})
+            return
+
+        state = self.state
+        try:
+            length = int(self.headers.get("Content-Length") or 0)
+        except ValueError:
+            self._send_json(400, {"error": "Invalid Content-Length"})
+            return
+        if length <= 0:
+            self._send_json(400, {"error": "Empty request body"})
+            return
+        if length > MAX_UPLOAD_BYTES:
+            self._send_json(413, {"error": f"Upload exceeds {MAX_UPLOAD_BYTES} bytes"})
+            return
+
+        with state.lock:
+            state.counts["requests"] += 1
+
+        # Backpressure: refuse instead of queueing without bound
+        if not state.slots.acquire(blocking=False):
+            with state.lock:
+                state.counts["rejected"] += 1
+            self._send_json(503, {"error": "Server busy, retry later"}, headers={"Retry-After": "1"})
+            return
+
+        start = time.perf_counter()
+        with state.lock:
+            state.in_flight += 1
+        try:
+            data = read_upload(self, length)
+            if not data:
+                self._send_json(400, {"error": "No PDF found in request"})
+                return
+
+            # The upload goes to the worker as bytes: no temp file round trip
+            try:
+                record = state.parse(data)
+            except BrokenProcessPool:
+                state.record("error", time.perf_counter() - start)
+                self._send_json(503, {"error": "Worker crashed, retry later"}, headers={"Retry-After": "1"})
+                return
+            except Exception as e:
+                state.record("error", time.perf_counter() - start)
+                self._send_json(500, {"error": f"{type(e).__name__}: {e}"})
+                return
+            state.record(record["status"], time.perf_counter() - start)
+
+            if record["status"] == "ok":
+                self._send_json(200, record["result"])
+            else:
+                self._send_json(STATUS_CODES[record["status"]], {"error": record["error"]})
+        finally:
+            with state.lock:
+                state.in_flight -= 1
+            state.slots.release()
+
+    def log_message(self, format, *args):
+        # Request logging goes through the metrics endpoint instead of stderr
+        pass
+
+def make_server(host, port, workers=None, queue_size=None, timeout=DEFAULT_TIMEOUT, backend="layout"):
+    """
+    Builds the HTTP server and its warm worker pool (not yet serving).
+    queue_size is the number of requests allowed to wait for a free worker.
+    """
+    workers = workers or os.cpu_count() or 1
+    queue_size = workers * 2 if queue_size is None else queue_size
+    state = ServiceState(workers, workers + queue_size, timeout, backend)
+
+    for future in [state.pool.submit(_warm_up) for _ in range(workers)]:
+        future.result()
+
+    handler = type("BoundParseRequestHandler", (ParseRequestHandler,), {"state": state})
+    server = ThreadingHTTPServer((host, port), handler)
+    server.daemon_threads = True
+    server.state = state
+    return server
+
+def main():
+    arg_parser = argparse.ArgumentParser(description="Serve resume parsing over HTTP with warm worker processes.")
+    arg_parser.add_argument("--host", default="127.0.0.1")
+    arg_parser.add_argument("--port", type=int, default=8000)
+    arg_parser.add_argument("-j", "--workers", type=int, default=None, help="Worker processes (default: CPU count)")
+    arg_parser.add_argument("--queue", type=int, default=None, help="Requests allowed to wait for a worker (default: 2x workers)")
+    arg_parser.add_argument("--timeout", type=float, default=DEFAULT_TIMEOUT, help="Per-document timeout in seconds (0 disables)")
+    arg_parser.add_argument("--backend", choices=BACKENDS, default="layout", help="Line extraction backend")
+    args = arg_parser.parse_args()
+
+    server = make_server(args.host, args.port, workers=args.workers, queue_size=args.queue,
+                         timeout=args.timeout, backend=args.backend)
+    print(f"Serving on http://{args.host}:{args.port} "
+          f"(POST /parse, GET /health, GET /metrics) with {server.state.workers} worker(s)")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+        server.state.pool.shutdown(cancel_futures=True)
+
+if __name__ == "__main__":
+    main()
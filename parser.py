@@ -1,95 +1,121 @@
 import json
 import os
+import sys
 
 # --- Import Physical & Logical Layers ---
+# pdfminer itself is only imported once a page is laid out (see pdf_processor)
 from pdf_processor import extract_lines_from_pdf
-from section_parser import process_lines_to_sections
-from subsection_parser import extract_subsections
+from line_cache import cache_key, extract_lines_cached
+from section_parser import SectionSpan, find_section_spans, process_lines_to_sections, sections_view
 
 # --- Import Specific Extractors ---
-# Ensure these filenames match exactly what you saved
-from extract_contact import extract_contacts
-from extract_edu import extract_education_details
-from rank_extract import extract_ranks
-from skill_extract import extract_skills
+# Contacts are needed by every run. The section extractors are imported by
+# the stage that runs them and compile their pattern tables on first use,
+# so e.g. contact-only or edu-only runs never load the others.
+from extract_contact import HEADER_SCOPE_LINES, extract_contacts
 
-def main():
-    # Replace with your actual PDF filename
-    pdf_filename = "ankeet.pdf" 
-    
-    if not os.path.exists(pdf_filename):
-        print(f"Error: File '{pdf_filename}' not found.")
-        return
+from instrumentation import CAPTURE_MODES, run_traced, stage_timer
 
-    print(f"Processing {pdf_filename}...")
+# Extractors parse_resume can run, in output order. "subsections" structures
+# the experience/projects/positions entries of final_output["resume"].
+EXTRACTORS = ("contact", "edu", "rank", "skill", "subsections")
 
-    # 1. Physical Layer: Extract Raw Lines & Links
-    raw_lines = extract_lines_from_pdf(pdf_filename)
-    
-    if not raw_lines:
-        print("No text extracted from PDF.")
+# Section types whose extractor works on the section's lines
+SECTION_EXTRACTORS = {"education": "edu", "achievements": "rank", "skills": "skill"}
+SUBSECTION_TYPES = ("experience", "projects", "positions")
+
+def _select_extractors(extractors):
+    if extractors is None:
+        return set(EXTRACTORS)
+    selected = set(extractors)
+    unknown = selected.difference(EXTRACTORS)
+    if unknown:
+        raise ValueError(f"Unknown extractor(s): {', '.join(sorted(unknown))} (expected {EXTRACTORS})")
+    return selected
+
+def _contact_only(sections, selected):
+    return selected == {"contact"} and sections is not None and not sections
+
+def check_header_band(header_band, sections=(), extractors=("contact",)):
+    """
+    Raises ValueError unless header_band is None, or in (0, 1] on a
+    contact-only run (the only mode that crops pages, see parse_contact_header).
+    """
+    if header_band is None:
         return
+    if not _contact_only(sections, _select_extractors(extractors)):
+        raise ValueError("header_band only applies to contact-only runs (sections=(), extractors=('contact',))")
+    if not 0 < header_band <= 1:
+        raise ValueError(f"header_band must be in (0, 1], got {header_band}")
 
-    # 2. Logical Layer: Group Lines into Sections
-    sections = process_lines_to_sections(raw_lines)
+def section_type_of(section_key):
+    # Identify section type (e.g., "experience-Work Experience" -> "experience")
+    # "misc_0" remains "misc_0"
+    return section_key.split('-')[0] if '-' in section_key else section_key
 
-    # 3. Initialize Final Output Structure
-    final_output = {
-        "extracted": {
-            "contact": {},
-            "edu": {},
-            "rank": [],
-            "skill": {}
-        },
-        "resume": {}
-    }
+def extract_section_fields(name, sections_map, trace=None):
+    """
+    Runs the section extractor `name` ("edu", "rank" or "skill") over every
+    section of its type and merges the results into final_output["extracted"][name].
+    """
+    stage = stage_timer(trace)
+    merged = [] if name == "rank" else {}
 
-    # --- GLOBAL EXTRACTION (Contact Info) ---
-    # Contacts are extracted from the raw lines (usually header area)
-    final_output["extracted"]["contact"] = extract_contacts(raw_lines)
+    for section_key, lines_list in sections_map.items():
+        section_type = section_type_of(section_key)
 
-    # --- SECTION-SPECIFIC PROCESSING ---
-    for section_key, lines_list in sections.items():
-        # Identify section type (e.g., "experience-Work Experience" -> "experience")
-        # "misc_0" remains "misc_0"
-        section_type = section_key.split('-')[0] if '-' in section_key else section_key
-        
-        # ---------------------------------------------------------
-        # A. POPULATE "EXTRACTED" (Structured Data)
-        # ---------------------------------------------------------
-        
-        if section_type == "education":
+        if section_type == "education" and name == "edu":
             # Extract IIT College, Degree, Branch
-            edu_info = extract_education_details(lines_list)
+            from extract_edu import extract_education_details
+            with stage("extract_education_details"):
+                edu_info = extract_education_details(lines_list)
             # Update if valid info found
             if edu_info.get("college") or edu_info.get("degree"):
-                final_output["extracted"]["edu"].update(edu_info)
+                merged.update(edu_info)
 
-        elif section_type == "achievements":
+        elif section_type == "achievements" and name == "rank":
             # Extract Exam Ranks
-            ranks = extract_ranks(lines_list)
-            final_output["extracted"]["rank"].extend(ranks)
+            from rank_extract import extract_ranks
+            with stage("extract_ranks"):
+                ranks = extract_ranks(lines_list)
+            merged.extend(ranks)
 
-        elif section_type == "skills":
+        elif section_type == "skills" and name == "skill":
             # Extract Skills using Database
-            skills = extract_skills(lines_list)
+            from skill_extract import extract_skills
+            with stage("extract_skills"):
+                skills = extract_skills(lines_list)
             # Merge dictionary to handle multiple skill sections if they exist
             for cat, s_list in skills.items():
-                if cat in final_output["extracted"]["skill"]:
-                    existing = set(final_output["extracted"]["skill"][cat])
+                if cat in merged:
+                    existing = set(merged[cat])
                     existing.update(s_list)
-                    final_output["extracted"]["skill"][cat] = list(existing)
+                    merged[cat] = list(existing)
                 else:
-                    final_output["extracted"]["skill"][cat] = s_list
+                    merged[cat] = s_list
+
+    return merged
+
+def build_resume(sections_map, wanted_sections=None, subsections=True, trace=None):
+    """
+    final_output["resume"]: section key -> text lines, or title/details
+    entries for SUBSECTION_TYPES when subsections is on.
+    wanted_sections: section types to keep (None keeps all).
+    """
+    stage = stage_timer(trace)
+    resume = {}
+
+    for section_key, lines_list in sections_map.items():
+        section_type = section_type_of(section_key)
+        if wanted_sections is not None and section_type not in wanted_sections:
+            continue
 
-        # ---------------------------------------------------------
-        # B. POPULATE "RESUME" (Structure & Content)
-        # ---------------------------------------------------------
-        
         # Apply Subsection Logic ONLY for Experience, Projects, Positions
-        if section_type in ["experience", "projects", "positions"]:
-            structured_subsections = extract_subsections(lines_list)
-            
+        if section_type in SUBSECTION_TYPES and subsections:
+            from subsection_parser import extract_subsections
+            with stage("extract_subsections"):
+                structured_subsections = extract_subsections(lines_list)
+
             # Clean up output: formatted title + list of details (text only)
             clean_content = []
             for sub in structured_subsections:
@@ -97,16 +123,321 @@ def main():
                     "title": sub.get("title", "Untitled"),
                     "details": [l["text"] for l in sub.get("content", [])]
                 })
-            
-            final_output["resume"][section_key] = clean_content
-        
+
+            resume[section_key] = clean_content
+
         else:
             # For other sections (Skills, Education, Header, etc.), store simple text list.
             # This preserves the Resume structure without forcing subsections where they don't fit.
-            final_output["resume"][section_key] = [l["text"] for l in lines_list]
+            resume[section_key] = [l["text"] for l in lines_list]
+
+    return resume
+
+def _needs_sections(selected, wanted_sections):
+    return wanted_sections is None or bool(wanted_sections) or \
+        any(name in selected for name in SECTION_EXTRACTORS.values())
+
+def build_final_output(raw_lines, sections=None, extractors=None, trace=None):
+    """
+    Runs the logical layer and the selected extractors over already-extracted lines.
+    sections: section types kept in final_output["resume"] (None keeps all, () none).
+    extractors: names from EXTRACTORS to run (None runs all).
+    Stages whose output is not requested are skipped, including section
+    grouping when nothing needs it.
+    trace: optional instrumentation.PipelineTrace timing each stage.
+    """
+    selected = _select_extractors(extractors)
+    stage = stage_timer(trace)
+    wanted_sections = None if sections is None else set(sections)
+
+    # 3. Initialize Final Output Structure
+    final_output = {
+        "extracted": {name: ({} if name in ("contact", "edu", "skill") else [])
+                      for name in ("contact", "edu", "rank", "skill") if name in selected},
+        "resume": {}
+    }
+
+    # 2. Logical Layer: Group Lines into Sections
+    sections_map = {}
+    if _needs_sections(selected, wanted_sections):
+        with stage("process_lines_to_sections"):
+            sections_map = process_lines_to_sections(raw_lines)
+    if trace is not None:
+        trace.count("lines", len(raw_lines))
+        trace.count("sections", len(sections_map))
+
+    # --- GLOBAL EXTRACTION (Contact Info) ---
+    # Contacts are extracted from the raw lines (usually header area)
+    if "contact" in selected:
+        with stage("extract_contacts"):
+            final_output["extracted"]["contact"] = extract_contacts(raw_lines)
+
+    # --- SECTION-SPECIFIC PROCESSING ---
+    # A. POPULATE "EXTRACTED" (Structured Data)
+    for name in SECTION_EXTRACTORS.values():
+        if name in selected:
+            final_output["extracted"][name] = extract_section_fields(name, sections_map, trace)
+
+    # B. POPULATE "RESUME" (Structure & Content)
+    final_output["resume"] = build_resume(sections_map, wanted_sections, "subsections" in selected, trace)
+
+    return final_output
+
+def build_final_output_incremental(doc, fingerprints, sections=None, extractors=None, trace=None):
+    """
+    build_final_output over a stored artifact document (see artifact_store):
+    stage outputs whose fingerprint is current are reused, the others are
+    recomputed and written back into doc. The "lines" stage must be current.
+    Returns (final_output, names of the recomputed stages).
+    """
+    from artifact_store import get_stage, lines_from_payload, put_stage
+    selected = _select_extractors(extractors)
+    stage = stage_timer(trace)
+    wanted_sections = None if sections is None else set(sections)
+    recomputed = []
+
+    def cached(name, compute):
+        payload = get_stage(doc, name, fingerprints)
+        if payload is None:
+            payload = compute()
+            put_stage(doc, name, fingerprints, payload)
+            recomputed.append(name)
+        return payload
+
+    def compute_spans():
+        with stage("process_lines_to_sections"):
+            return [tuple(span) for span in find_section_spans(raw_lines)]
+
+    def compute_contacts():
+        with stage("extract_contacts"):
+            return extract_contacts(raw_lines)
+
+    raw_lines = lines_from_payload(get_stage(doc, "lines", fingerprints))
+    final_output = {"extracted": {}, "resume": {}}
+
+    sections_map = {}
+    if _needs_sections(selected, wanted_sections):
+        spans = cached("sections", compute_spans)
+        sections_map = sections_view(raw_lines, [SectionSpan(*span) for span in spans])
+    if trace is not None:
+        trace.count("lines", len(raw_lines))
+        trace.count("sections", len(sections_map))
+
+    if "contact" in selected:
+        final_output["extracted"]["contact"] = cached("contact", compute_contacts)
+    for name in SECTION_EXTRACTORS.values():
+        if name in selected:
+            final_output["extracted"][name] = cached(
+                name, lambda: extract_section_fields(name, sections_map, trace))
+
+    if "subsections" in selected:
+        # Stored for every section; the section selection is applied on the way out
+        resume = cached("resume", lambda: build_resume(sections_map, None, True, trace))
+        final_output["resume"] = {key: value for key, value in resume.items()
+                                  if wanted_sections is None or section_type_of(key) in wanted_sections}
+    else:
+        final_output["resume"] = build_resume(sections_map, wanted_sections, False, trace)
+
+    return final_output, recomputed
+
+def parse_resume_incremental(source, artifact_dir, *, sections=None, extractors=None, backend="layout",
+                             trace=None, fingerprints=None):
+    """
+    parse_resume backed by the artifact store in artifact_dir: a known document
+    only reruns the stages whose code or data tables changed since it was stored
+    (all of them, including PDF extraction, the first time).
+    fingerprints: artifact_store.stage_fingerprints() result (default: computed once per process).
+    Returns final_output, or None if no text could be extracted.
+    """
+    from artifact_store import (current_fingerprints, get_stage, lines_to_payload, load_document, new_document,
+                                put_stage, save_document)
+    if fingerprints is None:
+        fingerprints = current_fingerprints()
+    key = cache_key(source, backend=backend)
+    doc = load_document(artifact_dir, key) or new_document(source, backend)
+    recomputed = []
+
+    if get_stage(doc, "lines", fingerprints) is None:
+        stats = trace.counters if trace is not None else None
+        with stage_timer(trace)("extract_lines_from_pdf"):
+            raw_lines = extract_lines_from_pdf(source, backend=backend, stats=stats)
+        if not raw_lines:
+            return None
+        put_stage(doc, "lines", fingerprints, lines_to_payload(raw_lines))
+        recomputed.append("lines")
+    if isinstance(source, str) and doc["source"] != source:
+        # Keep a readable path so refreshes can re-extract lines when needed
+        doc["source"] = source
+        recomputed.append("source")
+
+    final_output, stages = build_final_output_incremental(doc, fingerprints, sections=sections,
+                                                          extractors=extractors, trace=trace)
+    recomputed.extend(stages)
+    if recomputed:
+        save_document(artifact_dir, key, doc)
+    if trace is not None:
+        trace.count("artifacts_recomputed", len(recomputed))
+    return final_output
+
+def parse_contact_header(source, backend="layout", header_band=None, trace=None):
+    """
+    Header-only mode: lays out pages lazily and stops as soon as the contact
+    scope (HEADER_SCOPE_LINES lines) has been produced, usually within page 1.
+    header_band (0-1] additionally crops page 1 to its top share before layout
+    analysis; if that misses the email or the phone, the exact scope is re-read.
+    Returns final_output with only the contact block, or None if no text.
+    """
+    check_header_band(header_band)
+    stage = stage_timer(trace)
+    stats = trace.counters if trace is not None else None
+
+    raw_lines = []
+    if header_band is not None:
+        with stage("extract_lines_from_pdf"):
+            raw_lines = extract_lines_from_pdf(source, max_pages=1, max_lines=HEADER_SCOPE_LINES,
+                                               backend=backend, top_band=header_band, stats=stats)
+        with stage("extract_contacts"):
+            contacts = extract_contacts(raw_lines)
+        if not (contacts["email"] and contacts["phone"]):
+            raw_lines = []
+
+    if not raw_lines:
+        with stage("extract_lines_from_pdf"):
+            raw_lines = extract_lines_from_pdf(source, max_lines=HEADER_SCOPE_LINES, backend=backend, stats=stats)
+        if not raw_lines:
+            return None
+        with stage("extract_contacts"):
+            contacts = extract_contacts(raw_lines)
+
+    if trace is not None:
+        trace.count("lines", len(raw_lines))
+
+    return {"extracted": {"contact": contacts}, "resume": {}}
+
+def parse_resume(source, *, sections=None, extractors=None, cache_dir=None, backend="layout",
+                 header_band=None, artifact_dir=None, trace=None):
+    """
+    Full pipeline for a single PDF: physical layer, logical layer, extractors.
+    source may be a path, bytes/memoryview, mmap or seekable binary file object,
+    so uploads can be parsed straight from memory.
+    sections / extractors select what is computed (see build_final_output), e.g.
+    parse_resume(path, sections=(), extractors=("contact", "rank")) for screening.
+    Returns the final_output dictionary, or None if no text could be extracted.
+    With cache_dir set, extracted lines are reused across runs (see line_cache).
+    With artifact_dir set, every stage output is stored and reused until its
+    code or data tables change (see parse_resume_incremental).
+    Contact-only requests (sections=(), extractors=("contact",)) run in
+    header-only mode (see parse_contact_header) and bypass both caches;
+    header_band is only accepted there (ValueError otherwise).
+    trace: optional instrumentation.PipelineTrace (see parse_resume_traced).
+    """
+    # Fail on a bad selection before paying for extraction
+    selected = _select_extractors(extractors)
+    check_header_band(header_band, sections, extractors)
+
+    if _contact_only(sections, selected):
+        return parse_contact_header(source, backend=backend, header_band=header_band, trace=trace)
+
+    if artifact_dir:
+        return parse_resume_incremental(source, artifact_dir, sections=sections, extractors=extractors,
+                                        backend=backend, trace=trace)
+
+    # 1. Physical Layer: Extract Raw Lines & Links
+    stats = trace.counters if trace is not None else None
+    with stage_timer(trace)("extract_lines_from_pdf"):
+        if cache_dir:
+            raw_lines = extract_lines_cached(source, cache_dir, backend=backend, stats=stats)
+        else:
+            raw_lines = extract_lines_from_pdf(source, backend=backend, stats=stats)
+
+    if not raw_lines:
+        return None
+
+    return build_final_output(raw_lines, sections=sections, extractors=extractors, trace=trace)
+
+def parse_resume_traced(source, *, sink=None, count_regex=False, capture=None, capture_threshold=None,
+                        **options):
+    """
+    parse_resume with instrumentation: returns (final_output, trace record).
+    The record holds wall/CPU time per stage, page/line/section counts and,
+    with count_regex, compiled-regex calls per stage. capture ("cprofile" or
+    "tracemalloc") re-runs documents slower than capture_threshold seconds
+    under that tool and stores the summary in record["capture"].
+    The capture run bypasses cache_dir / artifact_dir, which the first run
+    has just filled, so it profiles the parse itself rather than a cache hit.
+    sink, if given, also receives the record (see instrumentation sinks).
+    """
+    label = source if isinstance(source, str) else None
+    uncached = {name: value for name, value in options.items() if name not in ("cache_dir", "artifact_dir")}
+    return run_traced(lambda trace: parse_resume(source, trace=trace, **options), source=label, sink=sink,
+                      count_regex=count_regex, capture=capture, capture_threshold=capture_threshold,
+                      capture_fn=lambda: parse_resume(source, **uncached))
+
+def parse_name_list(value):
+    """Splits a comma-separated CLI value ("contact,rank"); None stays None (= all)."""
+    return None if value is None else [name.strip() for name in value.split(",") if name.strip()]
+
+def main():
+    # CLI-only dependency: library callers (servers, workers) never need it
+    import argparse
+    arg_parser = argparse.ArgumentParser(description="Parse a resume PDF into structured JSON.")
+    # Replace with your actual PDF filename
+    arg_parser.add_argument("pdf", nargs="?", default="ankeet.pdf", help="Resume PDF to parse")
+    arg_parser.add_argument("-o", "--output", default="parsed_resume.json", help="JSON output path")
+    arg_parser.add_argument("--extractors", default=None,
+                            help=f"Comma-separated extractors to run (default: all of {','.join(EXTRACTORS)})")
+    arg_parser.add_argument("--sections", default=None,
+                            help="Comma-separated section types to keep in 'resume' (default: all, '' for none)")
+    arg_parser.add_argument("--header-band", type=float, default=None,
+                            help="Contact-only runs: lay out just this top share of page 1 (e.g. 0.3)")
+    arg_parser.add_argument("--artifact-dir", default=None,
+                            help="Store per-stage outputs here and rerun only stages whose code or tables changed")
+    arg_parser.add_argument("--trace", action="store_true", help="Attach per-stage timings and counters as 'trace'")
+    arg_parser.add_argument("--trace-regex", action="store_true", help="Also count regex calls per stage (slower)")
+    arg_parser.add_argument("--capture", choices=CAPTURE_MODES, default=None,
+                            help="Re-run slow documents under cProfile or tracemalloc (implies --trace)")
+    arg_parser.add_argument("--capture-threshold", type=float, default=None,
+                            help="Seconds a document must take to be captured (default: always)")
+    arg_parser.add_argument("--profile-startup", action="store_true",
+                            help="Run this parse in a fresh interpreter under -X importtime and report cold-start cost")
+    args = arg_parser.parse_args()
+    pdf_filename = args.pdf
+    
+    if not os.path.exists(pdf_filename):
+        print(f"Error: File '{pdf_filename}' not found.")
+        return
+
+    if args.profile_startup:
+        from startup_profile import format_startup_report, profile_startup
+        child_args = [os.path.abspath(__file__)] + [a for a in sys.argv[1:] if a != "--profile-startup"]
+        print(format_startup_report(profile_startup(child_args)))
+        return
+
+    print(f"Processing {pdf_filename}...")
+
+    options = {"sections": parse_name_list(args.sections), "extractors": parse_name_list(args.extractors),
+               "header_band": args.header_band, "artifact_dir": args.artifact_dir}
+    traced = args.trace or args.trace_regex or args.capture is not None
+    try:
+        if traced:
+            final_output, trace_record = parse_resume_traced(
+                pdf_filename, count_regex=args.trace_regex, capture=args.capture,
+                capture_threshold=args.capture_threshold, **options)
+        else:
+            final_output = parse_resume(pdf_filename, **options)
+    except ValueError as e:
+        print(f"Error: {e}")
+        return
+    
+    if final_output is None:
+        print("No text extracted from PDF.")
+        return
+
+    if traced:
+        final_output["trace"] = trace_record
 
     # 4. Save to JSON
-    output_filename = "parsed_resume.json"
+    output_filename = args.output
     with open(output_filename, "w") as f:
         json.dump(final_output, f, indent=4)
 
@@ -116,5 +447,13 @@ def main():
     print("\n--- Extracted Metadata ---")
     print(json.dumps(final_output["extracted"], indent=2))
 
+    if traced:
+        print("\n--- Stage Timings ---")
+        for name, entry in trace_record["stages"].items():
+            regex = f", {entry['regex_calls']} regex calls" if "regex_calls" in entry else ""
+            print(f"  {name:<28} {entry['wall_seconds'] * 1000:9.2f} ms wall "
+                  f"{entry['cpu_seconds'] * 1000:9.2f} ms cpu ({entry['calls']} call(s){regex})")
+        print(f"  counters: {trace_record['counters']}")
+
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    main()
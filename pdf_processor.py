@@ -1,145 +1,650 @@
-from pdfminer.pdfinterp import PDFResourceManager, PDFPageInterpreter
-from pdfminer.converter import PDFPageAggregator
-from pdfminer.layout import LAParams, LTTextBox, LTTextLine, LTChar
-from pdfminer.pdfpage import PDFPage
-from pdfminer.pdftypes import PDFObjRef
+from array import array
 from collections import Counter
+from contextlib import contextmanager
+import io
+import os
 import re
 
+from line_record import Line
+from link_index import build_link_index, find_line_links
+
+# --- Lazy pdfminer Import ---
+# Importing pdfminer costs more than the rest of the parser put together.
+# Its names are bound here on first use, so processes that never lay out a
+# page (cache hits, artifact refreshes, index queries) do not pay for it.
+
+PDFResourceManager = PDFPageInterpreter = PDFPageAggregator = PDFPage = PDFObjRef = None
+LAParams = LTTextBox = LTTextLine = LTChar = LTContainer = None
+TopBandAggregator = None
+
+def load_pdfminer():
+    """Imports the pdfminer components used by this module (once per process)."""
+    global PDFResourceManager, PDFPageInterpreter, PDFPageAggregator, PDFPage, PDFObjRef
+    global LAParams, LTTextBox, LTTextLine, LTChar, LTContainer, TopBandAggregator
+    if TopBandAggregator is not None:
+        return
+    from pdfminer.pdfinterp import PDFResourceManager, PDFPageInterpreter
+    from pdfminer.converter import PDFPageAggregator
+    from pdfminer.layout import LAParams, LTTextBox, LTTextLine, LTChar, LTContainer
+    from pdfminer.pdfpage import PDFPage
+    from pdfminer.pdftypes import PDFObjRef
+    TopBandAggregator = _define_top_band_aggregator(PDFPageAggregator)
+
+# --- Font Classification Registry ---
+# A resume uses only a handful of fonts, so each one is classified once and the
+# result is cached at module level. The cache lives as long as the process, so
+# batch workers reuse it across documents.
+
+BOLD_INDICATORS = ("bold", "black", "heavy", "bd", "demi", "bx")
+ITALIC_INDICATORS = ("italic", "oblique", "slant")
+
+FLAG_ITALIC = 64          # PDF font descriptor flag bit 7
+FLAG_FORCE_BOLD = 262144  # PDF font descriptor flag bit 19
+
+FONT_CACHE_MAX_ENTRIES = 4096
+
+_font_class_cache = {}
+_font_cache_stats = {"hits": 0, "misses": 0}
+
+def _descriptor_flags(char):
+    if hasattr(char, 'font') and hasattr(char.font, 'descriptor'):
+        return char.font.descriptor.get('Flags', 0)
+    return 0
+
+def classify_font(char, font_name=None):
+    """
+    Returns {'bold', 'italic', 'family'} for the char's font.
+    Keyed by font name + descriptor flags; computed once per distinct font.
+    """
+    try:
+        name = font_name if font_name else char.fontname
+        flags = _descriptor_flags(char)
+    except AttributeError:
+        return {"bold": False, "italic": False, "family": None}
+
+    key = (name, flags)
+    info = _font_class_cache.get(key)
+    if info is not None:
+        _font_cache_stats["hits"] += 1
+        return info
+
+    _font_cache_stats["misses"] += 1
+    check_font = name.lower()
+    family = re.split(r'[-,]', name)[0] or name
+    info = {
+        "bold": any(indicator in check_font for indicator in BOLD_INDICATORS) or bool(flags & FLAG_FORCE_BOLD),
+        "italic": any(indicator in check_font for indicator in ITALIC_INDICATORS) or bool(flags & FLAG_ITALIC),
+        "family": family
+    }
+
+    # Unbounded growth is only possible with pathological inputs; start over
+    if len(_font_class_cache) >= FONT_CACHE_MAX_ENTRIES:
+        _font_class_cache.clear()
+    _font_class_cache[key] = info
+    return info
+
+def font_cache_stats():
+    """Hit/miss counters and current size of the font classification cache."""
+    return dict(_font_cache_stats, size=len(_font_class_cache))
+
+def clear_font_cache():
+    """Empties the font classification cache and resets its counters."""
+    _font_class_cache.clear()
+    _font_cache_stats["hits"] = 0
+    _font_cache_stats["misses"] = 0
+
 def is_font_bold(char, font_name=None):
     """
     Robustly checks if a character is bold based on font attributes.
     """
-    try:
-        check_font = font_name.lower() if font_name else char.fontname.lower()
-        bold_indicators = ["bold", "black", "heavy", "bd", "demi", "bx"]
-        
-        if any(indicator in check_font for indicator in bold_indicators):
-            return True
-            
-        if hasattr(char, 'font') and hasattr(char.font, 'descriptor'):
-            flags = char.font.descriptor.get('Flags', 0)
-            if flags & 262144: 
-                return True
-    except AttributeError: 
-        pass
-    return False
+    return classify_font(char, font_name)["bold"]
 
 def normalize_lines(lines):
     for l in lines:
         l["text"] = re.sub(r'\s+', ' ', l["text"]).strip()
     return lines
 
-def extract_lines_from_pdf(pdf_path):
+def extract_page_links(page):
     """
-    Extracts text and merges hyperlinks using an efficient Single-Pass method.
-    Returns a list of links for each line to handle multiple URLs (e.g. LinkedIn + GitHub).
+    Collects the external hyperlink annotations of a page as {'bbox', 'uri'} dicts.
+    """
+    load_pdfminer()
+    page_links = []
+    if page.annots:
+        annots = page.annots
+        if isinstance(annots, PDFObjRef): annots = annots.resolve()
+        if isinstance(annots, list):
+            for annot in annots:
+                if isinstance(annot, PDFObjRef): annot = annot.resolve()
+                
+                # Filter for Links
+                if annot.get('Subtype') and annot.get('Subtype').name == 'Link':
+                    action = annot.get('A')
+                    if action and isinstance(action, dict):
+                        uri = action.get('URI')
+                        # REMOVED: uri = action.get('D') to avoid internal page jumps
+                        
+                        if uri:
+                            if isinstance(uri, bytes):
+                                try: uri = uri.decode('utf-8')
+                                except: pass
+                            
+                            rect = annot.get('Rect') # [x0, y0, x1, y1]
+                            if rect:
+                                page_links.append({
+                                    'bbox': rect,
+                                    'uri': str(uri)
+                                })
+    return page_links
+
+# --- Line Builders (one per backend) ---
+# Each builder turns a page layout into (raw_text, chars, (x0, y0, x1, y1)) items,
+# so both backends share the font analysis, link overlap and sorting below.
+
+BACKENDS = ("layout", "fast")
+
+# Baseline clustering thresholds for the fast backend, mirroring LAParams defaults
+FAST_LINE_OVERLAP = 0.5  # min vertical overlap (x char height) to share a line
+FAST_CHAR_MARGIN = 2.0   # horizontal gap (x char width) that splits a line
+FAST_WORD_MARGIN = 0.1   # horizontal gap (x char size) that inserts a space
+
+def layout_text_lines(layout):
+    """
+    Flattens a fully analysed pdfminer layout (LAParams) into line items.
+    """
+    load_pdfminer()
+    text_items = []
+    for element in layout:
+        if isinstance(element, LTTextBox):
+            for line in element: text_items.append(line)
+        elif isinstance(element, LTTextLine):
+            text_items.append(element)
+
+    return [(t.get_text(), list(t), (t.x0, t.y0, t.x1, t.y1)) for t in text_items]
+
+def _flush_fast_line(chars, items):
+    """Joins x-sorted chars into one line item, inserting spaces at word gaps."""
+    parts = []
+    prev_x1 = None
+    for c in chars:
+        if prev_x1 is not None and prev_x1 < c.x0 - FAST_WORD_MARGIN * max(c.width, c.height):
+            parts.append(" ")
+        parts.append(c.get_text())
+        prev_x1 = c.x1
+
+    x0 = min(c.x0 for c in chars)
+    y0 = min(c.y0 for c in chars)
+    x1 = max(c.x1 for c in chars)
+    y1 = max(c.y1 for c in chars)
+    items.append(("".join(parts), chars, (x0, y0, x1, y1)))
+
+def _page_chars(layout):
+    """Every LTChar on the page, including those nested in figures (form XObjects)."""
+    chars = []
+    stack = [layout]
+    while stack:
+        for obj in stack.pop():
+            if isinstance(obj, LTChar):
+                chars.append(obj)
+            elif isinstance(obj, LTContainer):
+                stack.append(obj)
+    return chars
+
+def fast_text_lines(layout):
+    """
+    Builds line items straight from the page's char stream (no LAParams):
+    chars are clustered by baseline, then split into lines at wide horizontal gaps.
+    Skips pdfminer's textbox grouping and boxes-flow analysis entirely.
+    """
+    load_pdfminer()
+    chars = _page_chars(layout)
+    if not chars:
+        return []
+
+    # 1. Baseline clustering: top-down sweep, joining chars that overlap vertically
+    chars.sort(key=lambda c: -c.y0)
+    rows = []
+    row = [chars[0]]
+    row_y0, row_height = chars[0].y0, chars[0].height
+    for c in chars[1:]:
+        if row_y0 - c.y0 <= FAST_LINE_OVERLAP * min(row_height, c.height):
+            row.append(c)
+        else:
+            rows.append(row)
+            row = [c]
+            row_y0, row_height = c.y0, c.height
+    rows.append(row)
+
+    # 2. Split each row at gaps too wide to be inside one line (e.g. column gutters)
+    items = []
+    for row in rows:
+        row.sort(key=lambda c: c.x0)
+        current = [row[0]]
+        for prev, c in zip(row, row[1:]):
+            if c.x0 - prev.x1 >= FAST_CHAR_MARGIN * max(prev.width, c.width):
+                _flush_fast_line(current, items)
+                current = []
+            current.append(c)
+        _flush_fast_line(current, items)
+
+    return items
+
+# --- Per-Document Font Table ---
+# Fonts are interned to small integer ids the first time they are seen, with
+# their cleaned name and boldness computed once. Per-char work then reduces to
+# a dict lookup, and line statistics become reductions over compact arrays.
+
+def new_font_table():
+    """Creates an empty font table; share one across all pages of a document."""
+    return {
+        "raw_ids": {},              # raw fontname (with subset tag) -> raw id
+        "raw_to_clean": array('I'), # raw id -> clean font id
+        "raw_bold": array('B'),     # raw id -> 1 if bold
+        "clean_ids": {},            # cleaned font name -> clean id
+        "clean_names": []           # clean id -> cleaned font name
+    }
+
+def intern_font(font_table, char):
+    """Registers char's font in the table and returns its raw id."""
+    raw_name = char.fontname
+    # Clean font name (remove subset tag like ABCDE+)
+    font_name = raw_name.split('+')[-1] if '+' in raw_name else raw_name
+
+    clean_id = font_table["clean_ids"].get(font_name)
+    if clean_id is None:
+        clean_id = len(font_table["clean_names"])
+        font_table["clean_ids"][font_name] = clean_id
+        font_table["clean_names"].append(font_name)
+
+    raw_id = len(font_table["raw_to_clean"])
+    font_table["raw_ids"][raw_name] = raw_id
+    font_table["raw_to_clean"].append(clean_id)
+    font_table["raw_bold"].append(1 if is_font_bold(char, font_name) else 0)
+    return raw_id
+
+# --- Column Detection ---
+# Two-column resumes (sidebar + main column) must be read column by column: a
+# plain (-y, x) sort interleaves both columns line by line, and sections then
+# swallow each other's lines. Per page, the horizontal extents of all lines
+# are accumulated in a coverage histogram of COLUMN_BIN-wide bins (difference
+# array, O(lines + bins)). An interior run of bins that (almost) no line
+# covers is a gutter. Lines crossing it (name, contact bar) span the page and
+# cut it into bands; within a band the left column is read before the right.
+# A header block above both columns (name on the left, email/phone on the
+# right) crosses no line yet is no column either: the lines above the first
+# blank-line gap, if one side has too few of them for a column, are read
+# row by row like a single-column page.
+
+COLUMN_BIN = 4.0                  # histogram bin width (pt)
+MIN_GUTTER_WIDTH = 12.0           # narrower gaps are word/tab spacing, not a gutter (pt)
+MIN_COLUMN_LINES = 3              # lines each side of a gutter needs to count as a column
+GUTTER_MAX_CROSSING_SHARE = 0.1   # share of the page's lines allowed to span the gutter
+GUTTER_CANDIDATES = 3             # emptiest gaps checked before giving up
+HEADER_MAX_LINES = 8              # lines a header block above the columns may hold
+
+# Right-aligned dates ("Jan 2021 - Present") next to titles leave a gap just
+# like a gutter; a "column" made mostly of short date-like lines is not one.
+DATE_COLUMN_SHARE = 0.5
+DATE_LINE_MAX_CHARS = 40
+_DATE_LIKE = re.compile(r'\b(?:19|20)\d{2}\b|\bpresent\b|\bcurrent\b|\bongoing\b', re.IGNORECASE)
+
+def _is_date_column(texts):
+    dates = sum(1 for text in texts if len(text) <= DATE_LINE_MAX_CHARS and _DATE_LIKE.search(text))
+    return dates >= DATE_COLUMN_SHARE * len(texts)
+
+def find_column_gutter(texts, extents):
+    """
+    Returns (g0, g1), the x-range of the gutter between two text columns, or
+    None for a single-column page. texts / extents ((x0, x1)) describe the
+    page's lines. Runs in O(lines + page width / COLUMN_BIN).
+    """
+    if len(extents) < 2 * MIN_COLUMN_LINES:
+        return None
+    left = min(x0 for x0, _ in extents)
+    right = max(x1 for _, x1 in extents)
+    bins = int((right - left) / COLUMN_BIN) + 1
+
+    # Coverage histogram: lines touching each bin
+    diff = [0] * (bins + 1)
+    for x0, x1 in extents:
+        diff[int((x0 - left) / COLUMN_BIN)] += 1
+        diff[int((x1 - left) / COLUMN_BIN) + 1] -= 1
+    coverage = []
+    running = 0
+    for delta in diff[:bins]:
+        running += delta
+        coverage.append(running)
+
+    # Interior runs of (nearly) uncovered bins; within each, the gutter is the
+    # widest stretch at the run's lowest coverage (ragged column edges and
+    # the odd long line raise the coverage around it)
+    allowance = int(GUTTER_MAX_CROSSING_SHARE * len(extents))
+    min_bins = max(1, int(MIN_GUTTER_WIDTH / COLUMN_BIN))
+    candidates = []
+    start = None
+    for i, count in enumerate(coverage + [allowance + 1]):
+        if count <= allowance:
+            if start is None:
+                start = i
+            continue
+        if start is not None and start > 0 and i < bins:
+            low = min(coverage[start:i])
+            best = (0, start)
+            stretch_start = None
+            for j in range(start, i + 1):
+                if j < i and coverage[j] == low:
+                    if stretch_start is None:
+                        stretch_start = j
+                elif stretch_start is not None:
+                    best = max(best, (j - stretch_start, stretch_start))
+                    stretch_start = None
+            if best[0] >= min_bins:
+                candidates.append((low, -best[0], best[1], best[1] + best[0]))
+        start = None
+
+    # Emptiest, then widest gutters first
+    for _, _, start, end in sorted(candidates)[:GUTTER_CANDIDATES]:
+        g0, g1 = left + start * COLUMN_BIN, left + end * COLUMN_BIN
+        left_texts = [text for text, (x0, x1) in zip(texts, extents) if x0 < g0 and x1 <= g1]
+        right_texts = [text for text, (x0, _) in zip(texts, extents) if x0 >= g0]
+        if len(left_texts) < MIN_COLUMN_LINES or len(right_texts) < MIN_COLUMN_LINES:
+            continue
+        if _is_date_column(left_texts) or _is_date_column(right_texts):
+            continue
+        return g0, g1
+    return None
+
+def _header_block(lines, extents, order, gutter):
+    """
+    Number of leading lines (in (-y, x) order) that form a header block above
+    both columns: the lines before the first spanning line or blank-line gap,
+    when one side of the gutter has fewer than MIN_COLUMN_LINES of them.
     """
-    # Setup Layout Analysis
+    g0, g1 = gutter
+    sides = [0, 0]
+    for n, i in enumerate(order):
+        x0, x1 = extents[i]
+        if n and lines[order[n - 1]].y - lines[i].y > 2 * lines[i].font_size:
+            break  # a blank line's worth of whitespace across both columns
+        if x0 < g0 and x1 > g1:
+            break
+        if n == HEADER_MAX_LINES:
+            return 0
+        sides[x0 >= g0] += 1
+    else:
+        return 0
+    return n if min(sides) < MIN_COLUMN_LINES else 0
+
+def order_page_lines(lines, extents):
+    """
+    Returns the page's lines in reading order and sets each line's column:
+    1 / 2 for the left / right column of a two-column page, 0 for lines
+    spanning the gutter, for a header block above the columns and for
+    single-column pages (plain (-y, x) order).
+    extents: (x0, x1) per line.
+    """
+    order = sorted(range(len(lines)), key=lambda i: (-lines[i].y, lines[i].x))
+    gutter = find_column_gutter([line.text for line in lines], extents)
+    if gutter is None:
+        return [lines[i] for i in order]
+
+    g0, g1 = gutter
+    header = _header_block(lines, extents, order, gutter)
+    ordered = [lines[i] for i in order[:header]]
+    band = ([], [])  # left / right column lines since the last spanning line
+    for i in order[header:]:
+        line = lines[i]
+        x0, x1 = extents[i]
+        if x0 >= g0:
+            line.column = 2
+            band[1].append(line)
+        elif x1 <= g1:
+            line.column = 1
+            band[0].append(line)
+        else:
+            ordered.extend(band[0])
+            ordered.extend(band[1])
+            band = ([], [])
+            ordered.append(line)
+    ordered.extend(band[0])
+    ordered.extend(band[1])
+    return ordered
+
+def build_page_lines(layout, page_links, backend="layout", font_table=None):
+    """
+    Turns one page layout into normalized Line records with their links, in
+    reading order (column by column on multi-column pages).
+    """
+    load_pdfminer()
+    page_lines = []
+    if font_table is None:
+        font_table = new_font_table()
+    
+    # Flatten layout to lines
+    if backend == "fast":
+        text_items = fast_text_lines(layout)
+    else:
+        text_items = layout_text_lines(layout)
+
+    # --- C1. Collect Char Attributes for the Whole Page ---
+    # One flat array per attribute; each line owns the slice [start, end)
+    sizes = array('d')
+    raw_ids = array('I')
+    kept = []  # (raw_text, bbox, start, end)
+
+    raw_id_of = font_table["raw_ids"].get
+    for raw_text, line_chars, bbox in text_items:
+        if not raw_text.strip(): continue
+
+        start = len(sizes)
+        for char in line_chars:
+            if isinstance(char, LTChar):
+                sizes.append(char.size)
+                raw_id = raw_id_of(char.fontname)
+                if raw_id is None:
+                    raw_id = intern_font(font_table, char)
+                raw_ids.append(raw_id)
+
+        if len(sizes) == start: continue
+        kept.append((raw_text, bbox, start, len(sizes)))
+
+    # --- C2. Batched Font Statistics & Overlaps ---
+    font_ids = array('I', map(font_table["raw_to_clean"].__getitem__, raw_ids))
+    bold_flags = array('B', map(font_table["raw_bold"].__getitem__, raw_ids))
+    clean_names = font_table["clean_names"]
+    link_index = build_link_index(page_links)
+    extents = []
+
+    for raw_text, bbox, start, end in kept:
+        dominant_id = Counter(font_ids[start:end]).most_common(1)[0][0]
+
+        # --- OVERLAP LOGIC ---
+        # Only links sharing a y-band with the line are tested (see link_index)
+        found_links = find_line_links(link_index, bbox)
+        tx0, ty0 = bbox[0], bbox[1]
+
+        page_lines.append(Line(
+            text=raw_text.strip(),
+            font_size=round(max(sizes[start:end]), 1),
+            bold_ratio=sum(bold_flags[start:end]) / (end - start),
+            font_name=clean_names[dominant_id],
+            y=ty0,
+            x=tx0,
+            links=found_links # <--- CHANGED: Stores all matching links
+        ))
+        extents.append((tx0, bbox[2]))
+
+    # Sort: Top-down, then Left-Right (per column when the page has two)
+    return normalize_lines(order_page_lines(page_lines, extents))
+
+# --- Input Sources ---
+# Everything pdfminer needs is a seekable binary file object. Paths are opened
+# here; in-memory buffers are wrapped without copying them first.
+
+class BufferReader(io.RawIOBase):
+    """
+    Read-only, seekable file object over any buffer (bytearray, memoryview, ...).
+    Unlike io.BytesIO, it never copies the whole buffer up front.
+    """
+
+    def __init__(self, buffer):
+        self._view = memoryview(buffer).cast('B')
+        self._pos = 0
+
+    def readable(self):
+        return True
+
+    def seekable(self):
+        return True
+
+    def readinto(self, b):
+        n = max(0, min(len(b), len(self._view) - self._pos))
+        b[:n] = self._view[self._pos:self._pos + n]
+        self._pos += n
+        return n
+
+    def seek(self, offset, whence=io.SEEK_SET):
+        if whence == io.SEEK_SET:
+            self._pos = offset
+        elif whence == io.SEEK_CUR:
+            self._pos += offset
+        elif whence == io.SEEK_END:
+            self._pos = len(self._view) + offset
+        else:
+            raise ValueError(f"Invalid whence ({whence})")
+        if self._pos < 0:
+            raise ValueError("Negative seek position")
+        return self._pos
+
+    def tell(self):
+        return self._pos
+
+@contextmanager
+def open_pdf_source(source):
+    """
+    Yields a seekable binary file object for a path, bytes, bytearray,
+    memoryview, mmap or already-open binary file. Only paths are closed on exit;
+    caller-owned objects are left open.
+    """
+    if isinstance(source, (str, os.PathLike)):
+        with open(source, 'rb') as fp:
+            yield fp
+    elif isinstance(source, bytes):
+        # BytesIO shares an immutable bytes object instead of copying it
+        yield io.BytesIO(source)
+    elif hasattr(source, 'read') and hasattr(source, 'seek'):
+        # Open files, mmap.mmap, BytesIO ...
+        yield source
+    elif isinstance(source, (bytearray, memoryview)):
+        yield BufferReader(source)
+    else:
+        raise TypeError(f"Unsupported PDF source type: {type(source).__name__}")
+
+# --- Top-Band Cropping ---
+# Header-only callers (contact extraction) need just the top of page 1.
+# Cropping before layout analysis skips analysing the rest of the page.
+
+def _define_top_band_aggregator(base):
+    # Defined at load time: the base class lives in pdfminer (see load_pdfminer)
+    from pdfminer.layout import LTPage
+
+    class TopBandPage(LTPage):
+        """LTPage that only accepts objects reaching above cutoff."""
+
+        def __init__(self, page, cutoff):
+            LTPage.__init__(self, page.pageid, page.bbox, page.rotate)
+            self.cutoff = cutoff
+
+        def add(self, obj):
+            if obj.y1 > self.cutoff:
+                LTPage.add(self, obj)
+
+    class TopBandAggregator(base):
+        """
+        PDFPageAggregator that drops every object lying entirely below the top
+        `top_band` share (0-1] of the page as it is rendered, so layout
+        analysis never sees it.
+        """
+
+        def __init__(self, rsrcmgr, laparams=None, top_band=1.0):
+            base.__init__(self, rsrcmgr, laparams=laparams)
+            self.top_band = top_band
+
+        def begin_page(self, page, ctm):
+            base.begin_page(self, page, ctm)
+            _, y0, _, y1 = self.cur_item.bbox
+            self.cur_item = TopBandPage(self.cur_item, y1 - (y1 - y0) * self.top_band)
+
+    return TopBandAggregator
+
+def iter_lines_from_pdf(source, laparams=None, max_pages=None, max_lines=None, backend="layout",
+                        top_band=None, stats=None):
+    """
+    Streaming version of extract_lines_from_pdf: yields normalized Line records
+    page by page, as soon as each page is laid out.
+    source may be a path, bytes-like object, mmap or seekable binary file.
+    Stops early after max_pages pages or max_lines lines, so callers that only
+    need the top of the document never pay for the rest of it.
+    backend="fast" builds lines from the raw char stream instead of LAParams layout.
+    top_band (0-1] keeps only the top share of each page (see TopBandAggregator).
+    stats, if a dict, receives the number of pages laid out under "pages".
+    Errors propagate to the caller.
+    """
+    if backend not in BACKENDS:
+        raise ValueError(f"Unknown backend '{backend}', expected one of {BACKENDS}")
+    if top_band is not None and not 0 < top_band <= 1:
+        raise ValueError(f"top_band must be in (0, 1], got {top_band}")
+
+    # Setup Layout Analysis (the fast backend receives raw, unanalysed chars)
+    load_pdfminer()
     rsrcmgr = PDFResourceManager()
-    laparams = LAParams()
-    device = PDFPageAggregator(rsrcmgr, laparams=laparams)
+    if backend == "fast":
+        laparams = None
+    elif laparams is None:
+        laparams = LAParams()
+    if top_band is None:
+        device = PDFPageAggregator(rsrcmgr, laparams=laparams)
+    else:
+        device = TopBandAggregator(rsrcmgr, laparams=laparams, top_band=top_band)
     interpreter = PDFPageInterpreter(rsrcmgr, device)
-    
-    all_lines = []
 
-    try:
-        with open(pdf_path, 'rb') as fp:
-            # Loop through pages EXACTLY ONCE
-            for page in PDFPage.get_pages(fp):
-                
-                # --- A. Extract Links for THIS Page ---
-                page_links = []
-                if page.annots:
-                    annots = page.annots
-                    if isinstance(annots, PDFObjRef): annots = annots.resolve()
-                    if isinstance(annots, list):
-                        for annot in annots:
-                            if isinstance(annot, PDFObjRef): annot = annot.resolve()
-                            
-                            # Filter for Links
-                            if annot.get('Subtype') and annot.get('Subtype').name == 'Link':
-                                action = annot.get('A')
-                                if action and isinstance(action, dict):
-                                    uri = action.get('URI')
-                                    # REMOVED: uri = action.get('D') to avoid internal page jumps
-                                    
-                                    if uri:
-                                        if isinstance(uri, bytes):
-                                            try: uri = uri.decode('utf-8')
-                                            except: pass
-                                        
-                                        rect = annot.get('Rect') # [x0, y0, x1, y1]
-                                        if rect:
-                                            page_links.append({
-                                                'bbox': rect,
-                                                'uri': str(uri)
-                                            })
-
-                # --- B. Extract Text Layout for THIS Page ---
-                interpreter.process_page(page)
-                layout = device.get_result()
-                
-                page_lines = []
-                
-                # Flatten layout to lines
-                text_items = []
-                for element in layout:
-                    if isinstance(element, LTTextBox):
-                        for line in element: text_items.append(line)
-                    elif isinstance(element, LTTextLine):
-                        text_items.append(element)
-                
-                # --- C. Process Lines & Check Overlaps ---
-                for text_line in text_items:
-                    raw_text = text_line.get_text()
-                    if not raw_text.strip(): continue
-
-                    # Font Analysis
-                    sizes, fonts = [], []
-                    bold_chars, total_chars = 0, 0
-                    
-                    for char in text_line:
-                        if isinstance(char, LTChar):
-                            sizes.append(char.size)
-                            # Clean font name (remove subset tag like ABCDE+)
-                            font_name = char.fontname.split('+')[-1] if '+' in char.fontname else char.fontname
-                            fonts.append(font_name)
-                            total_chars += 1
-                            if is_font_bold(char, font_name): bold_chars += 1
-
-                    if not sizes: continue
-
-                    # --- OVERLAP LOGIC ---
-                    found_links = []
-                    # Text Line Coordinates
-                    tx0, ty0, tx1, ty1 = text_line.x0, text_line.y0, text_line.x1, text_line.y1
-                    
-                    for link in page_links:
-                        lx0, ly0, lx1, ly1 = link['bbox']
-                        
-                        # Check if rectangles overlap
-                        # (Left of one < Right of other) AND (Bottom of one < Top of other)
-                        if (tx0 < lx1 and tx1 > lx0 and
-                            ty0 < ly1 and ty1 > ly0):
-                            found_links.append(link['uri'])
-
-                    page_lines.append({
-                        "text": raw_text.strip(),
-                        "font_size": round(max(sizes), 1),
-                        "bold_ratio": bold_chars / max(total_chars, 1),
-                        "font_name": Counter(fonts).most_common(1)[0][0] if fonts else "Unknown",
-                        "y": text_line.y0,
-                        "x": text_line.x0,
-                        "links": found_links # <--- CHANGED: Stores all matching links
-                    })
-                
-                # Sort: Top-down, then Left-Right
-                page_lines.sort(key=lambda item: (-item["y"], item["x"]))
-                all_lines.extend(page_lines)
+    font_table = new_font_table()
+    emitted = 0
+    if max_lines is not None and max_lines <= 0:
+        return
 
-        return normalize_lines(all_lines)
+    with open_pdf_source(source) as fp:
+        # Loop through pages EXACTLY ONCE (maxpages=0 means no limit)
+        for page in PDFPage.get_pages(fp, maxpages=max_pages or 0):
+            
+            # --- A. Extract Links for THIS Page ---
+            page_links = extract_page_links(page)
 
+            # --- B. Extract Text Layout for THIS Page ---
+            interpreter.process_page(page)
+            layout = device.get_result()
+            if stats is not None:
+                stats["pages"] = stats.get("pages", 0) + 1
+
+            for line in build_page_lines(layout, page_links, backend=backend, font_table=font_table):
+                yield line
+                emitted += 1
+                if max_lines is not None and emitted >= max_lines:
+                    return
+
+def extract_lines_from_pdf(source, laparams=None, max_pages=None, max_lines=None, backend="layout",
+                           top_band=None, stats=None):
+    """
+    Extracts text and merges hyperlinks using an efficient Single-Pass method.
+    Returns a list of links for each line to handle multiple URLs (e.g. LinkedIn + GitHub).
+    Pass a custom LAParams to tune layout analysis (defaults to pdfminer's),
+    or backend="fast" to skip layout analysis altogether.
+    Accepts the same sources as iter_lines_from_pdf (path, bytes, file object ...).
+    """
+    try:
+        return list(iter_lines_from_pdf(source, laparams=laparams, max_pages=max_pages,
+                                        max_lines=max_lines, backend=backend, top_band=top_band,
+                                        stats=stats))
     except Exception as e:
         print(f"Error reading PDF: {e}")
-        return []
\ No newline at end of file
+        return []
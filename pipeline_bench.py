@@ -0,0 +1,223 @@
+import argparse
+import json
+import os
+import platform
+import time
+import tracemalloc
+from importlib.metadata import PackageNotFoundError, version
+
+from pdf_processor import extract_lines_from_pdf
+from section_parser import process_lines_to_sections
+from subsection_parser import extract_subsections
+from extract_contact import extract_contacts
+from extract_edu import extract_education_details
+from rank_extract import extract_ranks
+from skill_extract import extract_skills
+from synthetic_resume import generate_resume
+
+# Stage names, in pipeline order, as they appear in the report
+STAGES = ("extract_lines_from_pdf", "process_lines_to_sections", "extract_contacts",
+          "extract_education_details", "extract_ranks", "extract_skills", "extract_subsections")
+
+# Corpus matrix: each profile is one document shape (generate_resume kwargs)
+PROFILES = [
+    {"name": "baseline", "pages": 1, "columns": 1, "links": 3, "sections": 6, "font_mix": "helvetica"},
+    {"name": "two-page", "pages": 2, "columns": 1, "links": 3, "sections": 6, "font_mix": "helvetica"},
+    {"name": "long", "pages": 6, "columns": 1, "links": 3, "sections": 8, "font_mix": "helvetica"},
+    {"name": "two-column", "pages": 1, "columns": 2, "links": 3, "sections": 6, "font_mix": "helvetica"},
+    {"name": "three-column", "pages": 2, "columns": 3, "links": 3, "sections": 8, "font_mix": "times"},
+    {"name": "link-heavy", "pages": 2, "columns": 1, "links": 60, "sections": 6, "font_mix": "helvetica"},
+    {"name": "few-sections", "pages": 1, "columns": 1, "links": 3, "sections": 3, "font_mix": "times"},
+    {"name": "font-mix", "pages": 2, "columns": 2, "links": 10, "sections": 8, "font_mix": "mixed"},
+]
+
+QUICK_PROFILES = ("baseline", "two-column", "link-heavy")
+
+SUBSECTION_TYPES = ("experience", "projects", "positions")
+
+def run_pipeline(pdf_bytes):
+    """
+    Runs every stage the way parser.build_final_output does and returns
+    ({stage: seconds}, line count). Per-section stages are summed per document.
+    """
+    timings = dict.fromkeys(STAGES, 0.0)
+    clock = time.perf_counter
+
+    start = clock()
+    raw_lines = extract_lines_from_pdf(pdf_bytes)
+    timings["extract_lines_from_pdf"] = clock() - start
+
+    start = clock()
+    sections = process_lines_to_sections(raw_lines)
+    timings["process_lines_to_sections"] = clock() - start
+
+    start = clock()
+    extract_contacts(raw_lines)
+    timings["extract_contacts"] = clock() - start
+
+    for section_key, lines_list in sections.items():
+        section_type = section_key.split('-')[0] if '-' in section_key else section_key
+        if section_type == "education":
+            stage, fn = "extract_education_details", extract_education_details
+        elif section_type == "achievements":
+            stage, fn = "extract_ranks", extract_ranks
+        elif section_type == "skills":
+            stage, fn = "extract_skills", extract_skills
+        else:
+            stage, fn = None, None
+
+        if stage:
+            start = clock()
+            fn(lines_list)
+            timings[stage] += clock() - start
+        if section_type in SUBSECTION_TYPES:
+            start = clock()
+            extract_subsections(lines_list)
+            timings["extract_subsections"] += clock() - start
+
+    return timings, len(raw_lines)
+
+def percentiles(samples):
+    """p50/p90/p99/mean/max of a list of seconds, in milliseconds."""
+    if not samples:
+        return None
+    ordered = sorted(samples)
+
+    def pick(p):
+        return ordered[min(len(ordered) - 1, int(p / 100 * len(ordered)))]
+
+    return {
+        "p50_ms": round(pick(50) * 1000, 4),
+        "p90_ms": round(pick(90) * 1000, 4),
+        "p99_ms": round(pick(99) * 1000, 4),
+        "mean_ms": round(sum(ordered) / len(ordered) * 1000, 4),
+        "max_ms": round(ordered[-1] * 1000, 4)
+    }
+
+def peak_memory(pdf_bytes):
+    """Peak traced allocation (bytes) of one full pipeline run; kept out of the timed runs."""
+    tracemalloc.start()
+    try:
+        run_pipeline(pdf_bytes)
+        return tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+def bench_profile(profile, docs, repeats, seed):
+    """Times `docs` generated documents of one profile, `repeats` runs each."""
+    options = {k: v for k, v in profile.items() if k != "name"}
+    corpus = [generate_resume(seed=seed + i, **options) for i in range(docs)]
+
+    # Warm-up: imports, compiled tables and pdfminer font caches
+    run_pipeline(corpus[0])
+
+    stage_samples = {stage: [] for stage in STAGES}
+    totals, lines = [], 0
+    for _ in range(repeats):
+        for pdf_bytes in corpus:
+            timings, line_count = run_pipeline(pdf_bytes)
+            for stage, seconds in timings.items():
+                stage_samples[stage].append(seconds)
+            totals.append(sum(timings.values()))
+            lines += line_count
+
+    peaks = sorted(peak_memory(pdf_bytes) for pdf_bytes in corpus)
+    elapsed = sum(totals)
+    pages = profile["pages"] * docs * repeats
+
+    return {
+        "profile": profile,
+        "documents": docs,
+        "repeats": repeats,
+        "lines_per_document": round(lines / len(totals), 1),
+        "throughput": {
+            "docs_per_second": round(len(totals) / elapsed, 3),
+            "pages_per_second": round(pages / elapsed, 3),
+            "lines_per_second": round(lines / elapsed, 1)
+        },
+        "latency": percentiles(totals),
+        "stages": {stage: percentiles(samples) for stage, samples in stage_samples.items()},
+        "peak_memory_bytes": {"median": peaks[len(peaks) // 2], "max": peaks[-1]}
+    }
+
+def _package_version(name):
+    try:
+        return version(name)
+    except PackageNotFoundError:
+        return None
+
+def run_suite(profiles, docs=5, repeats=3, seed=0):
+    """Benchmarks every profile and returns the full report dict."""
+    return {
+        "environment": {
+            "python": platform.python_version(),
+            "implementation": platform.python_implementation(),
+            "machine": platform.machine(),
+            "pdfminer.six": _package_version("pdfminer.six")
+        },
+        "settings": {"documents": docs, "repeats": repeats, "seed": seed},
+        "profiles": {profile["name"]: bench_profile(profile, docs, repeats, seed) for profile in profiles}
+    }
+
+def compare_reports(baseline, current):
+    """
+    Per profile and stage p50 ratios (current / baseline); above 1 means slower.
+    Profiles or stages missing from either report are skipped.
+    """
+    ratios = {}
+    for name, result in current["profiles"].items():
+        old = baseline.get("profiles", {}).get(name)
+        if not old:
+            continue
+        entry = {"total": _ratio(old["latency"], result["latency"])}
+        for stage, stats in result["stages"].items():
+            entry[stage] = _ratio(old["stages"].get(stage), stats)
+        ratios[name] = entry
+    return ratios
+
+def _ratio(old, new):
+    if not old or not new or not old["p50_ms"]:
+        return None
+    return round(new["p50_ms"] / old["p50_ms"], 3)
+
+def main():
+    arg_parser = argparse.ArgumentParser(description="Benchmark the full parsing pipeline on a synthetic resume corpus.")
+    arg_parser.add_argument("-o", "--output", default=None, help="Write the JSON report to this path")
+    arg_parser.add_argument("-n", "--docs", type=int, default=5, help="Documents per profile")
+    arg_parser.add_argument("-r", "--repeats", type=int, default=3, help="Timed runs per document")
+    arg_parser.add_argument("--seed", type=int, default=0)
+    arg_parser.add_argument("--profile", action="append", default=None,
+                            help=f"Only run this profile (repeatable): {', '.join(p['name'] for p in PROFILES)}")
+    arg_parser.add_argument("--quick", action="store_true", help=f"Only run {', '.join(QUICK_PROFILES)}")
+    arg_parser.add_argument("--compare", default=None, help="Baseline report to compare p50 latencies against")
+    args = arg_parser.parse_args()
+
+    names = args.profile or (QUICK_PROFILES if args.quick else None)
+    profiles = [p for p in PROFILES if names is None or p["name"] in names]
+    if not profiles:
+        print("Error: No matching profiles.")
+        return
+
+    report = run_suite(profiles, docs=args.docs, repeats=args.repeats, seed=args.seed)
+
+    for name, result in report["profiles"].items():
+        slowest = max(result["stages"], key=lambda s: result["stages"][s]["p50_ms"])
+        print(f"{name:>14}: p50 {result['latency']['p50_ms']:8.2f} ms  p99 {result['latency']['p99_ms']:8.2f} ms  "
+              f"{result['throughput']['pages_per_second']:7.1f} pages/s  "
+              f"peak {result['peak_memory_bytes']['max'] / 1e6:6.2f} MB  (slowest stage: {slowest})")
+
+    if args.compare:
+        with open(args.compare, "r") as f:
+            baseline = json.load(f)
+        report["comparison"] = compare_reports(baseline, report)
+        print("\n--- p50 ratio vs baseline (>1 is slower) ---")
+        print(json.dumps(report["comparison"], indent=2))
+
+    if args.output:
+        os.makedirs(os.path.dirname(os.path.abspath(args.output)), exist_ok=True)
+        with open(args.output, "w") as f:
+            json.dump(report, f, indent=4)
+        print(f"Report saved to {args.output}")
+
+if __name__ == "__main__":
+    main()
@@ -1,6 +1,134 @@
 import re
+from line_record import Line
 from rank_data import EXAM_PATTERNS, RANK_INDICATORS
 
+# --- Compiled Rank Engine (built on first use) ---
+
+# Define robust indicators to ensure "All India Rank" is prioritized
+# even if rank_data.py is missing it or has a different order.
+ROBUST_INDICATORS = [
+    "All India Rank", "AIR", "Secured Rank", "Secured an All India Rank",
+    "Global Rank", "International Rank", "State Rank"
+]
+
+# Regex for separator: allows "of", ":", "-", whitespace, etc.
+# Added em-dash (—) and 'with'
+SEPARATOR_PATTERN = r"[\W\s]*(?:of|is|:|–|-|—|with)?[\W\s]*"
+
+CLAUSE_SPLIT = re.compile(r'[;|]|\s+and\s+', re.IGNORECASE)
+
+# Non-ASCII characters IGNORECASE matches to an ASCII letter that lower() does
+# not produce (İ and ı match "i", ſ matches "s"); İ.lower() also changes length
+_FOLDS_TO_ASCII = frozenset("\u0130\u0131\u017f")
+
+_REGEX_META = set('.^$*+?{}[]|()')
+_OPTIONAL = set('?*')
+
+def required_literal(pattern):
+    """
+    Returns the longest literal run every match of pattern must contain
+    (lowercased), e.g. r"jee\\s*mains?" -> "main", r"\\bgate\\b" -> "gate".
+    Returns '' for patterns with groups, classes or alternation.
+    """
+    runs, run = [], []
+    i = 0
+    while i < len(pattern):
+        ch = pattern[i]
+        if ch == '\\':
+            nxt = pattern[i + 1:i + 2]
+            if not nxt:
+                return ''
+            if nxt.isalnum() or nxt == '_':
+                # \s, \b, \d ... (and their quantifier) end the current run
+                runs.append(''.join(run))
+                run = []
+                i += 2
+                if pattern[i:i + 1] in ('?', '*', '+'):
+                    i += 1
+                continue
+            literal, width = nxt, 2
+        elif ch in '([|':
+            return ''
+        elif ch in _REGEX_META:
+            if ch == '+':
+                # Previous char is required once; nothing after it is adjacent
+                runs.append(''.join(run))
+                run = []
+                i += 1
+                continue
+            return ''
+        else:
+            literal, width = ch, 1
+
+        following = pattern[i + width:i + width + 1]
+        if following == '{':
+            return ''
+        if following in _OPTIONAL:
+            # Optional char: ends the run and is not part of any
+            runs.append(''.join(run))
+            run = []
+            i += width + 1
+            continue
+        run.append(literal)
+        i += width
+    runs.append(''.join(run))
+    return max(runs, key=len).lower()
+
+def compile_rank_engine(exam_patterns, rank_indicators=RANK_INDICATORS):
+    """
+    Precompiles, per exam pattern, the mention check and both rank patterns.
+    Returns {"indicator_literals", "indicator_start", "rank_hit",
+    "exams": [(exam_name, [(literal, mention, p1, p2), ...])]}.
+    """
+    # Sort indicators by length (descending) so "All India Rank" matches before "Rank"
+    sorted_indicators = sorted(set(rank_indicators) | set(ROBUST_INDICATORS), key=lambda i: (-len(i), i))
+    rank_pattern_str = "|".join([re.escape(i) for i in sorted_indicators])
+    # "<indicator> <separator> <number>", tried where an indicator starts (see find_rank_hits)
+    rank_hit = re.compile(rf"({rank_pattern_str}){SEPARATOR_PATTERN}([\d,]+(?:\.\d+)?)", re.IGNORECASE)
+    indicator_start = re.compile(rf"(?=(?:{rank_pattern_str}))", re.IGNORECASE)
+
+    exams = []
+    for exam_name, patterns in exam_patterns.items():
+        compiled = []
+        for exam_pat in patterns:
+            # Pattern A: Exam ... Rank ... Number
+            # e.g. "JEE Advanced: AIR 505" or "JEE Advanced Rank 505"
+            p1 = rf"({exam_pat}).*?({rank_pattern_str}){SEPARATOR_PATTERN}([\d,]+(?:\.\d+)?)"
+
+            # Pattern B: Rank ... Number ... Exam
+            # e.g. "Secured AIR 505 in JEE Advanced"
+            p2 = rf"({rank_pattern_str}){SEPARATOR_PATTERN}([\d,]+(?:\.\d+)?).*?({exam_pat})"
+
+            compiled.append((
+                required_literal(exam_pat),
+                re.compile(exam_pat, re.IGNORECASE),
+                re.compile(p1, re.IGNORECASE),
+                re.compile(p2, re.IGNORECASE)
+            ))
+        exams.append((exam_name, compiled))
+
+    return {
+        # Indicators are escaped literals, so a substring test is equivalent
+        "indicator_literals": list(dict.fromkeys(i.lower() for i in sorted_indicators)),
+        "indicator_start": indicator_start,
+        "rank_hit": rank_hit,
+        "exams": exams
+    }
+
+_rank_engine = None
+
+def rank_engine():
+    """EXAM_PATTERNS and RANK_INDICATORS compiled by compile_rank_engine, once per process."""
+    global _rank_engine
+    if _rank_engine is None:
+        _rank_engine = compile_rank_engine(EXAM_PATTERNS, RANK_INDICATORS)
+    return _rank_engine
+
+def reset_rank_engine():
+    """Drops the compiled rank tables; the next extraction compiles them as they are now."""
+    global _rank_engine
+    _rank_engine = None
+
 def split_into_clauses(text):
     """
     Splits a complex sentence into smaller logical chunks.
@@ -9,61 +137,106 @@ def split_into_clauses(text):
     """
     # Only split on strong delimiters like semicolons, pipes, or explicit 'and'
     # We keep parens () and commas , to preserve context like "JEE (Adv)" or "1,500"
-    temp = re.sub(r'[;|]|\s+and\s+', ' <SEP> ', text, flags=re.IGNORECASE)
+    temp = CLAUSE_SPLIT.sub(' <SEP> ', text)
     chunks = temp.split(' <SEP> ')
     return [c.strip() for c in chunks if c.strip()]
 
-def extract_ranks_from_line(line_text):
+def indicator_positions(lowered, engine):
+    """Sorted start offsets of every indicator in a lowered clause (overlapping ones included)."""
+    positions = set()
+    for literal in engine["indicator_literals"]:
+        at = lowered.find(literal)
+        while at != -1:
+            positions.add(at)
+            at = lowered.find(literal, at + 1)
+    return sorted(positions)
+
+def find_rank_hits(clause, positions, engine):
+    """
+    [(start, number end, number)] for every indicator position where the
+    separator and a number follow, in clause order. positions=None finds the
+    indicators with a regex (clauses without a lowered form).
+    """
+    if positions is None:
+        positions = [m.start() for m in engine["indicator_start"].finditer(clause)]
+    hits = []
+    for at in positions:
+        m = engine["rank_hit"].match(clause, at)
+        if m:
+            hits.append((at, m.end(2), m.group(2)))
+    return hits
+
+def rank_near_mention(clause, mention_match, hits, mention, p1, p2):
+    """
+    The number Pattern A, else Pattern B, captures for one exam pattern, read
+    off the clause's hits (see find_rank_hits) instead of running the lazy .*?
+    patterns: A takes the first hit after the leftmost mention, B the first
+    hit followed by a mention. p1 / p2 only run where the hits cannot settle
+    it: multi-line clauses, or a hit starting inside the mention.
+    """
+    if '\n' in clause:
+        m1 = p1.search(clause)
+        if m1:
+            return m1.group(3)
+        m2 = p2.search(clause)
+        return m2.group(2) if m2 else None
+
+    # Pattern A: the first hit after the leftmost mention
+    start, end = mention_match.span()
+    for hit_start, _, number in hits:
+        if hit_start >= end:
+            return number
+    if any(start < hit_start < end for hit_start, _, _ in hits):
+        # Only the regex knows whether a shorter mention ends before this hit
+        m1 = p1.search(clause)
+        if m1:
+            return m1.group(3)
+
+    # Pattern B: the first hit with a mention after its number
+    for _, number_end, number in hits:
+        if mention.search(clause, number_end):
+            return number
+    return None
+
+def extract_ranks_from_line(line_text, engine=None):
     """
     Finds exams and their associated ranks in a single line of text.
+    engine defaults to rank_engine().
     """
+    if engine is None:
+        engine = rank_engine()
     found_ranks = []
     
     # Use original text case but enable case-insensitive matching
     clauses = split_into_clauses(line_text)
     
-    # Define local robust indicators to ensure "All India Rank" is prioritized
-    # even if rank_data.py is missing it or has a different order.
-    ROBUST_INDICATORS = list(set(RANK_INDICATORS + [
-        "All India Rank", "AIR", "Secured Rank", "Secured an All India Rank", 
-        "Global Rank", "International Rank", "State Rank"
-    ]))
-    
-    # Sort indicators by length (descending) so "All India Rank" matches before "Rank"
-    sorted_indicators = sorted(ROBUST_INDICATORS, key=len, reverse=True)
-    rank_pattern_str = "|".join([re.escape(i) for i in sorted_indicators])
-    
-    # Regex for separator: allows "of", ":", "-", whitespace, etc.
-    # Added em-dash (—) and 'with'
-    separator_pattern = r"[\W\s]*(?:of|is|:|–|-|—|with)?[\W\s]*"
-    
     for clause in clauses:
-        for exam_name, patterns in EXAM_PATTERNS.items():
-            for exam_pat in patterns:
+        # Substring gates need IGNORECASE == lower(), which only these characters break
+        lowered = clause.lower() if _FOLDS_TO_ASCII.isdisjoint(clause) else None
+
+        # Both rank patterns need an indicator: most achievement clauses have none
+        positions = None
+        if lowered is not None:
+            positions = indicator_positions(lowered, engine)
+            if not positions:
+                continue
+
+        # Indicator + number positions, found once per clause for every exam
+        hits = None
+        for exam_name, compiled in engine["exams"]:
+            for literal, mention, p1, p2 in compiled:
+                if lowered is not None and literal and literal not in lowered:
+                    continue
+
                 # 1. Quick check: Is the exam mentioned in this clause?
-                if re.search(exam_pat, clause, re.IGNORECASE):
-                    
-                    # Pattern A: Exam ... Rank ... Number
-                    # e.g. "JEE Advanced: AIR 505" or "JEE Advanced Rank 505"
-                    p1 = rf"({exam_pat}).*?({rank_pattern_str}){separator_pattern}([\d,]+(?:\.\d+)?)"
-                    
-                    # Pattern B: Rank ... Number ... Exam
-                    # e.g. "Secured AIR 505 in JEE Advanced"
-                    p2 = rf"({rank_pattern_str}){separator_pattern}([\d,]+(?:\.\d+)?).*?({exam_pat})"
-                    
-                    raw_num = None
-                    
-                    # Try Pattern A
-                    m1 = re.search(p1, clause, re.IGNORECASE)
-                    if m1:
-                        raw_num = m1.group(3)
-                    
-                    # Try Pattern B (if A failed)
-                    if not raw_num:
-                        m2 = re.search(p2, clause, re.IGNORECASE)
-                        if m2:
-                            raw_num = m2.group(2)
-                            
+                mention_match = mention.search(clause)
+                if mention_match:
+                    if hits is None:
+                        hits = find_rank_hits(clause, positions, engine)
+
+                    # 2. Pattern A (Exam ... Rank ... Number), else Pattern B (Rank ... Number ... Exam)
+                    raw_num = rank_near_mention(clause, mention_match, hits, mention, p1, p2)
+
                     if raw_num:
                         # Clean the number (remove commas from "1,200")
                         clean_rank = raw_num.replace(',', '')
@@ -81,7 +254,7 @@ def extract_ranks_from_line(line_text):
 def extract_ranks(section_lines):
     all_ranks = []
     for line in section_lines:
-        text = line['text'] if isinstance(line, dict) else str(line)
+        text = line['text'] if isinstance(line, (dict, Line)) else str(line)
         ranks_in_line = extract_ranks_from_line(text)
         all_ranks.extend(ranks_in_line)
     return all_ranks
\ No newline at end of file
@@ -1,4 +1,5 @@
 from pdf_processor import extract_lines_from_pdf
+from line_record import json_default
 from section_parser import process_lines_to_sections
 from rank_extract import extract_ranks
 import json
@@ -39,7 +40,7 @@ def main():
     
     # 4. Save to rank.json
     with open("rank.json", "w") as f:
-        json.dump(output_data, f, indent=4, default=str)
+        json.dump(output_data, f, indent=4, default=json_default)
     
     print(f"Results saved to rank.json")
     print(f"Processed {len(output_data)} achievement section(s)")
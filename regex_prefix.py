@@ -0,0 +1,104 @@
+import re
+
+# --- Literal Prefixes of Table Patterns ---
+# Most patterns in the data tables (skills, degrees, branches, institutions)
+# start with literal text. Knowing that text lets an extractor find the few
+# positions where a pattern can possibly match and only try the patterns
+# sharing that prefix there, instead of searching the text once per pattern.
+
+_REGEX_META = set('.^$*+?{}[]|()')
+_QUANTIFIERS = set('*?{')
+
+# Non-ASCII characters that IGNORECASE matching equates with ASCII letters
+# (dotted/dotless i, long s, Kelvin sign). str.lower() does not map them to
+# the ASCII letter, so lowercase-based gating would miss their matches.
+_CASEFOLD_SPECIAL = re.compile('[İıſK]')
+
+def has_top_level_alternation(pattern):
+    """True for patterns like r"\\bfoo|bar" where the prefix does not apply to every branch."""
+    depth = 0
+    in_class = False
+    i = 0
+    while i < len(pattern):
+        ch = pattern[i]
+        if ch == '\\':
+            i += 2
+            continue
+        if in_class:
+            if ch == ']':
+                in_class = False
+        elif ch == '[':
+            in_class = True
+        elif ch == '(':
+            depth += 1
+        elif ch == ')':
+            depth -= 1
+        elif ch == '|' and depth == 0:
+            return True
+        i += 1
+    return False
+
+def literal_prefix(pattern):
+    """
+    Returns the lowercase literal text a pattern must start with (after an
+    optional leading \\b), or '' if it cannot be determined.
+    e.g. r"\\bc\\+\\+" -> "c++", r"\\bhtml\\d?\\b" -> "html", r"M\\.?\\s*Tech" -> "m"
+    """
+    if has_top_level_alternation(pattern):
+        return ''
+
+    prefix = []
+    i = 2 if pattern.startswith(r'\b') else 0
+    while i < len(pattern):
+        ch = pattern[i]
+        if ch == '\\':
+            nxt = pattern[i + 1] if i + 1 < len(pattern) else ''
+            # Escaped punctuation is a literal; \s, \d, \b, \a ... are classes/assertions
+            if not nxt or nxt.isalnum() or nxt == '_':
+                break
+            literal, width = nxt, 2
+        elif ch in _REGEX_META:
+            break
+        else:
+            literal, width = ch, 1
+
+        # An optional character cannot be part of the required prefix
+        if pattern[i + width:i + width + 1] in _QUANTIFIERS:
+            break
+        prefix.append(literal)
+        i += width
+
+    return ''.join(prefix).lower()
+
+def prefix_trie_pattern(prefixes):
+    """
+    Builds one regex matching wherever any of the prefixes starts, written
+    as a character trie so a failing position costs about one comparison per
+    character instead of one per prefix. The match is the longest prefix
+    present at that position, e.g. ["m", "mast"] -> r"m(?:ast)?".
+    """
+    root = {}
+    for prefix in prefixes:
+        node = root
+        for ch in prefix:
+            node = node.setdefault(ch, {})
+        node[''] = None
+
+    def emit(node):
+        children = [(ch, child) for ch, child in sorted(node.items()) if ch]
+        if not children:
+            return ''
+        branches = [re.escape(ch) + emit(child) for ch, child in children]
+        body = branches[0] if len(branches) == 1 else '(?:' + '|'.join(branches) + ')'
+        if '' not in node:
+            return body
+        return ('(?:' + body + ')?') if len(body) > 1 else body + '?'
+
+    return emit(root)
+
+def lowercase_gate_safe(text, lowered):
+    """
+    True if positions in `lowered` (text.lower()) line up with `text` and
+    lowercase prefix checks agree with IGNORECASE matching for ASCII prefixes.
+    """
+    return len(lowered) == len(text) and (text.isascii() or not _CASEFOLD_SPECIAL.search(text))
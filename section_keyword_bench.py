@@ -0,0 +1,75 @@
+import argparse
+import random
+import re
+import timeit
+
+import section_parser
+from section_keyword import SECTION_KEYWORDS
+from section_parser import get_body_font_stats, is_header_line, match_section_keyword
+
+BODY_WORDS = ("developed", "a", "scalable", "pipeline", "using", "python", "and", "docker",
+              "for", "the", "team", "improved", "latency", "by", "30%", "research", "on", "models")
+
+def legacy_match_section_keyword(text):
+    """The original implementation: one freshly built regex per keyword per call."""
+    t = re.sub(r'[^a-z ]', '', text.lower())
+    for section, keywords in SECTION_KEYWORDS.items():
+        for k in keywords:
+            pattern = r'\b' + re.escape(k) + r'\b'
+            if re.search(pattern, t):
+                return section
+    return None
+
+def make_synthetic_cv(pages=10, lines_per_page=55, seed=0):
+    """A 10-page CV worth of lines: mostly body text with a header every ~12 lines."""
+    rng = random.Random(seed)
+    headers = [k.upper() for keywords in SECTION_KEYWORDS.values() for k in keywords]
+    lines = []
+    for i in range(pages * lines_per_page):
+        if i % 12 == 0:
+            lines.append({"text": rng.choice(headers), "font_size": 13.0, "bold_ratio": 1.0,
+                          "font_name": "Helvetica-Bold"})
+        else:
+            words = [rng.choice(BODY_WORDS) for _ in range(rng.randint(3, 16))]
+            lines.append({"text": " ".join(words), "font_size": 10.0, "bold_ratio": 0.0,
+                          "font_name": "Helvetica"})
+    return lines
+
+def per_line_us(fn, lines, number):
+    total = min(timeit.repeat(lambda: [fn(l) for l in lines], number=number, repeat=5))
+    return total / number / len(lines) * 1e6
+
+def main():
+    arg_parser = argparse.ArgumentParser(description="Benchmark header classification before/after the keyword index.")
+    arg_parser.add_argument("--pages", type=int, default=10)
+    arg_parser.add_argument("-n", "--number", type=int, default=5, help="Passes over the CV per timing run")
+    args = arg_parser.parse_args()
+
+    lines = make_synthetic_cv(pages=args.pages)
+    body_size, body_font = get_body_font_stats(lines)
+
+    mismatches = [l["text"] for l in lines if legacy_match_section_keyword(l["text"]) != match_section_keyword(l["text"])]
+    if mismatches:
+        print(f"Error: keyword index disagrees with the legacy matcher on {len(mismatches)} line(s), e.g. {mismatches[0]!r}")
+        return
+
+    new_match = per_line_us(lambda l: match_section_keyword(l["text"]), lines, args.number)
+    new_header = per_line_us(lambda l: is_header_line(l, body_size, body_font), lines, args.number)
+
+    # is_header_line looks the matcher up at call time, so swap the legacy one in
+    original = section_parser.match_section_keyword
+    section_parser.match_section_keyword = legacy_match_section_keyword
+    try:
+        legacy_match = per_line_us(lambda l: legacy_match_section_keyword(l["text"]), lines, args.number)
+        legacy_header = per_line_us(lambda l: is_header_line(l, body_size, body_font), lines, args.number)
+    finally:
+        section_parser.match_section_keyword = original
+
+    print(f"Synthetic CV: {args.pages} pages, {len(lines)} lines")
+    print(f"  match_section_keyword : {legacy_match:8.2f} us/line -> {new_match:6.2f} us/line "
+          f"({legacy_match / new_match:.1f}x)")
+    print(f"  is_header_line        : {legacy_header:8.2f} us/line -> {new_header:6.2f} us/line "
+          f"({legacy_header / new_header:.1f}x)")
+
+if __name__ == "__main__":
+    main()
@@ -1,5 +1,5 @@
 import re
-from collections import Counter
+from collections import Counter, namedtuple
 from section_keyword import SECTION_KEYWORDS
 
 # --- Helper Functions ---
@@ -17,23 +17,63 @@ def get_body_font_stats(lines):
     
     return body_size, body_font
 
+# --- Section Keyword Index (built once at import) ---
+# match_section_keyword strips text down to [a-z ] before matching, so a
+# \bkeyword\b hit is exactly a run of whole words equal to the keyword's words.
+# Keywords are indexed by their first word; each line is then classified with
+# one dictionary lookup per word. Precedence follows SECTION_KEYWORDS order
+# (first section, then first keyword wins), as before.
+
+_NON_ALPHA = re.compile(r'[^a-z ]')
+_KEYWORD_SHAPE = re.compile(r'[a-z]+(?: [a-z]+)*')
+
+def build_keyword_index(section_keywords):
+    """
+    Returns {first word: [(keyword words, precedence, section), ...]}.
+    """
+    index = {}
+    precedence = 0
+    for section, keywords in section_keywords.items():
+        for k in keywords:
+            # Keywords with other characters (e.g. "co-curricular") can never
+            # match the stripped text, so they are left out
+            if _KEYWORD_SHAPE.fullmatch(k):
+                words = tuple(k.split(' '))
+                index.setdefault(words[0], []).append((words, precedence, section))
+            precedence += 1
+    return index
+
+SECTION_KEYWORD_INDEX = build_keyword_index(SECTION_KEYWORDS)
+
+def reset_keyword_index():
+    """Rebuilds SECTION_KEYWORD_INDEX from SECTION_KEYWORDS as it is now."""
+    global SECTION_KEYWORD_INDEX
+    SECTION_KEYWORD_INDEX = build_keyword_index(SECTION_KEYWORDS)
+
 def match_section_keyword(text):
     """Checks if text matches any of the defined section keywords."""
-    t = re.sub(r'[^a-z ]', '', text.lower())
-    for section, keywords in SECTION_KEYWORDS.items():
-        for k in keywords:
+    words = _NON_ALPHA.sub('', text.lower()).split(' ')
+    best_precedence, best_section = None, None
+
+    for i, word in enumerate(words):
+        candidates = SECTION_KEYWORD_INDEX.get(word)
+        if not candidates:
+            continue
+        for kw_words, precedence, section in candidates:
+            if best_precedence is not None and precedence >= best_precedence:
+                continue
             # Match exact word boundary
-            pattern = r'\b' + re.escape(k) + r'\b'
-            if re.search(pattern, t):
-                return section
-    return None
+            if len(kw_words) == 1 or tuple(words[i:i + len(kw_words)]) == kw_words:
+                best_precedence, best_section = precedence, section
 
-def is_header_line(line, body_size, body_font_name=None):
-    """
-    Scoring system to determine if a line is a section header.
-    """
+    return best_section
+
+HEADER_SCORE_THRESHOLD = 5
+KEYWORD_SCORE = 2
+
+def _style_score(line, text, body_size, body_font_name):
+    """Rules 1-4 of the header score (everything except the keyword rule)."""
     score = 0
-    text = line["text"]
 
     # Rule 1: Font Size (Larger than body)
     if line["font_size"] >= body_size * 1.2:
@@ -52,58 +92,94 @@ def is_header_line(line, body_size, body_font_name=None):
     # Rule 4: Length (Short lines are more likely headers)
     if len(text.split()) <= 4:
         score += 1
+
+    return score
+
+def is_header_line(line, body_size, body_font_name=None):
+    """
+    Scoring system to determine if a line is a section header.
+    """
+    text = line["text"]
+    score = _style_score(line, text, body_size, body_font_name)
     
     # Rule 5: Keywords (Strongest indicator)
     if match_section_keyword(text):
-        score += 2
+        score += KEYWORD_SCORE
 
     # Threshold: score >= 5 implies it is a header
-    return score >= 5
+    return score >= HEADER_SCORE_THRESHOLD
+
+def classify_header(line, body_size, body_font_name=None):
+    """
+    Returns (is_header, section_type) with the keyword looked up at most once.
+    Lines whose style score cannot reach the threshold even with a keyword
+    skip the lookup entirely.
+    """
+    text = line["text"]
+    score = _style_score(line, text, body_size, body_font_name)
+    if score + KEYWORD_SCORE < HEADER_SCORE_THRESHOLD:
+        return False, None
+
+    section_type = match_section_keyword(text)
+    if section_type:
+        score += KEYWORD_SCORE
+    return score >= HEADER_SCORE_THRESHOLD, section_type
 
 # --- Main Logic ---
+# Sections are returned as spans over the caller's line list, which is never
+# modified, so the same (e.g. cached) lines can be sectioned concurrently.
 
-def process_lines_to_sections(lines):
+SectionSpan = namedtuple("SectionSpan", "key header start end")
+
+def find_section_spans(lines):
     """
-    Takes raw lines, detects headers, and groups content into sections.
+    One pass over lines: detects headers and returns [SectionSpan, ...] in
+    document order. lines[span.start:span.end] is the section's content;
+    span.header is the header line's index (None for the leading header_info).
+    Repeated section keys produce several spans (merged by sections_view).
     """
     if not lines:
-        return {}
+        return []
 
     # 1. Analyze the document style
     body_size, body_font_name = get_body_font_stats(lines)
-    
-    # 2. Tag lines as headers
+
+    # 2. Classify lines and cut spans at each header
+    spans = []
     misc_count = 0
-    labeled_lines = []
-    
-    for l in lines:
-        if is_header_line(l, body_size, body_font_name):
-            l["is_header"] = True
-            section_type = match_section_keyword(l["text"])
-            
-            if section_type:
-                # Create unique section name combining section type and actual text
-                l["section"] = f"{section_type}-{l['text']}"
-            else:
-                l["section"] = f"misc_{misc_count}"
-                misc_count += 1
+    current_key, current_header, start = "header_info", None, 0  # Default top section (name, contact, etc)
+
+    for i, l in enumerate(lines):
+        is_header, section_type = classify_header(l, body_size, body_font_name)
+        if not is_header:
+            continue
+
+        spans.append(SectionSpan(current_key, current_header, start, i))
+        if section_type:
+            # Create unique section name combining section type and actual text
+            current_key = f"{section_type}-{l['text']}"
         else:
-            l["is_header"] = False
-        
-        labeled_lines.append(l)
+            current_key = f"misc_{misc_count}"
+            misc_count += 1
+        current_header, start = i, i + 1
 
-    # 3. Group into dictionary
+    spans.append(SectionSpan(current_key, current_header, start, len(lines)))
+    return spans
+
+def sections_view(lines, spans):
+    """
+    Dict-of-lists view of spans: {section key: [content lines]}, keys in
+    first-appearance order, content of repeated keys concatenated.
+    The lists hold the original line objects.
+    """
     sections = {}
-    current_section = "header_info" # Default top section (name, contact, etc)
-    sections[current_section] = []
-
-    for l in labeled_lines:
-        if l.get("is_header"):
-            # Start a new section bucket
-            current_section = l["section"]
-            sections.setdefault(current_section, [])
-        else:
-            # Add line to current bucket (entire line object with all info)
-            sections.setdefault(current_section, []).append(l)
+    for span in spans:
+        sections.setdefault(span.key, []).extend(lines[span.start:span.end])
+    return sections
 
-    return sections
\ No newline at end of file
+def process_lines_to_sections(lines):
+    """
+    Takes raw lines, detects headers, and groups content into sections.
+    The input lines are left untouched (see find_section_spans).
+    """
+    return sections_view(lines, find_section_spans(lines))
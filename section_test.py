@@ -1,4 +1,5 @@
 from pdf_processor import extract_lines_from_pdf
+from line_record import json_default
 from section_parser import process_lines_to_sections
 import json
 
@@ -33,7 +34,7 @@ def main():
     
     # Optional: Save to JSON to see the structure
     with open("output.json", "w") as f:
-        json.dump(sections, f, indent=4)
+        json.dump(sections, f, indent=4, default=json_default)
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
@@ -1,6 +1,98 @@
 import re
+from line_record import Line
+from regex_prefix import literal_prefix
 from skill_data import SKILL_DB
 
+# --- Compiled Matcher (built on first use) ---
+# Every SKILL_DB pattern starting with \b + literal text can only match at the
+# start of a word whose first characters equal that literal. We bucket patterns
+# by their first one or two literal characters, then walk the word starts of the
+# text once and only try the handful of patterns in the matching buckets.
+# Cost grows with the text length, not with the size of the taxonomy.
+
+_WORD_START = re.compile(r'\b\w')
+
+def _skill_prefix(pattern):
+    """
+    Literal prefix usable for word-start bucketing: the pattern must start
+    with \\b and its prefix with a word character, e.g. r"\\bc\\+\\+" -> "c++".
+    """
+    if not pattern.startswith(r'\b'):
+        return ''
+    text = literal_prefix(pattern)
+    # Bucketing relies on the match starting at a word start
+    if text and not re.match(r'\w', text[0]):
+        return ''
+    return text
+
+def build_skill_matcher(skill_db):
+    """
+    Compiles a skill taxonomy (Category -> {Skill -> [patterns]}) into lookup tables.
+    """
+    matcher = {
+        "by_two": {},    # first two prefix chars -> [(category, skill, compiled)]
+        "by_one": {},    # single-char prefixes, e.g. r"\bc\b"
+        "fallback": [],  # patterns without a usable literal prefix
+        # Taxonomy order at build time, so output matches the compiled patterns
+        "order": [(category, list(skills_map)) for category, skills_map in skill_db.items()]
+    }
+
+    for category, skills_map in skill_db.items():
+        for skill_name, patterns in skills_map.items():
+            for pattern in patterns:
+                entry = (category, skill_name, re.compile(pattern, re.IGNORECASE))
+                prefix = _skill_prefix(pattern)
+                if len(prefix) >= 2:
+                    matcher["by_two"].setdefault(prefix[:2], []).append(entry)
+                elif prefix:
+                    matcher["by_one"].setdefault(prefix, []).append(entry)
+                else:
+                    matcher["fallback"].append(entry)
+
+    return matcher
+
+_skill_matcher = None
+
+def skill_matcher():
+    """SKILL_DB compiled by build_skill_matcher, once per process."""
+    global _skill_matcher
+    if _skill_matcher is None:
+        _skill_matcher = build_skill_matcher(SKILL_DB)
+    return _skill_matcher
+
+def reset_skill_matcher():
+    """Drops the compiled SKILL_DB; the next match compiles the table as it is now."""
+    global _skill_matcher
+    _skill_matcher = None
+
+def match_skills(text, matcher=None):
+    """
+    Returns the set of (category, skill) pairs whose patterns match anywhere in text.
+    Text is expected to be lowercase. matcher defaults to skill_matcher().
+    """
+    if matcher is None:
+        matcher = skill_matcher()
+    found = set()
+    by_two = matcher["by_two"]
+    by_one = matcher["by_one"]
+
+    for m in _WORD_START.finditer(text):
+        pos = m.start()
+        for bucket in (by_two.get(text[pos:pos + 2]), by_one.get(text[pos])):
+            if not bucket:
+                continue
+            for category, skill_name, compiled in bucket:
+                key = (category, skill_name)
+                if key not in found and compiled.match(text, pos):
+                    found.add(key)
+
+    for category, skill_name, compiled in matcher["fallback"]:
+        key = (category, skill_name)
+        if key not in found and compiled.search(text):
+            found.add(key)
+
+    return found
+
 def extract_skills(section_lines):
     """
     Extracts skills from a list of text lines based on SKILL_DB.
@@ -10,24 +102,18 @@ def extract_skills(section_lines):
         return {}
 
     # Combine all lines into one lowercase string for searching
-    # We use a set for the found skills to avoid duplicates (e.g. finding "Python" twice)
-    full_text = " ".join([l['text'] if isinstance(l, dict) else str(l) for l in section_lines]).lower()
-    
+    full_text = " ".join([l['text'] if isinstance(l, (dict, Line)) else str(l) for l in section_lines]).lower()
+
+    # Single scan over the text finds every skill at once
+    matcher = skill_matcher()
+    found = match_skills(full_text, matcher)
+
     extracted_skills = {}
 
-    for category, skills_map in SKILL_DB.items():
-        found_in_category = set()
-        
-        for skill_name, patterns in skills_map.items():
-            for pattern in patterns:
-                # Use re.IGNORECASE just to be safe, though text is already lowered
-                # We check the pattern against the full text
-                if re.search(pattern, full_text, re.IGNORECASE):
-                    found_in_category.add(skill_name)
-                    # Break loop once skill is found (don't need to match alias if main name matched)
-                    break
-        
+    # Emit in taxonomy order so the output is stable between runs
+    for category, skill_names in matcher["order"]:
+        found_in_category = [name for name in skill_names if (category, name) in found]
         if found_in_category:
-            extracted_skills[category] = list(found_in_category)
+            extracted_skills[category] = found_in_category
 
-    return extracted_skills
\ No newline at end of file
+    return extracted_skills
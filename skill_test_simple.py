@@ -2,6 +2,7 @@ import json
 from pdf_processor import extract_lines_from_pdf
 from section_parser import process_lines_to_sections
 from skill_extract import extract_skills
+from line_record import Line
 
 
 def test_single_pdf(pdf_filename="rizzume.pdf"):
@@ -39,7 +40,7 @@ def test_single_pdf(pdf_filename="rizzume.pdf"):
             print(f"  Section contains {len(skills_section)} lines")
             print("\n  Section Preview:")
             for i, line in enumerate(skills_section[:10], 1):
-                text = line.get('text', str(line)) if isinstance(line, dict) else str(line)
+                text = line.get('text', str(line)) if isinstance(line, (dict, Line)) else str(line)
                 print(f"    {i}. {text[:70]}")
             if len(skills_section) > 10:
                 print(f"    ... and {len(skills_section) - 10} more lines")
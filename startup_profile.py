@@ -0,0 +1,61 @@
+import subprocess
+import sys
+import time
+
+# --- Cold-Start Report ---
+# Runs a command in a fresh interpreter under `python -X importtime` and
+# summarizes where its start-up time went: total wall time, time spent
+# importing, and the import cost per top-level package (pdfminer, extract_edu,
+# ...). Lazily imported modules show up only if the run actually needed them.
+
+STARTUP_TOP = 15  # packages listed in the report
+
+def parse_importtime(stderr):
+    """Returns [(module, self_us, cumulative_us)] from -X importtime output."""
+    rows = []
+    for line in stderr.splitlines():
+        if not line.startswith("import time:"):
+            continue
+        fields = line[len("import time:"):].split("|")
+        if len(fields) != 3 or not fields[0].strip().isdigit():
+            continue  # the column header
+        rows.append((fields[2].strip(), int(fields[0]), int(fields[1])))
+    return rows
+
+def profile_startup(args):
+    """
+    Runs `python -X importtime *args` and returns a report dict:
+    wall_ms, import_ms, modules, returncode and by_package (heaviest first).
+    """
+    start = time.perf_counter()
+    proc = subprocess.run([sys.executable, "-X", "importtime", *args], stdout=subprocess.DEVNULL,
+                          stderr=subprocess.PIPE, text=True)
+    wall = time.perf_counter() - start
+
+    rows = parse_importtime(proc.stderr)
+    packages = {}
+    for module, self_us, _ in rows:
+        entry = packages.setdefault(module.split(".")[0], {"self_us": 0, "modules": 0})
+        entry["self_us"] += self_us
+        entry["modules"] += 1
+    by_package = sorted(packages.items(), key=lambda item: item[1]["self_us"], reverse=True)
+
+    return {
+        "command": args,
+        "returncode": proc.returncode,
+        "wall_ms": round(wall * 1000, 1),
+        "import_ms": round(sum(row[1] for row in rows) / 1000, 1),
+        "modules": len(rows),
+        "by_package": [{"package": name, "import_ms": round(entry["self_us"] / 1000, 1), "modules": entry["modules"]}
+                       for name, entry in by_package]
+    }
+
+def format_startup_report(report, top=STARTUP_TOP):
+    lines = [
+        f"Cold start: {report['wall_ms']:.0f} ms wall, {report['import_ms']:.0f} ms importing "
+        f"{report['modules']} modules (exit code {report['returncode']})",
+        f"{'package':<28} {'import ms':>10} {'modules':>8}"
+    ]
+    for entry in report["by_package"][:top]:
+        lines.append(f"{entry['package']:<28} {entry['import_ms']:>10.1f} {entry['modules']:>8}")
+    return "\n".join(lines)
@@ -2,6 +2,7 @@ from collections import Counter
 import re
 import json
 from pdf_processor import extract_lines_from_pdf
+from line_record import json_default
 from section_parser import process_lines_to_sections
 
 def get_local_stats(lines):
@@ -227,7 +228,7 @@ def main():
     
     # 4. Save to subsec.json
     with open("subsec.json", "w") as f:
-        json.dump(output_data, f, indent=4, default=str)
+        json.dump(output_data, f, indent=4, default=json_default)
     
     print(f"Results saved to subsec.json")
 
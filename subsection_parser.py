@@ -16,14 +16,15 @@ def get_local_stats(lines):
     
     return local_size, local_font
 
+# Simple heuristic: matches years (19xx, 20xx) or months
+DATE_PATTERN = re.compile(r'\b(19|20)\d{2}\b|\b(jan|feb|mar|apr|may|jun|jul|aug|sep|oct|nov|dec)[a-z]*\b|present')
+
 def is_date_line(text):
     """
     Returns True if the line is primarily composed of date-like patterns.
     e.g., 'June 2020 - Present', '2019-2023', 'Summer 2021'
     """
-    # Simple heuristic: matches years (19xx, 20xx) or months
-    date_pattern = r'\b(19|20)\d{2}\b|\b(jan|feb|mar|apr|may|jun|jul|aug|sep|oct|nov|dec)[a-z]*\b|present'
-    matches = re.findall(date_pattern, text.lower())
+    matches = DATE_PATTERN.findall(text.lower())
     
     # If we find 2+ date components or the text is very short and contains a date
     if len(matches) >= 2:
@@ -42,10 +43,41 @@ def is_bullet_point(text):
         return False
     return clean[0] in bullets
 
-def is_subsection_header(line, prev_line, local_stats, all_lines=None, current_idx=None):
+def compute_line_features(section_lines):
+    """
+    Computes the per-line inputs of is_subsection_header in one linear pass:
+    is_date, is_bullet, gap (vertical distance to the previous line) and
+    date_before (a date line appears after the last section header and before this line).
+    """
+    features = []
+    date_seen = False
+    prev_line = None
+
+    for line in section_lines:
+        text = line.get("text", "")
+        is_date = is_date_line(text)
+        features.append({
+            "is_date": is_date,
+            "is_bullet": is_bullet_point(text),
+            "gap": abs(prev_line["y"] - line["y"]) if prev_line else None,
+            "date_before": date_seen
+        })
+
+        # Running state for the lines that follow
+        if line.get("is_header"):
+            date_seen = False
+        elif is_date:
+            date_seen = True
+        prev_line = line
+
+    return features
+
+def is_subsection_header(line, prev_line, local_stats, all_lines=None, current_idx=None, features=None):
     """
     Determines if a line is a Subsection Header (e.g., Job Title, Project Name).
     Returns a tuple: (is_header, total_score, score_breakdown_dict)
+    Pass this line's entry from compute_line_features to avoid recomputing
+    date/bullet checks and the backward date scan.
     """
     local_size, local_font = local_stats
     score = 0
@@ -53,13 +85,17 @@ def is_subsection_header(line, prev_line, local_stats, all_lines=None, current_i
     breakdown = {}
     
     # --- NEGATIVE FILTERS (The "Hard" Logic) ---
+    if features:
+        is_bullet, is_date = features["is_bullet"], features["is_date"]
+    else:
+        is_bullet, is_date = is_bullet_point(text), is_date_line(text)
     
     # 1. Bullet points are NEVER headers
-    if is_bullet_point(text):
+    if is_bullet:
         return False, 0, {}
 
     # 2. Dates are metadata, not headers
-    if is_date_line(text):
+    if is_date:
         return False, 0, {}
 
     # --- POSITIVE SCORING ---
@@ -86,7 +122,7 @@ def is_subsection_header(line, prev_line, local_stats, all_lines=None, current_i
     # 4. Vertical Spacing (The "Gap" Logic)
     # Headers usually have more space above them than normal lines
     if prev_line:
-        raw_gap = abs(prev_line["y"] - line["y"])
+        raw_gap = features["gap"] if features else abs(prev_line["y"] - line["y"])
         if raw_gap > line["font_size"] * 1.5:
              score += 1
              breakdown["vertical_spacing"] = 1
@@ -103,14 +139,17 @@ def is_subsection_header(line, prev_line, local_stats, all_lines=None, current_i
 
     # 7. Date between section and this line (dates often precede job/project titles)
     if all_lines and current_idx is not None:
-        # Look back to find if there's a date between this line and the last section header
-        found_date = False
-        for i in range(current_idx - 1, -1, -1):
-            if all_lines[i].get("is_header"):
-                break  # Stop at section header
-            if is_date_line(all_lines[i].get("text", "")):
-                found_date = True
-                break
+        if features:
+            found_date = features["date_before"]
+        else:
+            # Look back to find if there's a date between this line and the last section header
+            found_date = False
+            for i in range(current_idx - 1, -1, -1):
+                if all_lines[i].get("is_header"):
+                    break  # Stop at section header
+                if is_date_line(all_lines[i].get("text", "")):
+                    found_date = True
+                    break
         if found_date:
             score += 1
             breakdown["date_proximity"] = 1
@@ -127,6 +166,8 @@ def extract_subsections(section_lines):
         return []
 
     local_stats = get_local_stats(section_lines)
+    # Per-line features are computed once, so the whole section is one linear pass
+    line_features = compute_line_features(section_lines)
     subsections = []
     
     current_sub = None
@@ -138,7 +179,8 @@ def extract_subsections(section_lines):
         # Pass previous line for gap analysis
         prev_line = section_lines[i-1] if i > 0 else None
         
-        is_header, total_score, breakdown = is_subsection_header(line, prev_line, local_stats, section_lines, i)
+        is_header, total_score, breakdown = is_subsection_header(line, prev_line, local_stats, section_lines, i,
+                                                                 features=line_features[i])
         
         if is_header:
             # Save previous subsection
@@ -1,4 +1,5 @@
 from pdf_processor import extract_lines_from_pdf
+from line_record import json_default
 from section_parser import process_lines_to_sections
 from subsection_parser import extract_subsections
 import json
@@ -36,7 +37,7 @@ def main():
     
     # 4. Save to output.json
     with open("output.json", "w") as f:
-        json.dump(output_data, f, indent=4, default=str)
+        json.dump(output_data, f, indent=4, default=json_default)
     
     print(f"Results saved to output.json")
 
@@ -0,0 +1,260 @@
+import argparse
+import os
+import random
+import zlib
+
+# --- Synthetic Resume PDF Generator ---
+# Writes resume-shaped PDFs with the standard library only (base-14 fonts,
+# WinAnsi text, URI link annotations), so benchmark corpora can be rebuilt
+# anywhere from a seed without reportlab or real candidate data.
+
+PAGE_WIDTH, PAGE_HEIGHT = 612.0, 792.0  # US Letter, points
+MARGIN = 50.0
+LEADING = 13.0
+COLUMN_GAP = 24.0
+
+# Regular / bold / italic font per mix; headers use the bold face
+FONT_MIXES = {
+    "helvetica": {"regular": "Helvetica", "bold": "Helvetica-Bold", "italic": "Helvetica-Oblique"},
+    "times": {"regular": "Times-Roman", "bold": "Times-Bold", "italic": "Times-Italic"},
+    "mixed": {"regular": "Helvetica", "bold": "Times-Bold", "italic": "Courier-Oblique"}
+}
+
+FIRST_NAMES = ("Ankeet", "Hardik", "Priya", "Rohan", "Sneha", "Arjun", "Meera", "Kabir")
+LAST_NAMES = ("Sharma", "Patel", "Iyer", "Reddy", "Gupta", "Nair", "Singh", "Rao")
+INSTITUTES = ("Indian Institute of Technology Bombay", "Indian Institute of Technology Delhi",
+              "IIT Madras", "IIT Kharagpur", "Indian Institute of Technology Roorkee")
+DEGREES = ("B.Tech in Computer Science and Engineering", "Dual Degree in Electrical Engineering",
+           "B.Tech in Mechanical Engineering", "M.Tech in Data Science", "B.Tech in Chemical Engineering")
+EXAMS = ("JEE Advanced", "JEE Mains", "KVPY", "GATE", "NTSE", "BITSAT")
+SKILLS = ("Python", "C++", "Java", "JavaScript", "SQL", "React", "Node.js", "PyTorch", "TensorFlow",
+          "Docker", "Kubernetes", "AWS", "Linux", "Git", "MongoDB", "Redis", "Go", "Rust", "Pandas")
+COMPANIES = ("Google", "Microsoft", "Goldman Sachs", "Flipkart", "Adobe", "Samsung Research", "Uber")
+ROLES = ("Software Engineer Intern", "Research Intern", "Quant Analyst Intern", "Data Science Intern")
+PROJECTS = ("Resume Parser", "Chess Engine", "Distributed Key-Value Store", "Image Captioning",
+            "Compiler for a Toy Language", "Stock Price Forecasting")
+VERBS = ("Built", "Designed", "Optimised", "Implemented", "Led", "Improved", "Deployed")
+OBJECTS = ("a scalable ingestion pipeline", "latency-critical services", "an NLP ranking model",
+           "the CI/CD workflow", "a real-time dashboard", "caching for hot paths")
+POSITIONS = ("Secretary, Coding Club", "Coordinator, Entrepreneurship Cell", "Head, Robotics Team")
+
+# Section header -> body generator; order is the default section order
+SECTION_TYPES = ("EDUCATION", "SCHOLASTIC ACHIEVEMENTS", "TECHNICAL SKILLS", "WORK EXPERIENCE",
+                 "PROJECTS", "POSITIONS OF RESPONSIBILITY", "RELEVANT COURSEWORK", "EXTRACURRICULAR ACTIVITIES")
+
+def _bullet(rng):
+    return f"• {rng.choice(VERBS)} {rng.choice(OBJECTS)} using {rng.choice(SKILLS)}, " \
+           f"cutting cost by {rng.randint(10, 60)}%"
+
+def _years(rng):
+    start = rng.randint(2015, 2023)
+    return f"{rng.choice(('May', 'Jun', 'Aug', 'Dec'))} {start} - {rng.choice(('Jul', 'Nov', 'Apr'))} {start + 1}"
+
+def _section_body(header, rng):
+    """Returns [(style, text)] entries for one section; style is regular/bold/italic."""
+    if header == "EDUCATION":
+        return [("bold", rng.choice(INSTITUTES)), ("regular", rng.choice(DEGREES)),
+                ("italic", f"{rng.randint(2015, 2021)} - {rng.randint(2022, 2026)}    CGPA {rng.uniform(7, 10):.2f}")]
+    if header == "SCHOLASTIC ACHIEVEMENTS":
+        return [("regular", f"• Secured AIR {rng.randint(1, 20000):,} in {rng.choice(EXAMS)} "
+                            f"{rng.randint(2015, 2021)} among {rng.randint(1, 12)} lakh candidates")
+                for _ in range(rng.randint(2, 4))]
+    if header == "TECHNICAL SKILLS":
+        return [("regular", f"{label}: " + ", ".join(rng.sample(SKILLS, rng.randint(4, 8))))
+                for label in ("Languages", "Tools", "Frameworks")[:rng.randint(2, 3)]]
+    if header == "WORK EXPERIENCE":
+        body = []
+        for _ in range(rng.randint(1, 3)):
+            body += [("bold", rng.choice(ROLES)), ("regular", rng.choice(COMPANIES)), ("italic", _years(rng))]
+            body += [("regular", _bullet(rng)) for _ in range(rng.randint(2, 4))]
+        return body
+    if header == "PROJECTS":
+        body = []
+        for _ in range(rng.randint(1, 3)):
+            body += [("bold", rng.choice(PROJECTS)), ("italic", str(rng.randint(2018, 2024)))]
+            body += [("regular", _bullet(rng)) for _ in range(rng.randint(1, 3))]
+        return body
+    if header == "POSITIONS OF RESPONSIBILITY":
+        return [("bold", rng.choice(POSITIONS)), ("italic", _years(rng)), ("regular", _bullet(rng))]
+    # Free-text sections
+    return [("regular", f"• {rng.choice(VERBS)} {rng.choice(OBJECTS)}") for _ in range(rng.randint(2, 4))]
+
+# --- PDF Serialization ---
+
+def _pdf_string(text):
+    encoded = text.encode("cp1252", "replace")
+    return b"(" + encoded.replace(b"\\", b"\\\\").replace(b"(", b"\\(").replace(b")", b"\\)") + b")"
+
+def _text_width(text, size):
+    # Rough average advance for the base-14 fonts; only used to size link rects
+    return len(text) * size * 0.5
+
+def build_pdf(pages, compress=True):
+    """
+    Serializes pages to PDF bytes.
+    pages: [{"text": [(font, size, x, y, str)], "links": [(x0, y0, x1, y1, uri)]}]
+    """
+    fonts = sorted({op[0] for page in pages for op in page["text"]}) or ["Helvetica"]
+    font_ids = {name: f"F{i}" for i, name in enumerate(fonts)}
+
+    objects = []  # bodies; object number = index + 1
+
+    def add(body):
+        objects.append(body)
+        return len(objects)
+
+    catalog = add(None)
+    page_tree = add(None)
+    font_refs = {name: add(f"<< /Type /Font /Subtype /Type1 /BaseFont /{name} "
+                           f"/Encoding /WinAnsiEncoding >>".encode("latin-1")) for name in fonts}
+    resources = b"<< /Font << " + b" ".join(
+        f"/{font_ids[name]} {ref} 0 R".encode("latin-1") for name, ref in font_refs.items()) + b" >> >>"
+
+    page_refs = []
+    for page in pages:
+        ops = []
+        for font, size, x, y, text in page["text"]:
+            ops.append(f"BT /{font_ids[font]} {size:g} Tf {x:.2f} {y:.2f} Td ".encode("latin-1")
+                       + _pdf_string(text) + b" Tj ET")
+        stream = b"\n".join(ops)
+        if compress:
+            stream = zlib.compress(stream)
+            content = add(f"<< /Length {len(stream)} /Filter /FlateDecode >>\nstream\n".encode("latin-1")
+                          + stream + b"\nendstream")
+        else:
+            content = add(f"<< /Length {len(stream)} >>\nstream\n".encode("latin-1") + stream + b"\nendstream")
+
+        annots = [add(f"<< /Type /Annot /Subtype /Link /Rect [{x0:.2f} {y0:.2f} {x1:.2f} {y1:.2f}] "
+                      f"/Border [0 0 0] /A << /S /URI /URI ".encode("latin-1") + _pdf_string(uri) + b" >> >>")
+                  for x0, y0, x1, y1, uri in page["links"]]
+        annots_entry = (b" /Annots [" + b" ".join(f"{a} 0 R".encode("latin-1") for a in annots) + b"]"
+                        if annots else b"")
+        page_refs.append(add(f"<< /Type /Page /Parent {page_tree} 0 R "
+                             f"/MediaBox [0 0 {PAGE_WIDTH:g} {PAGE_HEIGHT:g}] /Contents {content} 0 R "
+                             f"/Resources ".encode("latin-1") + resources + annots_entry + b" >>"))
+
+    objects[catalog - 1] = f"<< /Type /Catalog /Pages {page_tree} 0 R >>".encode("latin-1")
+    kids = " ".join(f"{ref} 0 R" for ref in page_refs)
+    objects[page_tree - 1] = f"<< /Type /Pages /Kids [{kids}] /Count {len(page_refs)} >>".encode("latin-1")
+
+    out = bytearray(b"%PDF-1.4\n%\xe2\xe3\xcf\xd3\n")
+    offsets = []
+    for number, body in enumerate(objects, start=1):
+        offsets.append(len(out))
+        out += f"{number} 0 obj\n".encode("latin-1") + body + b"\nendobj\n"
+    xref_at = len(out)
+    out += f"xref\n0 {len(objects) + 1}\n0000000000 65535 f \n".encode("latin-1")
+    for offset in offsets:
+        out += f"{offset:010d} 00000 n \n".encode("latin-1")
+    out += (f"trailer\n<< /Size {len(objects) + 1} /Root {catalog} 0 R >>\n"
+            f"startxref\n{xref_at}\n%%EOF\n").encode("latin-1")
+    return bytes(out)
+
+# --- Resume Layout ---
+
+def generate_resume(pages=1, columns=1, links=3, sections=6, font_mix="helvetica", seed=0):
+    """
+    Returns the PDF bytes of one synthetic resume.
+    pages: exact page count (sections repeat until every page is filled).
+    columns: text columns per page (1-3).
+    links: link annotations per page (contact links on page 1, project links after).
+    sections: number of distinct section types used, cycled in SECTION_TYPES order.
+    font_mix: key of FONT_MIXES.
+    """
+    if font_mix not in FONT_MIXES:
+        raise ValueError(f"Unknown font mix '{font_mix}', expected one of {tuple(FONT_MIXES)}")
+    if not 1 <= sections <= len(SECTION_TYPES):
+        raise ValueError(f"sections must be between 1 and {len(SECTION_TYPES)}")
+    if not 1 <= columns <= 3:
+        raise ValueError("columns must be between 1 and 3")
+
+    rng = random.Random(seed)
+    faces = FONT_MIXES[font_mix]
+    column_width = (PAGE_WIDTH - 2 * MARGIN - (columns - 1) * COLUMN_GAP) / columns
+    # Keep lines inside their column so columns never run into each other
+    max_chars = int(column_width / (10 * 0.5))
+    name = f"{rng.choice(FIRST_NAMES)} {rng.choice(LAST_NAMES)}"
+    handle = name.lower().replace(" ", "-")
+
+    out_pages = []
+    section_index = 0
+    for page_number in range(pages):
+        text, page_links = [], []
+        top = PAGE_HEIGHT - MARGIN
+
+        if page_number == 0:
+            text.append((faces["bold"], 18, MARGIN, top, name))
+            top -= 20
+            contact = f"{handle}@example.com | +91 9{rng.randint(100000000, 999999999)} | " \
+                      f"linkedin.com/in/{handle} | github.com/{handle}"
+            text.append((faces["regular"], 10, MARGIN, top, contact))
+            targets = (f"mailto:{handle}@example.com", f"https://www.linkedin.com/in/{handle}",
+                       f"https://github.com/{handle}")
+            for i in range(min(links, len(targets))):
+                x0 = MARGIN + i * 150
+                page_links.append((x0, top - 2, x0 + 140, top + 10, targets[i]))
+            top -= 30
+
+        # Lines that can carry a link: (x, y, text)
+        link_slots = []
+        for column in range(columns):
+            x = MARGIN + column * (column_width + COLUMN_GAP)
+            y = top
+            while y > MARGIN + 3 * LEADING:
+                header = SECTION_TYPES[section_index % sections]
+                section_index += 1
+                text.append((faces["bold"], 12, x, y, header))
+                y -= LEADING + 3
+                for style, entry in _section_body(header, rng):
+                    if y <= MARGIN:
+                        break
+                    entry = entry[:max_chars]
+                    indent = 10 if entry.startswith("•") else 0
+                    text.append((faces[style], 10, x + indent, y, entry))
+                    link_slots.append((x + indent, y, entry))
+                    y -= LEADING
+                y -= LEADING / 2
+
+        remaining = links - len(page_links)
+        for x, y, entry in rng.sample(link_slots, min(max(remaining, 0), len(link_slots))):
+            page_links.append((x, y - 2, x + min(_text_width(entry, 10), column_width), y + 10,
+                               f"https://github.com/{handle}/{rng.randint(1, 10 ** 6)}"))
+        out_pages.append({"text": text, "links": page_links})
+
+    return build_pdf(out_pages)
+
+def write_corpus(output_dir, profiles, count=1, seed=0):
+    """
+    Writes `count` resumes per profile ({"name", plus generate_resume kwargs})
+    to output_dir and returns their paths.
+    """
+    os.makedirs(output_dir, exist_ok=True)
+    paths = []
+    for profile in profiles:
+        options = {k: v for k, v in profile.items() if k != "name"}
+        for i in range(count):
+            path = os.path.join(output_dir, f"{profile['name']}-{i:03d}.pdf")
+            with open(path, "wb") as f:
+                f.write(generate_resume(seed=seed + i, **options))
+            paths.append(path)
+    return paths
+
+def main():
+    arg_parser = argparse.ArgumentParser(description="Generate synthetic resume PDFs.")
+    arg_parser.add_argument("output_dir")
+    arg_parser.add_argument("-n", "--count", type=int, default=10, help="Resumes to generate")
+    arg_parser.add_argument("--pages", type=int, default=1)
+    arg_parser.add_argument("--columns", type=int, default=1)
+    arg_parser.add_argument("--links", type=int, default=3, help="Link annotations per page")
+    arg_parser.add_argument("--sections", type=int, default=6, help=f"Distinct section types (1-{len(SECTION_TYPES)})")
+    arg_parser.add_argument("--fonts", choices=tuple(FONT_MIXES), default="helvetica")
+    arg_parser.add_argument("--seed", type=int, default=0)
+    args = arg_parser.parse_args()
+
+    profile = {"name": "resume", "pages": args.pages, "columns": args.columns, "links": args.links,
+               "sections": args.sections, "font_mix": args.fonts}
+    paths = write_corpus(args.output_dir, [profile], count=args.count, seed=args.seed)
+    print(f"Wrote {len(paths)} PDF(s) to {args.output_dir}")
+
+if __name__ == "__main__":
+    main()
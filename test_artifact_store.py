@@ -0,0 +1,51 @@
+import pytest
+
+import skill_data
+from artifact_store import current_fingerprints, load_document, save_document
+from line_cache import cache_key
+from parser import build_final_output_incremental, parse_resume, parse_resume_incremental
+from synthetic_resume import generate_resume
+
+@pytest.fixture
+def resume_path(tmp_path):
+    path = tmp_path / "resume.pdf"
+    path.write_bytes(generate_resume(seed=0))
+    return str(path)
+
+@pytest.fixture
+def skill_db_edit(monkeypatch):
+    # In-place table edit; undone (and recompiled) after the test
+    yield lambda: monkeypatch.setitem(skill_data.SKILL_DB, "Build Tools", {"Make": [r"\bc\+\+"]})
+    monkeypatch.undo()
+    current_fingerprints(refresh=True)
+
+def _rerun(store, path):
+    key = cache_key(path, backend="layout")
+    doc = load_document(store, key)
+    output, recomputed = build_final_output_incremental(doc, current_fingerprints())
+    save_document(store, key, doc)
+    return output, recomputed
+
+def test_incremental_parse_matches_full_parse(tmp_path, resume_path):
+    store = str(tmp_path / "store")
+    assert parse_resume_incremental(resume_path, store) == parse_resume(resume_path)
+
+    output, recomputed = _rerun(store, resume_path)
+    assert recomputed == []
+    assert output == parse_resume(resume_path)
+
+def test_in_place_table_edit_reruns_only_its_stage(tmp_path, resume_path, skill_db_edit):
+    store = str(tmp_path / "store")
+    parse_resume_incremental(resume_path, store)
+
+    skill_db_edit()
+    # Not refreshed yet: stored results, fingerprints and compiled tables all predate the edit
+    output, recomputed = _rerun(store, resume_path)
+    assert recomputed == []
+    assert "Build Tools" not in output["extracted"]["skill"]
+
+    current_fingerprints(refresh=True)
+    output, recomputed = _rerun(store, resume_path)
+    assert recomputed == ["skill"]
+    assert output["extracted"]["skill"]["Build Tools"] == ["Make"]
+    assert output == parse_resume(resume_path)
@@ -0,0 +1,91 @@
+import asyncio
+import os
+
+import pytest
+
+from async_ingest import DirectoryWatcher, QueueSink, QueueSource, run_pipeline
+from synthetic_resume import generate_resume
+
+class WorkerKiller:
+    """Job source whose unpickling ends the worker process, breaking the pool."""
+
+    def __reduce__(self):
+        return os._exit, (1,)
+
+class FlakySink(QueueSink):
+    """Fails to write the record of one job."""
+
+    def __init__(self, failing_id):
+        super().__init__()
+        self.failing_id = failing_id
+
+    async def write(self, record):
+        if record["job_id"] == self.failing_id:
+            raise OSError("disk full")
+        await super().write(record)
+
+@pytest.fixture(scope="module")
+def pdfs(tmp_path_factory):
+    directory = tmp_path_factory.mktemp("pdfs")
+    short = directory / "short.pdf"
+    short.write_bytes(generate_resume(seed=1))
+    long = directory / "long.pdf"
+    long.write_bytes(generate_resume(pages=30, seed=2))
+    return str(short), str(long)
+
+def _run(jobs, sink=None, **options):
+    async def run():
+        source = QueueSource()
+        for job in jobs:
+            await source.put(job)
+        await source.close()
+        out = sink or QueueSink()
+        summary = await run_pipeline(source, out, workers=1, **options)
+        records = []
+        while not out.queue.empty():
+            records.append(out.queue.get_nowait())
+        return summary, {record["job_id"]: record for record in records}
+    return asyncio.run(run())
+
+def test_job_deadline_overrides_driver_deadline_both_ways(pdfs):
+    _, long = pdfs
+    summary, records = _run([{"id": "raised", "source": long, "deadline": 60},
+                             {"id": "lowered", "source": long, "deadline": 0.01}], deadline=0.01)
+    assert records["raised"]["status"] == "ok"
+    assert records["lowered"]["status"] == "timeout"
+    assert summary["ok"] == summary["timeout"] == 1
+
+def test_job_deadline_applies_without_driver_deadline(pdfs):
+    _, long = pdfs
+    summary, records = _run([{"id": "job", "source": long, "deadline": 0.01}], deadline=0)
+    # Stopped by the worker's alarm, not abandoned by the driver
+    assert records["job"]["status"] == "timeout"
+    assert records["job"]["worker"] is not None
+
+def test_broken_pool_is_replaced(pdfs):
+    short, _ = pdfs
+    jobs = [{"id": "before", "source": short}, {"id": "killer", "source": WorkerKiller()},
+            {"id": "after", "source": short}]
+    summary, records = _run(jobs, concurrency=1)
+    assert records["before"]["status"] == "ok"
+    assert records["killer"]["status"] == "error"
+    assert records["killer"]["error"].startswith("BrokenProcessPool")
+    assert records["after"]["status"] == "ok"
+    assert summary["total"] == 3
+
+def test_sink_failure_keeps_other_records(pdfs):
+    short, _ = pdfs
+    jobs = [{"id": n, "source": short} for n in range(3)]
+    summary, records = _run(jobs, sink=FlakySink(failing_id=1))
+    assert set(records) == {0, 2}
+    assert summary["ok"] == 3
+    assert summary["sink_errors"] == 1
+
+def test_directory_watcher_once_lists_present_pdfs(tmp_path):
+    (tmp_path / "b.pdf").write_bytes(b"")
+    (tmp_path / "a.PDF").write_bytes(b"")
+    (tmp_path / "notes.txt").write_text("")
+
+    async def collect():
+        return [job["id"] async for job in DirectoryWatcher(str(tmp_path), once=True)]
+    assert asyncio.run(collect()) == [str(tmp_path / "a.PDF"), str(tmp_path / "b.pdf")]
@@ -0,0 +1,101 @@
+import json
+import os
+import subprocess
+import sys
+
+import pytest
+
+import batch_parser
+from batch_parser import collect_pdf_paths, init_worker, run_batch
+from synthetic_resume import generate_resume
+
+@pytest.fixture
+def corpus(tmp_path):
+    paths = []
+    for seed in range(3):
+        path = tmp_path / f"resume_{seed}.pdf"
+        path.write_bytes(generate_resume(seed=seed))
+        paths.append(str(path))
+    broken = tmp_path / "broken.pdf"
+    broken.write_bytes(b"%PDF-1.4 not really a pdf")
+    return paths, str(broken)
+
+def _read_jsonl(path):
+    with open(path) as f:
+        return [json.loads(line) for line in f]
+
+def test_collect_pdf_paths_expands_targets_once(tmp_path, corpus):
+    paths, broken = corpus
+    manifest = tmp_path / "manifest.txt"
+    manifest.write_text("# first two\nresume_0.pdf\n\nresume_1.pdf\n")
+
+    found = collect_pdf_paths([str(manifest), str(tmp_path), str(tmp_path / "resume_*.pdf")])
+    assert found == paths[:2] + [broken, paths[2]]
+
+def test_run_batch_writes_one_record_per_document(tmp_path, corpus):
+    paths, broken = corpus
+    output = str(tmp_path / "out.jsonl")
+
+    summary = run_batch(paths + [broken], output, workers=2, extractors=("contact", "skill"), sections=())
+    assert summary["total"] == 4
+    assert summary["ok"] == 3
+    assert summary["ok"] + summary["empty"] + summary["error"] == 4
+
+    records = {record["source"]: record for record in _read_jsonl(output)}
+    assert set(records) == set(paths + [broken])
+    for path in paths:
+        assert set(records[path]["result"]["extracted"]) == {"contact", "skill"}
+        assert records[path]["result"]["resume"] == {}
+    assert records[broken]["status"] in ("empty", "error")
+
+def test_run_batch_times_out_slow_documents(tmp_path):
+    path = tmp_path / "long.pdf"
+    path.write_bytes(generate_resume(pages=30))
+    output = str(tmp_path / "out.jsonl")
+
+    summary = run_batch([str(path)], output, workers=1, timeout=0.01)
+    assert summary["timeout"] == 1
+    assert _read_jsonl(output)[0]["error"] == "Exceeded 0.01s timeout"
+
+def test_init_worker_warms_the_whole_pipeline():
+    # Fresh interpreter: importing the driver alone leaves pdfminer and the tables unloaded
+    script = (
+        "import json, sys\n"
+        "import batch_parser, extract_edu, pdf_processor, rank_extract, skill_extract\n"
+        "def state():\n"
+        "    return ['pdfminer' in sys.modules, 'subsection_parser' in sys.modules,\n"
+        "            pdf_processor.TopBandAggregator is not None, skill_extract._skill_matcher is not None,\n"
+        "            rank_extract._rank_engine is not None, extract_edu._edu_classifier is not None]\n"
+        "before = state()\n"
+        "batch_parser.init_worker()\n"
+        "print(json.dumps([before, state()]))\n")
+    proc = subprocess.run([sys.executable, "-c", script], capture_output=True, text=True, check=True)
+    before, after = json.loads(proc.stdout)
+    assert not any(before) and all(after)
+
+def test_init_worker_rejects_unknown_options():
+    with pytest.raises(ValueError, match="header_bnd"):
+        init_worker({"timeout": 5, "header_bnd": 0.3})
+
+def test_dead_worker_fails_only_the_documents_in_flight(tmp_path, corpus, monkeypatch):
+    paths, _ = corpus
+    crash = tmp_path / "crash.pdf"
+    crash.write_bytes(generate_resume())
+    parse_source = batch_parser._parse_source
+
+    def crash_on_marker(source):
+        if source.endswith("crash.pdf"):
+            os._exit(137)  # as if killed for memory
+        return parse_source(source)
+
+    # Forked workers inherit the patched module
+    monkeypatch.setattr(batch_parser, "_parse_source", crash_on_marker)
+    output = str(tmp_path / "out.jsonl")
+    summary = run_batch([str(crash)] + paths, output, workers=1)
+
+    records = {record["source"]: record for record in _read_jsonl(output)}
+    assert set(records) == {str(crash)} | set(paths)
+    assert records[str(crash)]["status"] == "error" and "BrokenProcessPool" in records[str(crash)]["error"]
+    # One document shared the broken pool with it; the rest ran in a new one
+    assert [records[path]["status"] for path in paths[1:]] == ["ok", "ok"]
+    assert summary["ok"] + summary["error"] == 4
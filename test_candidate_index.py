@@ -0,0 +1,65 @@
+import pytest
+
+from candidate_index import content_key, ingest, open_index, parse_rank_filter, search
+
+def _result(email, college="IIT Bombay", branch="Electrical", skills=("Python",), rank=None):
+    extracted = {
+        "contact": {"email": email},
+        "edu": {"college": college, "degree": "B.Tech", "branch": branch},
+        "rank": [{"exam": "JEE Advanced", "rank": rank, "context": ""}] if rank else [],
+        "skill": {"Programming Languages": list(skills)}
+    }
+    return {"extracted": extracted, "resume": {"projects-Projects": ["Built a compiler in Rust"]}}
+
+@pytest.fixture
+def conn(tmp_path):
+    conn = open_index(str(tmp_path / "index.db"))
+    yield conn
+    conn.close()
+
+def _count(conn, sql="SELECT count(*) FROM candidates"):
+    return conn.execute(sql).fetchone()[0]
+
+def test_reingesting_a_source_replaces_it(conn):
+    ingest(conn, [("a.pdf", _result("a@example.com", skills=("Python",)))])
+    ingest(conn, [("a.pdf", _result("a@example.com", skills=("Go",)))])
+
+    assert _count(conn) == 1
+    assert [row["source"] for row in search(conn, skills=["go"])] == ["a.pdf"]
+    assert search(conn, skills=["python"]) == []
+    assert _count(conn, "SELECT n FROM value_counts WHERE field = 'college'") == 1
+
+def test_reingesting_sourceless_records_does_not_duplicate_them(conn):
+    records = [(None, _result("a@example.com")), (None, _result("b@example.com"))]
+    ingest(conn, records)
+    ingest(conn, records)
+
+    assert _count(conn) == 2
+    sources = {row["source"] for row in search(conn)}
+    assert sources == {content_key(result) for _, result in records}
+    assert _count(conn, "SELECT n FROM value_counts WHERE field = 'skill' AND value = 'Python'") == 2
+
+def test_search_combines_filters(conn):
+    ingest(conn, [("a.pdf", _result("a@example.com", rank="450")),
+                  ("b.pdf", _result("b@example.com", branch="Civil", rank="12,000")),
+                  ("c.pdf", _result("c@example.com", college="IIT Delhi", skills=("Python", "Rust")))])
+
+    assert [r["source"] for r in search(conn, college="iit bombay")] == ["a.pdf", "b.pdf"]
+    assert [r["source"] for r in search(conn, ranks=[parse_rank_filter("JEE Advanced<1000")])] == ["a.pdf"]
+    assert [r["source"] for r in search(conn, skills=["python", "rust"])] == ["c.pdf"]
+    assert [r["source"] for r in search(conn, text="compiler", branch="Civil")] == ["b.pdf"]
+
+def test_decimal_rank_values_are_not_indexed_as_ranks(conn):
+    result = _result("a@example.com")
+    result["extracted"]["rank"] = [{"exam": "CAT", "rank": "99.85", "context": "CAT 2022 percentile: 99.85"},
+                                   {"exam": "GATE", "rank": "1200", "context": "GATE AIR 1,200"}]
+    ingest(conn, [("a.pdf", result)])
+
+    assert search(conn, ranks=[parse_rank_filter("CAT<10000")]) == []
+    assert [r["source"] for r in search(conn, ranks=[parse_rank_filter("GATE<=1200")])] == ["a.pdf"]
+
+def test_parse_rank_filter():
+    assert parse_rank_filter("JEE Advanced<1000") == ("JEE Advanced", 999)
+    assert parse_rank_filter("JEE Mains <= 500") == ("JEE Mains", 500)
+    with pytest.raises(ValueError):
+        parse_rank_filter("JEE Mains")
@@ -0,0 +1,105 @@
+import random
+import re
+
+import pytest
+
+from edu_data import BRANCH_PATTERNS, DEGREE_PATTERNS, INSTITUTIONS, MINOR_PATTERN
+from extract_edu import build_classifier, build_edu_classifier, extract_education_details, match_first
+
+# --- Reference: the linear first-match scan the classifiers replace ---
+
+def linear_first(text, entries, leftmost=False):
+    """One re.search per entry: first matching entry, or the earliest match (ties to the earlier entry)."""
+    best = None
+    for value, pattern in entries:
+        m = re.search(pattern, text, re.IGNORECASE)
+        if m and (best is None or m.start() < best[1].start()):
+            best = (value, m)
+            if not leftmost:
+                break
+    return best
+
+def linear_education_details(lines):
+    if not lines:
+        return {}
+    full_text = "\n".join(line["text"] for line in lines)
+    edu_data = {"college": None, "degree": None, "branch": None}
+
+    institutions = [(inst["format"], f"(?:{alias}){inst['campus']}") for inst in INSTITUTIONS for alias in inst["aliases"]]
+    found = linear_first(full_text, institutions, leftmost=True)
+    if found:
+        fmt, match = found
+        edu_data["college"] = fmt.format(campus=re.sub(r'[^a-zA-Z]', '', match.group(1).title()))
+
+    found = linear_first(full_text, [(label, pattern) for pattern, label in DEGREE_PATTERNS])
+    if found:
+        edu_data["degree"] = found[0]
+
+    text_no_minors = re.sub(MINOR_PATTERN, "", full_text, flags=re.IGNORECASE)
+    found = linear_first(text_no_minors, [(name, p) for name, patterns in BRANCH_PATTERNS.items() for p in patterns])
+    if found:
+        edu_data["branch"] = found[0]
+    return edu_data
+
+# --- Fuzzed inputs ---
+
+VOCABULARY = [
+    "IIT", "Indian Institute of Technology", "Bombay", "delhi", "-", "–", ",", "(", ")", "Dual Degree", "M.Tech",
+    "MTech", "M.E", "M.S", "MSc", "PhD", "Ph.D", "B.Tech", "B. E", "BS", "B.Sc", "Bachelor", "Master", "Minor in",
+    "Minor:", "computer science", "CSE", "cs", "electrical", "EEE", "ece", "electronics", "Mechanical", "mech",
+    "civil", "chemical", "aerospace", "engineering physics", "EP", "metallurgy", "material science", "mathematics",
+    "MnC", "computing", "biotech", "bio", "data science", "DS", "AI", "energy", "CGPA", "9.1", "2019", "\n", " ",
+    # Characters IGNORECASE equates with ASCII letters, but str.lower() does not
+    "İ", "ı", "ſ", "K", "é", "of", "and", "iit", "kanpur", "IITM", "m", "b", "s", "e"
+]
+
+def fuzzed_texts(count, seed=0):
+    rng = random.Random(seed)
+    for _ in range(count):
+        yield (" " if rng.random() < 0.7 else "").join(rng.choice(VOCABULARY) for _ in range(rng.randint(0, 12)))
+
+# --- Tests ---
+
+@pytest.mark.parametrize("text", [
+    "Indian Institute of Technology Bombay\nB.Tech in Electrical Engineering, Minor in Computer Science",
+    "Dual Degree (B.Tech + M.Tech), IIT-Kharagpur, CGPA 9.1",
+    "M.Sc Mathematics and Computing, IIT (Delhi)",
+    "Bachelor of Science, Biotechnology",
+    "Senior Secondary, CBSE 2017",
+])
+def test_matches_linear_scan_on_resume_lines(text):
+    lines = [{"text": part} for part in text.split("\n")]
+    assert extract_education_details(lines) == linear_education_details(lines)
+
+def test_matches_linear_scan_on_fuzzed_sections():
+    rng = random.Random(1)
+    texts = list(fuzzed_texts(3000))
+    for _ in range(1000):
+        lines = [{"text": rng.choice(texts)} for _ in range(rng.randint(1, 5))]
+        assert extract_education_details(lines) == linear_education_details(lines), lines
+
+@pytest.mark.parametrize("leftmost", [False, True])
+def test_match_first_matches_linear_scan_on_inflated_table(leftmost):
+    # Shipped branch entries behind generated ones sharing their prefixes, plus
+    # prefix-less patterns that go to the fallback list
+    rng = random.Random(2)
+    entries = [(name, pattern) for name, patterns in BRANCH_PATTERNS.items() for pattern in patterns]
+    generated = [(f"gen{n}", rf"\b{rng.choice(['comp', 'elec', 'mech', 'bio', 'data'])}{n}\w*") for n in range(300)]
+    fallback = [("digits", r"\d{4}"), ("class", r"[ck]ivil")]
+    table = generated[:150] + entries + fallback + generated[150:]
+    classifier = build_classifier(table)
+
+    texts = list(fuzzed_texts(1500, seed=3)) + ["comp12 electrical", "bio299x and civil 2019", "kivil data99"]
+    for text in texts:
+        expected = linear_first(text, table, leftmost)
+        found = match_first(text, classifier, leftmost)
+        if expected is None:
+            assert found is None, text
+        else:
+            assert (found[0], found[1].span()) == (expected[0], expected[1].span()), text
+
+def test_custom_tables_are_honored():
+    classifier = build_edu_classifier(institutions=[{"aliases": [r"NIT"], "campus": r"\s+([A-Za-z]+)",
+                                                     "format": "NIT {campus}"}])
+    details = extract_education_details([{"text": "B.E. Civil, NIT Trichy"}], classifier)
+    assert details == {"college": "NIT Trichy", "degree": "B.E", "branch": "Civil"}
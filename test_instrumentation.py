@@ -0,0 +1,47 @@
+import json
+
+import pytest
+
+from instrumentation import JsonlSink, PipelineTrace, run_traced
+from parser import parse_resume, parse_resume_traced
+from synthetic_resume import generate_resume
+
+def test_traced_parse_reports_stages_and_counters(tmp_path):
+    path = tmp_path / "resume.pdf"
+    path.write_bytes(generate_resume(pages=2))
+    sink = JsonlSink(str(tmp_path / "trace.jsonl"))
+
+    result, record = parse_resume_traced(str(path), sink=sink, count_regex=True)
+    assert result == parse_resume(str(path))
+    assert {"extract_lines_from_pdf", "process_lines_to_sections", "extract_contacts",
+            "extract_ranks", "extract_skills"} <= set(record["stages"])
+    assert record["counters"]["pages"] == 2 and record["counters"]["lines"] > 0
+    assert record["counters"]["regex_calls"] >= record["stages"]["extract_contacts"]["regex_calls"] > 0
+    assert record["wall_seconds"] >= record["stages"]["extract_lines_from_pdf"]["wall_seconds"]
+    assert json.loads((tmp_path / "trace.jsonl").read_text()) == record
+
+def test_repeated_stages_accumulate():
+    trace = PipelineTrace()
+    for _ in range(3):
+        with trace.stage("extract_ranks"):
+            pass
+    trace.count("sections", 2)
+    trace.count("sections")
+    record = trace.to_dict()
+    assert record["stages"]["extract_ranks"]["calls"] == 3
+    assert record["counters"] == {"sections": 3}
+
+def test_capture_runs_only_above_threshold():
+    _, record = run_traced(lambda trace: None, capture="cprofile", capture_threshold=3600)
+    assert record["capture"] is None
+    _, record = run_traced(lambda trace: sum(range(1000)), capture="tracemalloc")
+    assert record["capture"]["mode"] == "tracemalloc"
+    with pytest.raises(ValueError):
+        run_traced(lambda trace: None, capture="perf")
+
+def test_capture_profiles_the_parse_not_the_artifact_store(tmp_path):
+    path = tmp_path / "resume.pdf"
+    path.write_bytes(generate_resume())
+    _, record = parse_resume_traced(str(path), artifact_dir=str(tmp_path / "artifacts"), capture="cprofile")
+    functions = " ".join(entry["function"] for entry in record["capture"]["functions"])
+    assert "extract_lines_from_pdf" in functions and "load_document" not in functions
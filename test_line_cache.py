@@ -0,0 +1,61 @@
+import io
+import os
+
+from line_cache import cache_key, decode_lines, encode_lines, evict, extract_lines_cached, file_hash, load_lines
+from line_record import LINE_FIELDS
+from pdf_processor import extract_lines_from_pdf
+from synthetic_resume import generate_resume
+
+def _fields(lines):
+    return [tuple(line[field] for field in LINE_FIELDS) for line in lines]
+
+def test_second_extraction_is_a_cache_hit(tmp_path):
+    path = tmp_path / "resume.pdf"
+    path.write_bytes(generate_resume(columns=2, links=3))
+    cache_dir = str(tmp_path / "cache")
+
+    stats = {}
+    first = extract_lines_cached(str(path), cache_dir, stats=stats)
+    second = extract_lines_cached(str(path), cache_dir, stats=stats)
+
+    assert stats["cache_misses"] == 1 and stats["cache_hits"] == 1
+    assert _fields(second) == _fields(first) == _fields(extract_lines_from_pdf(str(path)))
+
+def test_key_follows_content_and_settings(tmp_path):
+    data = generate_resume(seed=5)
+    path = tmp_path / "resume.pdf"
+    path.write_bytes(data)
+
+    # Same bytes from a path, a buffer or a file object hash alike
+    stream = io.BytesIO(data)
+    stream.seek(10)
+    assert file_hash(str(path)) == file_hash(data) == file_hash(stream)
+    assert stream.tell() == 10
+
+    assert cache_key(str(path)) == cache_key(data)
+    assert cache_key(str(path)) != cache_key(str(path), backend="fast")
+    assert cache_key(str(path)) != cache_key(generate_resume(seed=6))
+
+def test_stale_or_corrupt_entries_are_dropped(tmp_path):
+    lines = extract_lines_from_pdf(generate_resume())
+    blob = encode_lines(lines)
+    assert _fields(decode_lines(blob)) == _fields(lines)
+    assert decode_lines(blob[:3] + bytes([blob[3] + 1]) + blob[4:]) is None
+
+    cache_dir = str(tmp_path)
+    key = "ab" + "0" * 30
+    os.makedirs(tmp_path / "ab")
+    entry = tmp_path / "ab" / f"{key}.lines"
+    entry.write_bytes(blob[:20])
+    assert load_lines(cache_dir, key) is None
+    assert not entry.exists()
+
+def test_evict_removes_least_recently_used_first(tmp_path):
+    os.makedirs(tmp_path / "aa")
+    for n in range(4):
+        entry = tmp_path / "aa" / f"aa{n}.lines"
+        entry.write_bytes(b"x" * 100)
+        os.utime(entry, (1000 + n, 1000 + n))
+
+    assert evict(str(tmp_path), max_bytes=250) == 2
+    assert sorted(os.listdir(tmp_path / "aa")) == ["aa2.lines", "aa3.lines"]
@@ -0,0 +1,33 @@
+import json
+
+import pytest
+
+from line_record import LINE_FIELDS, Line, json_default
+
+def _line():
+    return Line("EDUCATION", 12.0, 1.0, "Helvetica-Bold", 700.0, 50.0, [], column=1)
+
+def test_reads_and_writes_like_a_line_dict():
+    line = _line()
+    assert line["text"] == line.text == "EDUCATION"
+    assert "is_header" not in line and line.get("is_header") is None
+    with pytest.raises(KeyError):
+        line["section"]
+
+    line["is_header"] = True
+    assert line.get("is_header") is True and list(line) == list(LINE_FIELDS) + ["is_header"]
+    with pytest.raises(KeyError):
+        line["colour"] = "red"
+    with pytest.raises(AttributeError):
+        line.colour = "red"  # slotted: no per-line __dict__
+
+def test_dict_round_trip():
+    line = _line()
+    line["section"] = "education"
+    data = line.to_dict()
+    assert Line.from_dict(data) == line == data
+    assert Line.from_dict(dict(data, extra=1)) == line
+
+    legacy = {field: data[field] for field in LINE_FIELDS[:-1]}
+    assert Line.from_dict(legacy).column == 0
+    assert json.loads(json.dumps([line], default=json_default)) == [data]
@@ -0,0 +1,43 @@
+import random
+
+from link_index import LINEAR_SCAN_MAX_LINKS, build_link_index, find_line_links
+from pdf_processor import extract_lines_from_pdf
+from synthetic_resume import build_pdf
+
+def linear_links(links, bbox):
+    tx0, ty0, tx1, ty1 = bbox
+    return [link["uri"] for link in links
+            if tx0 < link["bbox"][2] and tx1 > link["bbox"][0] and ty0 < link["bbox"][3] and ty1 > link["bbox"][1]]
+
+def test_index_matches_linear_overlap_scan():
+    rng = random.Random(0)
+    links = []
+    for n in range(200):
+        x0, y0 = rng.uniform(0, 600), rng.uniform(0, 780)
+        links.append({"bbox": [x0, y0, x0 + rng.uniform(1, 200), y0 + rng.uniform(1, 30)], "uri": f"u{n}"})
+    # A page-tall rect is checked against every line instead of filling bands
+    links.append({"bbox": [0, -1e9, 612, 1e9], "uri": "tall"})
+    index = build_link_index(links)
+    assert index["wide"] == [len(links) - 1]
+
+    for _ in range(500):
+        x0, y0 = rng.uniform(0, 600), rng.uniform(0, 780)
+        bbox = (x0, y0, x0 + rng.uniform(5, 300), y0 + rng.uniform(5, 15))
+        assert find_line_links(index, bbox) == linear_links(links, bbox)
+
+def test_small_pages_use_a_plain_scan():
+    links = [{"bbox": [0, 10 * n, 100, 10 * n + 8], "uri": f"u{n}"} for n in range(LINEAR_SCAN_MAX_LINKS - 1)]
+    index = build_link_index(links)
+    assert index["bands"] is None
+    assert find_line_links(index, (50, 21, 60, 29)) == ["u2"]
+
+def test_extracted_lines_carry_their_links(tmp_path):
+    path = tmp_path / "links.pdf"
+    path.write_bytes(build_pdf([{
+        "text": [("Helvetica", 10, 50, 700, "linkedin.com/in/someone | github.com/someone"),
+                 ("Helvetica", 10, 50, 680, "No links on this line")],
+        "links": [(50, 697, 150, 710, "https://linkedin.com/in/someone"),
+                  (160, 697, 260, 710, "https://github.com/someone")]
+    }]))
+    lines = extract_lines_from_pdf(str(path))
+    assert [line.links for line in lines] == [["https://linkedin.com/in/someone", "https://github.com/someone"], []]
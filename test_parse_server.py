@@ -0,0 +1,64 @@
+import http.client
+import json
+import os
+import threading
+
+import pytest
+
+from parse_server import make_server
+from synthetic_resume import generate_resume
+
+@pytest.fixture(scope="module")
+def server():
+    server = make_server("127.0.0.1", 0, workers=1, queue_size=1)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield server
+    server.shutdown()
+    server.server_close()
+    server.state.pool.shutdown(cancel_futures=True)
+
+def _request(server, method, path, body=None, headers=None):
+    conn = http.client.HTTPConnection(*server.server_address, timeout=60)
+    try:
+        conn.putrequest(method, path)
+        for key, value in (headers or {}).items():
+            conn.putheader(key, value)
+        conn.endheaders(body)
+        response = conn.getresponse()
+        return response.status, json.loads(response.read() or b"null")
+    finally:
+        conn.close()
+
+def _post_pdf(server, data):
+    return _request(server, "POST", "/parse", data,
+                    {"Content-Type": "application/pdf", "Content-Length": str(len(data))})
+
+def test_parse_upload(server):
+    status, result = _post_pdf(server, generate_resume(seed=3))
+    assert status == 200
+    assert result["extracted"]["contact"]["email"]
+
+def test_invalid_content_length_is_rejected(server):
+    status, payload = _request(server, "POST", "/parse", headers={"Content-Length": "abc"})
+    assert status == 400
+    assert payload == {"error": "Invalid Content-Length"}
+
+def test_crashed_worker_pool_is_replaced(server):
+    # Break the pool the way an OOM-killed worker would
+    broken = server.state.pool
+    with pytest.raises(Exception):
+        broken.submit(os._exit, 1).result()
+
+    status, payload = _post_pdf(server, generate_resume(seed=4))
+    assert status == 503
+    assert server.state.pool is not broken
+
+    status, result = _post_pdf(server, generate_resume(seed=4))
+    assert status == 200
+    assert result["extracted"]["contact"]["email"]
+
+def test_metrics_count_requests(server):
+    status, metrics = _request(server, "GET", "/metrics")
+    assert status == 200
+    assert metrics["counts"]["requests"] >= 1
@@ -0,0 +1,81 @@
+import json
+import subprocess
+import sys
+
+import pytest
+
+from parser import parse_resume
+from synthetic_resume import build_pdf, generate_resume
+
+def _write_resume(tmp_path, name="resume.pdf", **options):
+    path = tmp_path / name
+    path.write_bytes(generate_resume(**options))
+    return str(path)
+
+def _modules_after(script):
+    # Fresh interpreter: what a short-lived CLI run imports and compiles
+    proc = subprocess.run([sys.executable, "-c", script], capture_output=True, text=True, check=True)
+    return json.loads(proc.stdout)
+
+def test_contact_only_run_skips_section_extractors(tmp_path):
+    path = _write_resume(tmp_path)
+    modules = _modules_after(
+        "import json, sys\n"
+        "from parser import parse_resume\n"
+        f"result = parse_resume({path!r}, sections=(), extractors=('contact',))\n"
+        "assert result['extracted']['contact']['email']\n"
+        "print(json.dumps([m for m in ('extract_edu', 'rank_extract', 'skill_extract') if m in sys.modules]))\n")
+    assert modules == []
+
+def test_extractor_tables_compile_on_first_use():
+    compiled = _modules_after(
+        "import json\n"
+        "import extract_edu, rank_extract, skill_extract\n"
+        "before = [extract_edu._edu_classifier, rank_extract._rank_engine, skill_extract._skill_matcher]\n"
+        "skill_extract.extract_skills(['Python and C++'])\n"
+        "print(json.dumps([value is not None for value in before] + [skill_extract._skill_matcher is not None]))\n")
+    assert compiled == [False, False, False, True]
+
+def test_selected_extractors_and_sections_match_the_full_run(tmp_path):
+    path = _write_resume(tmp_path)
+    full = parse_resume(path)
+    assert list(full["extracted"]) == ["contact", "edu", "rank", "skill"]
+
+    screened = parse_resume(path, sections=("skills",), extractors=("rank",))
+    assert screened["extracted"] == {"rank": full["extracted"]["rank"]}
+    assert screened["resume"] == {key: value for key, value in full["resume"].items() if key.startswith("skills-")}
+
+    flat = parse_resume(path, sections=("experience",), extractors=())
+    assert flat["extracted"] == {}
+    (key, lines), = flat["resume"].items()
+    assert key.startswith("experience-") and all(isinstance(line, str) for line in lines)
+
+def test_unknown_extractor_fails_before_extraction(tmp_path):
+    with pytest.raises(ValueError, match="ranks"):
+        parse_resume(str(tmp_path / "missing.pdf"), extractors=("contact", "ranks"))
+
+@pytest.mark.parametrize("options", [
+    {"sections": (), "extractors": ("contact",), "header_band": 0},
+    {"sections": (), "extractors": ("contact",), "header_band": 1.5},
+    {"header_band": 0.3},
+    {"sections": (), "extractors": ("contact", "skill"), "header_band": 0.3},
+])
+def test_bad_header_band_fails_before_extraction(tmp_path, options):
+    with pytest.raises(ValueError, match="header_band"):
+        parse_resume(str(tmp_path / "missing.pdf"), **options)
+
+def test_header_band_contact_run(tmp_path):
+    path = _write_resume(tmp_path)
+    banded = parse_resume(path, sections=(), extractors=("contact",), header_band=0.3)
+    assert banded == parse_resume(path, sections=(), extractors=("contact",))
+    assert banded["extracted"]["contact"]["email"]
+
+def test_header_band_rereads_when_the_phone_is_below_it(tmp_path):
+    path = tmp_path / "resume.pdf"
+    path.write_bytes(build_pdf([{"text": [("Helvetica-Bold", 16, 50, 760, "Jane Candidate"),
+                                          ("Helvetica", 10, 50, 740, "jane@example.com"),
+                                          ("Helvetica", 10, 50, 600, "Phone: +91 98765 43210")],
+                                 "links": []}]))
+    full = parse_resume(str(path), sections=(), extractors=("contact",))
+    assert full["extracted"]["contact"]["phone"]
+    assert parse_resume(str(path), sections=(), extractors=("contact",), header_band=0.2) == full
@@ -0,0 +1,165 @@
+from itertools import islice
+from types import SimpleNamespace
+import io
+import mmap
+
+import pytest
+
+from extract_contact import HEADER_SCOPE_LINES, extract_contacts
+from pdf_processor import (BufferReader, classify_font, clear_font_cache, extract_lines_from_pdf, font_cache_stats,
+                           is_font_bold, iter_lines_from_pdf, open_pdf_source)
+from synthetic_resume import build_pdf, generate_resume
+
+def _write_pdf(tmp_path, text_ops, name="resume.pdf"):
+    path = tmp_path / name
+    path.write_bytes(build_pdf([{"text": text_ops, "links": []}]))
+    return str(path)
+
+def _two_column_body(top):
+    ops = []
+    for column, x, header in ((0, 50, "EDUCATION"), (1, 330, "EXPERIENCE")):
+        ops.append(("Helvetica-Bold", 12, x, top, header))
+        for row in range(1, 12):
+            ops.append(("Helvetica", 10, x, top - 14 * row, f"{header.title()} detail line {row} of column {column + 1}"))
+    return ops
+
+def test_two_column_page_is_read_column_by_column(tmp_path):
+    path = _write_pdf(tmp_path, _two_column_body(700))
+    texts = [line.text for line in extract_lines_from_pdf(path)]
+
+    left = [i for i, text in enumerate(texts) if "column 1" in text]
+    right = [i for i, text in enumerate(texts) if "column 2" in text]
+    assert max(left) < min(right)
+
+def test_header_above_columns_keeps_page_order(tmp_path):
+    # Name on the left, contact details on the right, no line crossing the gutter
+    header = [
+        ("Helvetica-Bold", 16, 50, 740, "Jane Candidate"),
+        ("Helvetica", 10, 400, 740, "jane.candidate@example.com"),
+        ("Helvetica", 10, 400, 726, "+91 98765 43210"),
+    ]
+    path = _write_pdf(tmp_path, header + _two_column_body(680))
+    lines = extract_lines_from_pdf(path)
+    texts = [line.text for line in lines]
+
+    assert set(texts[:3]) == {"Jane Candidate", "jane.candidate@example.com", "+91 98765 43210"}
+    assert all(line.column == 0 for line in lines[:3])
+    assert {line.column for line in lines[3:]} == {1, 2}
+
+    contacts = extract_contacts(lines)
+    assert contacts["email"] == "jane.candidate@example.com"
+    assert texts.index("jane.candidate@example.com") < HEADER_SCOPE_LINES
+
+def test_top_band_keeps_only_the_top_of_the_page(tmp_path):
+    path = _write_pdf(tmp_path, [("Helvetica", 10, 50, 760 - 40 * row, f"Row number {row}") for row in range(18)])
+    full = extract_lines_from_pdf(path)
+    top = extract_lines_from_pdf(path, top_band=0.25)
+
+    assert len(full) == 18
+    assert [line.text for line in top] == [line.text for line in full if line.y > 792 * 0.75 - 10]
+    assert 0 < len(top) < len(full)
+
+def _pdf_with_form_text(outside, inside):
+    # One page drawing `outside` directly and `inside` through a form XObject
+    # (an LTFigure once laid out), which synthetic_resume.build_pdf cannot emit
+    font = b"<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica >>"
+    form = f"BT /F0 10 Tf 50 740 Td ({inside}) Tj ET".encode("latin-1")
+    page = f"q /Fm0 Do Q BT /F0 10 Tf 50 700 Td ({outside}) Tj ET".encode("latin-1")
+    objects = [
+        b"<< /Type /Catalog /Pages 2 0 R >>",
+        b"<< /Type /Pages /Kids [3 0 R] /Count 1 >>",
+        b"<< /Type /Page /Parent 2 0 R /MediaBox [0 0 612 792] /Contents 4 0 R "
+        b"/Resources << /Font << /F0 5 0 R >> /XObject << /Fm0 6 0 R >> >> >>",
+        b"<< /Length %d >>\nstream\n%s\nendstream" % (len(page), page),
+        font,
+        b"<< /Type /XObject /Subtype /Form /BBox [0 0 612 792] /Resources << /Font << /F0 5 0 R >> >> "
+        b"/Length %d >>\nstream\n%s\nendstream" % (len(form), form),
+    ]
+    out = bytearray(b"%PDF-1.4\n")
+    offsets = []
+    for number, body in enumerate(objects, 1):
+        offsets.append(len(out))
+        out += b"%d 0 obj\n%s\nendobj\n" % (number, body)
+    xref = len(out)
+    out += b"xref\n0 %d\n0000000000 65535 f \n" % (len(objects) + 1)
+    out += b"".join(b"%010d 00000 n \n" % offset for offset in offsets)
+    out += b"trailer\n<< /Size %d /Root 1 0 R >>\nstartxref\n%d\n%%%%EOF\n" % (len(objects) + 1, xref)
+    return bytes(out)
+
+def test_fast_backend_reads_text_inside_figures():
+    data = _pdf_with_form_text("Drawn on the page", "Drawn in a form")
+    texts = [line.text for line in extract_lines_from_pdf(data, backend="fast")]
+    assert texts == ["Drawn in a form", "Drawn on the page"]
+
+def test_streaming_stops_at_page_and_line_limits(tmp_path):
+    path = tmp_path / "long.pdf"
+    path.write_bytes(generate_resume(pages=4))
+    path = str(path)
+    full = extract_lines_from_pdf(path)
+
+    stats = {}
+    streamed = iter_lines_from_pdf(path, stats=stats)
+    assert [line.text for line in islice(streamed, 5)] == [line.text for line in full[:5]]
+    assert stats["pages"] == 1  # later pages not laid out yet
+
+    stats = {}
+    first_page = extract_lines_from_pdf(path, max_pages=1, stats=stats)
+    assert stats["pages"] == 1
+    assert [line.text for line in first_page] == [line.text for line in full[:len(first_page)]]
+    assert len(extract_lines_from_pdf(path, max_lines=7)) == 7
+
+def test_contact_scan_reads_only_the_header_pages(tmp_path):
+    path = tmp_path / "long.pdf"
+    path.write_bytes(generate_resume(pages=4))
+    stats = {}
+    contacts = extract_contacts(iter_lines_from_pdf(str(path), stats=stats))
+    assert contacts["email"]
+    assert stats["pages"] == 1
+
+def test_buffers_and_file_objects_read_like_a_path(tmp_path):
+    data = generate_resume(columns=2, links=2)
+    path = tmp_path / "resume.pdf"
+    path.write_bytes(data)
+    expected = [(line.text, line.y, line.links) for line in extract_lines_from_pdf(str(path))]
+
+    with open(path, "rb") as fp, mmap.mmap(fp.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+        sources = [data, bytearray(data), memoryview(data), io.BytesIO(data), mapped, path]
+        for source in sources:
+            assert [(line.text, line.y, line.links) for line in extract_lines_from_pdf(source)] == expected
+        assert not mapped.closed  # caller-owned sources stay open
+
+    with pytest.raises(TypeError):
+        with open_pdf_source(12):
+            pass
+
+def test_buffer_reader_seeks_like_a_file():
+    reader = BufferReader(bytearray(b"0123456789"))
+    assert reader.read(3) == b"012"
+    assert reader.seek(-2, io.SEEK_END) == 8 and reader.read() == b"89"
+    assert reader.seek(2) == 2 and reader.seek(3, io.SEEK_CUR) == 5 and reader.read(1) == b"5"
+    with pytest.raises(ValueError):
+        reader.seek(-1)
+
+def test_line_font_statistics(tmp_path):
+    path = _write_pdf(tmp_path, [("Helvetica-Bold", 12, 50, 700, "Name:"),
+                                 ("Helvetica", 10, 88, 700, "Jane Candidate Person"),
+                                 ("Times-Bold", 10, 50, 680, "All bold line")])
+    first, second = extract_lines_from_pdf(path)
+
+    assert first.text == "Name: Jane Candidate Person"
+    assert first.font_size == 12.0
+    assert first.font_name == "Helvetica"
+    assert first.bold_ratio == pytest.approx(5 / 26)
+    assert (second.font_name, second.bold_ratio, second.font_size) == ("Times-Bold", 1.0, 10.0)
+
+def test_font_classification_is_cached_per_font():
+    clear_font_cache()
+    regular = SimpleNamespace(fontname="ABCDEF+SourceSans-Regular", font=SimpleNamespace(descriptor={"Flags": 0}))
+    forced = SimpleNamespace(fontname="Custom", font=SimpleNamespace(descriptor={"Flags": 262144}))
+    italic = SimpleNamespace(fontname="Georgia-BoldItalic", font=SimpleNamespace(descriptor={}))
+
+    assert [is_font_bold(regular) for _ in range(3)] == [False] * 3
+    assert is_font_bold(forced)
+    assert classify_font(italic) == {"bold": True, "italic": True, "family": "Georgia"}
+    assert font_cache_stats() == {"hits": 2, "misses": 3, "size": 3}
+    clear_font_cache()
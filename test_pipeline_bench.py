@@ -0,0 +1,16 @@
+from pipeline_bench import PROFILES, STAGES, compare_reports, percentiles, run_suite
+
+def test_suite_reports_every_stage():
+    report = run_suite([PROFILES[0]], docs=1, repeats=1)
+    result = report["profiles"]["baseline"]
+    assert set(result["stages"]) == set(STAGES)
+    assert result["lines_per_document"] > 0 and result["peak_memory_bytes"]["max"] > 0
+
+    ratios = compare_reports(report, report)
+    assert ratios["baseline"]["total"] == 1.0
+
+def test_percentiles():
+    samples = [n / 1000 for n in range(1, 101)]
+    stats = percentiles(samples)
+    assert (stats["p50_ms"], stats["p90_ms"], stats["max_ms"]) == (51.0, 91.0, 100.0)
+    assert percentiles([]) is None
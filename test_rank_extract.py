@@ -0,0 +1,53 @@
+import random
+import re
+
+from rank_data import EXAM_PATTERNS, RANK_INDICATORS
+from rank_extract import (ROBUST_INDICATORS, SEPARATOR_PATTERN, extract_ranks, extract_ranks_from_line,
+                          required_literal, split_into_clauses)
+
+def linear_ranks(line_text):
+    """Builds and searches both rank patterns per clause and exam pattern, as before the engine."""
+    indicators = sorted(set(RANK_INDICATORS) | set(ROBUST_INDICATORS), key=lambda i: (-len(i), i))
+    rank_pattern_str = "|".join(re.escape(i) for i in indicators)
+    found = []
+    for clause in split_into_clauses(line_text):
+        for exam_name, patterns in EXAM_PATTERNS.items():
+            for exam_pat in patterns:
+                if not re.search(exam_pat, clause, re.IGNORECASE):
+                    continue
+                raw_num = None
+                m1 = re.search(rf"({exam_pat}).*?({rank_pattern_str}){SEPARATOR_PATTERN}([\d,]+(?:\.\d+)?)",
+                               clause, re.IGNORECASE)
+                if m1:
+                    raw_num = m1.group(3)
+                if not raw_num:
+                    m2 = re.search(rf"({rank_pattern_str}){SEPARATOR_PATTERN}([\d,]+(?:\.\d+)?).*?({exam_pat})",
+                                   clause, re.IGNORECASE)
+                    if m2:
+                        raw_num = m2.group(2)
+                if raw_num:
+                    found.append({"exam": exam_name, "rank": raw_num.replace(',', ''), "context": clause})
+                    break
+    return found
+
+def test_engine_matches_linear_scan_on_fuzzed_lines():
+    rng = random.Random(0)
+    words = ["JEE Advanced", "jee mains", "AIEEE", "GATE", "gateway", "KVPY", "Olympiad", "INMO", "MHT-CET",
+             "CAT", "UPSC", "NTSE", "Secured", "AIR", "All India Rank", "Rank", "State Rank", "rank", "of", ":",
+             "-", "—", "with", "in", "and", ";", "|", "1,200", "505", "99.5", "2019", "percentile", "Ä", "(Adv)",
+             "•", "\n", "ı", "ſ", "s", "core", ",", "a", "r", "kvpy"]
+    for _ in range(5000):
+        text = rng.choice([" ", " ", ""]).join(rng.choice(words) for _ in range(rng.randint(0, 12)))
+        assert extract_ranks_from_line(text) == linear_ranks(text), text
+
+def test_extract_ranks():
+    lines = [{"text": "Secured AIR 15,618 in KVPY 2019"}, "JEE Advanced: All India Rank 505 and GATE Rank - 42",
+             "Won the school quiz"]
+    assert [(r["exam"], r["rank"]) for r in extract_ranks(lines)] == \
+           [("KVPY", "15618"), ("JEE Advanced", "505"), ("GATE", "42")]
+
+def test_required_literal():
+    assert required_literal(r"jee\s*mains?") == "main"
+    assert required_literal(r"\bgate\b") == "gate"
+    assert required_literal(r"mh-?cet") == "cet"
+    assert required_literal(r"(a|b)cd") == ""
@@ -0,0 +1,65 @@
+import copy
+import random
+import re
+
+from section_keyword import SECTION_KEYWORDS
+from section_parser import find_section_spans, match_section_keyword, process_lines_to_sections
+
+def linear_section_keyword(text):
+    """One \\bkeyword\\b search per keyword, as before the word index."""
+    t = re.sub(r'[^a-z ]', '', text.lower())
+    for section, keywords in SECTION_KEYWORDS.items():
+        for k in keywords:
+            if re.search(r'\b' + re.escape(k) + r'\b', t):
+                return section
+    return None
+
+def test_keyword_index_matches_linear_scan():
+    rng = random.Random(0)
+    words = [word for keywords in SECTION_KEYWORDS.values() for k in keywords for word in k.split()]
+    words += ["and", "my", "key", "&", "-", ":", "2021", "co-curricular", "EXPERIENCE", "Skills:", "  "]
+    for _ in range(5000):
+        text = rng.choice([" ", "", "-"]).join(rng.choice(words) for _ in range(rng.randint(0, 6)))
+        assert match_section_keyword(text) == linear_section_keyword(text), text
+
+def test_every_shipped_keyword_resolves_like_linear_scan():
+    # Keywords shared by several sections resolve to the earliest one
+    for keywords in SECTION_KEYWORDS.values():
+        for k in keywords:
+            header = f"{k.upper()}:"
+            assert match_section_keyword(header) == linear_section_keyword(header), k
+
+def _line(text, size=10, bold=0.0, font="Helvetica"):
+    return {"text": text, "font_size": size, "bold_ratio": bold, "font_name": font, "y": 0, "x": 0, "links": []}
+
+def _document():
+    return [
+        _line("Jane Candidate", 16, 1.0, "Helvetica-Bold"),
+        _line("jane@example.com"),
+        _line("EDUCATION", 12, 1.0, "Helvetica-Bold"),
+        _line("B.Tech, IIT Bombay"),
+        _line("SKILLS", 12, 1.0, "Helvetica-Bold"),
+        _line("Python, Go"),
+        _line("ODDITIES", 12, 1.0, "Helvetica-Bold"),
+        _line("Juggling"),
+        _line("EDUCATION", 12, 1.0, "Helvetica-Bold"),
+        _line("Class XII, 2017"),
+    ]
+
+def test_sections_group_content_without_touching_the_lines():
+    lines = _document()
+    before = copy.deepcopy(lines)
+    sections = process_lines_to_sections(lines)
+
+    assert lines == before
+    assert list(sections) == ["header_info", "education-EDUCATION", "skills-SKILLS", "misc_0"]
+    assert [l["text"] for l in sections["education-EDUCATION"]] == ["B.Tech, IIT Bombay", "Class XII, 2017"]
+    assert sections["header_info"][0] is lines[0]
+
+def test_spans_cover_every_content_line_once():
+    lines = _document()
+    spans = find_section_spans(lines)
+    assert [span.header for span in spans] == [None, 2, 4, 6, 8]
+    covered = [i for span in spans for i in range(span.start, span.end)]
+    assert covered == [i for i in range(len(lines)) if i not in (2, 4, 6, 8)]
+    assert find_section_spans([]) == [] and process_lines_to_sections([]) == {}
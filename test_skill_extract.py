@@ -0,0 +1,42 @@
+import random
+import re
+
+from line_record import Line
+from skill_data import SKILL_DB
+from skill_extract import build_skill_matcher, extract_skills, match_skills
+
+def linear_skills(text, skill_db=SKILL_DB):
+    """The per-pattern re.search loop the matcher replaces."""
+    found = set()
+    for category, skills_map in skill_db.items():
+        for skill_name, patterns in skills_map.items():
+            if any(re.search(pattern, text, re.IGNORECASE) for pattern in patterns):
+                found.add((category, skill_name))
+    return found
+
+def fuzzed_texts(count, seed=0):
+    rng = random.Random(seed)
+    vocabulary = [name.lower() for skills_map in SKILL_DB.values() for name in skills_map]
+    vocabulary += ["and", "with", "c#", "c++17", "node", "js", "react-native", "(", ")", ",", "/", "-", "2021", "é", "_"]
+    for _ in range(count):
+        yield (" " if rng.random() < 0.8 else "").join(rng.choice(vocabulary) for _ in range(rng.randint(0, 15)))
+
+def test_matches_linear_scan_on_fuzzed_text():
+    for text in fuzzed_texts(2000):
+        assert match_skills(text) == linear_skills(text), text
+
+def test_unprefixed_patterns_use_the_fallback_list():
+    skill_db = {"Other": {"Dotted": [r"\.net\b"], "Anywhere": [r"kube"], "Word": [r"\bgit\b"]}}
+    matcher = build_skill_matcher(skill_db)
+    assert len(matcher["fallback"]) == 2
+    text = "deployed .net services to kubernetes with git"
+    assert match_skills(text, matcher) == linear_skills(text, skill_db)
+
+def test_extract_skills_groups_by_category_in_table_order():
+    lines = [Line("Languages: Python, C++ and JavaScript", 10, 0, "Helvetica", 700, 50, []), "Tools: Git"]
+    skills = extract_skills(lines)
+    categories = [category for category in SKILL_DB if category in skills]
+    assert list(skills) == categories
+    assert {"Python", "C++", "JavaScript"} <= set(skills["Programming Languages"])
+    assert "Java" not in skills["Programming Languages"]
+    assert extract_skills([]) == {}
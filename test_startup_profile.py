@@ -0,0 +1,19 @@
+from startup_profile import format_startup_report, parse_importtime, profile_startup
+
+IMPORTTIME = """\
+import time: self [us] | cumulative | imported package
+import time:       120 |        120 |   _io
+import time:      2500 |       4100 |     pdfminer.psparser
+not an importtime line
+import time:       900 |       5000 |   pdfminer
+"""
+
+def test_parse_importtime_skips_the_header():
+    assert parse_importtime(IMPORTTIME) == [("_io", 120, 120), ("pdfminer.psparser", 2500, 4100),
+                                            ("pdfminer", 900, 5000)]
+
+def test_profile_startup_groups_modules_by_package():
+    report = profile_startup(["-c", "import json"])
+    assert report["returncode"] == 0 and report["modules"] > 0
+    assert "json" in [entry["package"] for entry in report["by_package"]]
+    assert format_startup_report(report).startswith("Cold start:")
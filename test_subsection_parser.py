@@ -0,0 +1,40 @@
+import random
+
+from subsection_parser import compute_line_features, extract_subsections, get_local_stats, is_subsection_header
+
+def fuzzed_section(rng, length):
+    texts = ["Software Engineer", "ACME CORP", "June 2020 - Present", "2019-2023", "• Built pipelines",
+             "- Led a team", "Summer 2021", "Research Intern at IISc", "Python, Go", "PROJECTS"]
+    lines, y = [], 700
+    for _ in range(length):
+        y -= rng.choice([12, 14, 30])
+        lines.append({"text": rng.choice(texts), "font_size": rng.choice([10, 10, 12]), "y": y,
+                      "bold_ratio": rng.choice([0.0, 0.6, 1.0]), "font_name": rng.choice(["Helvetica", "Helvetica-Bold"]),
+                      "is_header": rng.random() < 0.1})
+    return lines
+
+def test_precomputed_features_match_per_line_checks():
+    rng = random.Random(0)
+    for _ in range(300):
+        lines = fuzzed_section(rng, rng.randint(1, 25))
+        stats = get_local_stats(lines)
+        features = compute_line_features(lines)
+        for i, line in enumerate(lines):
+            prev_line = lines[i - 1] if i else None
+            assert is_subsection_header(line, prev_line, stats, lines, i, features=features[i]) == \
+                   is_subsection_header(line, prev_line, stats, lines, i)
+
+def test_dates_before_a_title_count_towards_it():
+    body = {"font_size": 10, "bold_ratio": 0.0, "font_name": "Helvetica"}
+    lines = [dict(body, text="Intro paragraph about work", y=700),
+             dict(body, text="June 2020 - Present", y=688),
+             dict(body, text="Data Engineer", y=676, bold_ratio=1.0),
+             dict(body, text="Built the ingestion service", y=664)]
+    features = compute_line_features(lines)
+    assert [f["date_before"] for f in features] == [False, False, True, True]
+    assert features[0]["gap"] is None and features[1]["gap"] == 12
+
+    subsections = extract_subsections(lines)
+    assert [s["title"] for s in subsections] == ["Intro", "Data Engineer"]
+    assert subsections[1]["score_breakdown"] == {"boldness": 2, "date_proximity": 1}
+    assert extract_subsections([]) == []
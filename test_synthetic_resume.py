@@ -0,0 +1,27 @@
+import pytest
+
+from pdf_processor import extract_lines_from_pdf
+from synthetic_resume import SECTION_TYPES, generate_resume, write_corpus
+
+def test_same_seed_same_document():
+    assert generate_resume(seed=3) == generate_resume(seed=3)
+    assert generate_resume(seed=3) != generate_resume(seed=4)
+
+def test_layout_options_shape_the_document():
+    stats = {}
+    lines = extract_lines_from_pdf(generate_resume(pages=3, columns=2, links=8, sections=4), stats=stats)
+    assert stats["pages"] == 3
+    headers = {line.text for line in lines if line.text in SECTION_TYPES}
+    assert headers == set(SECTION_TYPES[:4])
+    assert sum(len(line.links) for line in lines) >= 3
+
+@pytest.mark.parametrize("options", [{"columns": 4}, {"sections": 0}, {"font_mix": "comic"}])
+def test_rejects_unknown_layouts(options):
+    with pytest.raises(ValueError):
+        generate_resume(**options)
+
+def test_write_corpus(tmp_path):
+    paths = write_corpus(str(tmp_path), [{"name": "small", "pages": 1}], count=2, seed=7)
+    assert [p.rsplit("/", 1)[1] for p in paths] == ["small-000.pdf", "small-001.pdf"]
+    with open(paths[1], "rb") as f:
+        assert f.read() == generate_resume(pages=1, seed=8)